@@ -8,30 +8,46 @@
 
 from __future__ import annotations
 
-import glob
 import os
 import random
-from contextlib import nullcontext
+from contextlib import contextmanager, nullcontext
 
 import numpy as np
 from manim import *
 from manim_voiceover import VoiceoverScene
 
-from config import USE_PIPER, RANDOM_SEED, PALETTE, PACING, VO
-from utils import narr_time, whiteboard, note_stack, PiperService
+from config import (
+    USE_PIPER, RANDOM_SEED, PALETTE, PACING, VO, PROBLEM, PRESYNTH, TTS_WORKERS,
+    TEX_PREPASS, TEX_CACHE_DIR, STATIC_LAYER, GRAPH_MODE, GRAPH_FUNCTIONS, GRAPH_SAMPLES,
+)
+from utils import narr_time, whiteboard
+from helpers.presynth import presynthesize
+# Speech service, narration and section list live in a manim-free module so the render
+# drivers can use them without importing this scene.
+from helpers.scene_setup import (
+    SECTION_ENV, SECTIONS, SECTION_DEPENDENCIES, narration_for, shared_speech_service,
+    INTRO_TITLE, G_EQ_TOKENS, MAPPING_TOKENS, INTRO_BULLETS, STEPS_TITLE, scene_tex_items,
+)
+from helpers.tex_cache import prepare_tex_cache, save_manifest as save_tex_manifest
+from helpers.transformations import TransformationSpec, point_tex
+from helpers.phase_timer import install_phase_timer
+from helpers.timeline import install_timeline
+from helpers.frame_hash import install_frame_hash
+from helpers.narration_track import install_narration_track
+from helpers.chunked_encoder import install_chunked_encoder
+from helpers.tracing import TracingMixin, traced
+from helpers.beat_cache import BeatCacheMixin
+from helpers.highlighting import HighlightEngine
+from helpers.static_layer import install_static_layer, mark_static
+from helpers.graph_transform import GraphMorph
+from helpers.layout import frame_limits, place_caption, place_label, stack_below
+from helpers.tex_pool import POOL, BecomeTransform, pooled
+from helpers.mobject_registry import MobjectRegistry, Role, tracked_section
 
 # -----------------------------
 # Debug harness / determinism
 # -----------------------------
-DEBUG = False
-
-def _guard_label_readable(label: Mobject, min_px: int = 28):
-    assert label.height * 1080 >= min_px, (
-        f"[GUARD] Too small: {label.height * 1080:.1f}px < {min_px}px"
-    )
-
-def _guard_no_lingering_updaters(mobj: Mobject):
-    assert len(mobj.updaters) == 0, f"[GUARD] Lingering updaters: {mobj}"
+DEBUG = False  # True -> registry findings (orphans FM-7, lingering updaters FM-2) fail the render
 
 def _set_determinism():
     random.seed(RANDOM_SEED)
@@ -51,11 +67,13 @@ def _label_direction_for(point_xy: tuple[float, float]):
     return DL
 
 def pulse(mobj: Mobject, run_time: float = 0.6) -> Indicate:
+    # Named so FA_TRACE play spans show "pulse" (building the Indicate itself costs nothing).
     return Indicate(
         mobj,
         scale_factor=1.05,
         color=PALETTE.get("final", "#90BE6D"),
         run_time=run_time,
+        name="pulse",
     )
 
 # Semantic highlight colors
@@ -68,41 +86,69 @@ HIL_FUNC   = "#90BE6D"  # provenance in g(x)
 # -----------------------------
 # Scene
 # -----------------------------
-class FinalAnimation(VoiceoverScene):
+# TracingMixin: FA_TRACE=<trace.json> -> span timeline; BeatCacheMixin: reuse unchanged beats.
+class FinalAnimation(TracingMixin, BeatCacheMixin, VoiceoverScene):
+    # Section handoff state, held as roles in self.registry (helpers/mobject_registry.py).
+    graph_group = Role()
+    right_column = Role()
+    steps_panel = Role()
+    caption = Role()
+    point = Role()
+    point_label = Role()
+
     def setup(self):
+        install_narration_track(self)  # first: the phase timer then counts the mix as "encode"
+        install_chunked_encoder(self)  # no-op when ENCODER="manim" (helpers/chunked_encoder.py)
+        install_phase_timer(self)  # no-op unless FA_BENCH is set (helpers/benchmark.py)
+        install_static_layer(self, STATIC_LAYER)  # before install_timeline: dry runs skip drawing entirely
+        install_timeline(self)     # no-op unless FA_TIMELINE is set (helpers/timeline.py)
+        install_frame_hash(self)   # no-op unless FA_FRAME_HASH is set (helpers/frame_hash.py)
         _set_determinism()
+        self.registry = MobjectRegistry(self, strict=DEBUG)
+
+        self._replaying = False
+        # Problem under animation: FA_SPEC (batch renders) or config.PROBLEM.
+        self.spec = TransformationSpec.from_env() or TransformationSpec.from_dict(PROBLEM)
+        self.vo = narration_for(self.spec)
+        if TEX_PREPASS:
+            # Before the first Tex/MathTex below: batch-compile this scene's strings
+            # (plus any recorded by earlier renders) in one LaTeX run.
+            prepare_tex_cache(TEX_CACHE_DIR, scene_tex_items(self.spec))
 
         if USE_PIPER:
-            base_dir, rt = os.path.dirname(__file__), "piper_runtime"
-            piper_exe = os.path.join(base_dir, rt, "piper.exe")
-            models = sorted(glob.glob(os.path.join(base_dir, rt, "*.onnx")))
-            if not models:
-                raise FileNotFoundError("Piper voice model not found in piper_runtime.")
-            self.set_speech_service(
-                PiperService(piper_exe, models[0], tempo=PACING["voice_tempo"])
+            self.set_speech_service(shared_speech_service())
+            if PRESYNTH:
+                # Fill the cache for every VO line now; each beat below is then a lookup.
+                presynthesize(self.speech_service, self.vo.values(), max_workers=TTS_WORKERS)
+
+        # Default [-4,4]x[-4,7] plane, widened only if the spec's path would leave it.
+        x_range, y_range = self.spec.axis_ranges()
+        def build_plane():
+            axes = Axes(
+                x_range=x_range,
+                y_range=y_range,
+                x_length=6.2,
+                y_length=6.3,
+                axis_config={"color": PALETTE["axis"], "stroke_width": 2},
             )
+            grid = NumberPlane(
+                x_range=x_range,
+                y_range=y_range,
+                x_length=6.2,
+                y_length=6.3,
+                background_line_style={
+                    "stroke_color": PALETTE["grid"],
+                    "stroke_width": 1,
+                    "stroke_opacity": 0.45,
+                },
+            )
+            coords = axes.add_coordinates(font_size=24, num_decimal_places=0)
+            return VGroup(grid, axes, coords)
 
-        self.axes = Axes(
-            x_range=[-4, 4, 1],
-            y_range=[-4, 7, 1],
-            x_length=6.2,
-            y_length=6.3,
-            axis_config={"color": PALETTE["axis"], "stroke_width": 2},
-        )
-        self.grid = NumberPlane(
-            x_range=[-4, 4, 1],
-            y_range=[-4, 7, 1],
-            x_length=6.2,
-            y_length=6.3,
-            background_line_style={
-                "stroke_color": PALETTE["grid"],
-                "stroke_width": 1,
-                "stroke_opacity": 0.45,
-            },
-        )
-        coords = self.axes.add_coordinates(font_size=24, num_decimal_places=0)
-        self.graph_group = VGroup(self.grid, self.axes, coords)
-        self.graph_group.to_edge(LEFT, buff=0.5).set_z_index(1)
+        # Pooled: a warm render server (helpers/render_server.py) copies the built plane.
+        plane = POOL.cached((tuple(x_range), tuple(y_range), PALETTE["axis"], PALETTE["grid"]), build_plane)
+        self.grid, self.axes = plane[0], plane[1]
+        self.graph_group = plane.to_edge(LEFT, buff=0.5).set_z_index(1)
 
         self.caption = Mobject()
         # For sharing state between scenes
@@ -112,36 +158,66 @@ class FinalAnimation(VoiceoverScene):
         self.point = Mobject()
 
 
+    def tear_down(self):
+        if TEX_PREPASS:
+            save_tex_manifest()
+        layer = getattr(self, "_static_layer", None)
+        if layer is not None:
+            layer.release()  # GL framebuffers; the renderer may outlive this scene
+
     def construct(self):
         random.seed(RANDOM_SEED)
+        section = os.environ.get(SECTION_ENV)
+        if section:
+            self.render_section(section)
+            return
         self.whiteboard_intro()
         self.point_transformation_sequence()
         self.outro_scene()
 
+    def render_section(self, name: str):
+        """Render one section; its dependencies are replayed silently first (no frames/audio)."""
+        if name not in SECTIONS:
+            raise ValueError(f"Unknown section {name!r}; expected one of {SECTIONS}")
+        _set_determinism()
+        for dep in SECTION_DEPENDENCIES.get(name, ()):
+            with self._silent_replay(dep):
+                getattr(self, dep)()
+        self.next_section(name)
+        getattr(self, name)()
+
+    @contextmanager
+    def _silent_replay(self, name: str):
+        # Skipped section: plays jump to their end state. The clock is restored afterwards
+        # so the rendered section starts at t=0 like its partial movie.
+        start_time = self.renderer.time
+        self.next_section(f"replay:{name}", skip_animations=True)
+        self._replaying = True
+        try:
+            yield
+        finally:
+            self._replaying = False
+            self.renderer.time = start_time
+
+    @contextmanager
+    def voiceover(self, text=None, ssml=None, **kwargs):
+        # During a silent replay no audio/subcaption may be attached; narr_time(None) -> min_rt.
+        if self._replaying:
+            yield None
+            return
+        with super().voiceover(text=text, ssml=ssml, **kwargs) as tracker:
+            yield tracker
+
+    @tracked_section
     def whiteboard_intro(self):
-        title = Tex(
-            r"\textbf{Transformation Map (Function $\to$ Points)}",
-            font_size=56, color=BLACK,
-        )
+        title = Tex(INTRO_TITLE, font_size=56, color=BLACK)
 
-        g_eq = MathTex(
-            r"g(x)", "=", "a", r"f(", "k", r"(x-d)", ")", "+", "c",
-            color=BLACK
-        ).scale(1.2)
+        g_eq = MathTex(*G_EQ_TOKENS, color=BLACK).scale(1.2)
 
-        mapping = MathTex(
-            r"x'", "=", r"\frac{x}{k}", "+", "d", r",\quad",
-            r"y'", "=", r"a\,y", "+", "c",
-            color=BLACK
-        ).scale(1.1)
+        mapping = MathTex(*MAPPING_TOKENS, color=BLACK).scale(1.1)
 
         bullets = (
-            VGroup(
-                Tex(r"Inside $\Rightarrow$ horizontal, acts on $x$", color=BLACK),
-                Tex(r"Outside $\Rightarrow$ vertical, acts on $y$", color=BLACK),
-                Tex(r"$a<0 \Rightarrow$ reflect across $x$-axis", color=BLACK),
-                Tex(r"$k<0 \Rightarrow$ reflect across $y$-axis", color=BLACK),
-            )
+            VGroup(*(Tex(b, color=BLACK) for b in INTRO_BULLETS))
             .scale(0.9)
             .arrange(DOWN, aligned_edge=LEFT, buff=0.35)
         )
@@ -165,27 +241,23 @@ class FinalAnimation(VoiceoverScene):
             self.play(Write(title), run_time=0.5)
             self.play(LaggedStart(Write(g_eq), Write(mapping), lag_ratio=0.25), run_time=1.0)
             reset_parts(g_eq, mapping)
+        # Diff-aware: each beat recolors only the parts whose color changes.
+        hl = HighlightEngine(self).track(m_xp, m_x_over_k, m_d, m_yp, m_ay, m_c, g_a, g_k, g_xd, g_c)
 
         # x′ narration — highlight x′ + (x/k, d), and provenance (k, x-d)
         with self.voiceover(text=VO.get("theory_x", "")) if USE_PIPER else nullcontext() as tr_x:
-            reset_parts(m_xp, m_x_over_k, m_d, m_yp, m_ay, m_c, g_a, g_k, g_xd, g_c)
-            m_xp.set_color(HIL_VAR_X)
-            m_x_over_k.set_color(HIL_EXPR_X)
-            m_d.set_color(HIL_EXPR_X)
-            g_k.set_color(HIL_FUNC)
-            g_xd.set_color(HIL_FUNC)
-            self.play(pulse(VGroup(m_xp, m_x_over_k, m_d)), run_time=0.45 if USE_PIPER else 0.5)
+            hl.apply({m_xp: HIL_VAR_X, m_x_over_k: HIL_EXPR_X, m_d: HIL_EXPR_X, g_k: HIL_FUNC, g_xd: HIL_FUNC})
+            pulsed = VGroup(m_xp, m_x_over_k, m_d)
+            self.play(pulse(pulsed), run_time=0.45 if USE_PIPER else 0.5)
+            self.registry.drop_top_level(pulsed)
             self.wait(narr_time(tr_x) if USE_PIPER else 0.2)
 
         # y′ narration — highlight y′ + (a y, c), and provenance (a, c)
         with self.voiceover(text=VO.get("theory_y", "")) if USE_PIPER else nullcontext() as tr_y:
-            reset_parts(m_xp, m_x_over_k, m_d, g_a, g_k, g_xd, g_c)
-            m_yp.set_color(HIL_VAR_Y)
-            m_ay.set_color(HIL_EXPR_Y)
-            m_c.set_color(HIL_EXPR_Y)
-            g_a.set_color(HIL_FUNC)
-            g_c.set_color(HIL_FUNC)
-            self.play(pulse(VGroup(m_yp, m_ay, m_c)), run_time=0.45 if USE_PIPER else 0.5)
+            hl.apply({m_yp: HIL_VAR_Y, m_ay: HIL_EXPR_Y, m_c: HIL_EXPR_Y, g_a: HIL_FUNC, g_c: HIL_FUNC})
+            pulsed = VGroup(m_yp, m_ay, m_c)
+            self.play(pulse(pulsed), run_time=0.45 if USE_PIPER else 0.5)
+            self.registry.drop_top_level(pulsed)
             self.wait(narr_time(tr_y) if USE_PIPER else 0.2)
 
         with self.voiceover(text=VO.get("theory_bullets", "")) if USE_PIPER else nullcontext() as tr_bul:
@@ -195,20 +267,19 @@ class FinalAnimation(VoiceoverScene):
             )
             self.wait(0.3)
 
-        reset_parts(g_a, g_k, g_xd, g_c, m_xp, m_x_over_k, m_d, m_yp, m_ay, m_c)
+        hl.reset()
         self.play(FadeOut(bullets, scale=0.8, target_position=mapping), run_time=1.0)
         self.play(FadeOut(VGroup(title, g_eq, mapping, frame, board)), run_time=0.6)
 
+    @tracked_section
     def point_transformation_sequence(self):
         self.add(self.graph_group)
 
         # ---------- Right column tokenized ----------
-        r_g = MathTex("g(x)", "=", "-", "f(", r"-x-1", ")", "+", "3",
-                      color=PALETTE["text"])
-        r_map = MathTex(r"x'", "=", r"\frac{x}{k}", "+", "d", r",\quad",
-                        r"y'", "=", r"a\,y", "+", "c",
-                        color=PALETTE["text"])
-        r_point = MathTex(r"(1,-2)\ \text{ on }f", color=PALETTE["text"])
+        g_tokens, g_roles = self.spec.g_tokens()
+        r_g = MathTex(*g_tokens, color=PALETTE["text"])
+        r_map = MathTex(*MAPPING_TOKENS, color=PALETTE["text"])
+        r_point = MathTex(self.spec.problem_tex(), color=PALETTE["text"])
         self.right_column = VGroup(r_g, r_map, r_point).arrange(DOWN, aligned_edge=LEFT, buff=0.45)
 
         rc_x = self.graph_group.get_right()[0]
@@ -216,15 +287,14 @@ class FinalAnimation(VoiceoverScene):
                     .align_to(self.axes, UP)
         self.add(self.right_column)
 
-        g_minus, g_inside, g_plus3 = r_g[2], r_g[4], r_g[7]
-        mxp, mx_over_k, md = r_map[0], r_map[2], r_map[4]
-        myp, may, mc        = r_map[6], r_map[8], r_map[10]
+        # Tokens a step can highlight: primed variable, mapping term, provenance in g(x).
+        var_part = {"x": r_map[0], "y": r_map[6]}
+        map_part = {"x/k": r_map[2], "d": r_map[4], "ay": r_map[8], "c": r_map[10]}
+        g_part = {role: r_g[i] for role, i in g_roles.items() if i is not None}
+        var_color = {"x": HIL_VAR_X, "y": HIL_VAR_Y}
+        expr_color = {"x": HIL_EXPR_X, "y": HIL_EXPR_Y}
 
-        def r_reset(*parts):
-            if not parts:
-                parts = (r_g, r_map, r_point)
-            for p in parts:
-                p.set_color(PALETTE["text"])
+        hl = HighlightEngine(self).track(*var_part.values(), *map_part.values(), *g_part.values())
 
         # ---------- "Show steps" panel (pinned bottom-right, math terms, mirrored order) ----------
         # Using absolute coordinates to bypass v0.19.0 positioning bugs.
@@ -232,130 +302,92 @@ class FinalAnimation(VoiceoverScene):
         align_x = self.right_column.get_left()[0]
         align_y = self.right_column.get_bottom()[1] - 0.5
         steps_origin_coord = np.array([align_x, align_y, 0])
-        steps_anchor = Tex("Steps", font_size=30, color=PALETTE["text"]).set_opacity(0.75)
+        steps_anchor = pooled(Tex, STEPS_TITLE, font_size=30, color=PALETTE["text"]).set_opacity(0.75)
         steps_anchor.move_to(steps_origin_coord, aligned_edge=UP + LEFT)
         steps_items = VGroup()
         self.steps_panel = VGroup(steps_anchor, steps_items).set_z_index(5)
         self.add(self.steps_panel)
-
-        def add_step_math(latex: str):
-            """Append a compact math justification item using absolute positioning."""
-            item = MathTex(latex, font_size=28, color=PALETTE["text"])
-            # Calculate target position based on previously added items.
-            if not steps_items:
-                # First item goes below the title
-                target_point = steps_anchor.get_corner(DL) + DOWN * 0.22
-            else:
-                # Subsequent items go below the last item
-                target_point = steps_items[-1].get_corner(DL) + DOWN * 0.18
-            item.move_to(target_point, aligned_edge=UL)
-            # Animate and then add to the group
-            self.play(FadeIn(item, shift=UP * 0.1), run_time=0.35)
-            steps_items.add(item)
+        # Drawn once per layer instead of every frame while the point/label/caption move.
+        mark_static(self, self.graph_group, self.right_column, self.steps_panel)
 
         # Caption
         caption_position = [-3.5, -3.5, 0]
         self.caption = Tex("").move_to(caption_position)
         self.add(self.caption)
 
-        self.point = Dot(self.axes.c2p(1, -2), color=PALETTE["start"], radius=0.09)
+        self.point = Dot(self.axes.c2p(*self.spec.point), color=PALETTE["start"], radius=0.09)
 
         def _purge_stray_dots():
-            for m in list(self.mobjects):
-                if isinstance(m, Dot) and m is not self.point:
-                    self.remove(m)
-
-        def relabel(text: str, color=PALETTE["text"]) -> MathTex:
-            lbl = MathTex(text, color=color).scale(0.9)
-            px, py = self.axes.p2c(self.point.get_center())
-            lbl.next_to(self.point, _label_direction_for((px, py)), buff=LABEL_BUFF)
-            _guard_label_readable(lbl, 28)
-            return lbl
-
-        self.point_label = relabel(r"(1,-2)")
+            stray = [m for m in self.registry.on_scene(Dot) if m is not self.point]
+            if stray:
+                self.remove(*stray)
+
+        def label_for(text: str, xy, color=PALETTE["text"]) -> MathTex:
+            lbl = pooled(MathTex, text, color=color).scale(0.9)
+            return place_label(lbl, self.point, self.axes.c2p(*xy), _label_direction_for(xy), LABEL_BUFF)
+
+        # ---------- Layout pass ----------
+        # Every caption, Steps item and label is built, measured and placed here, once;
+        # the step loop below only plays them (no copies, no re-measurement).
+        steps = self.spec.steps()
+        captions = [place_caption(pooled(Tex, step.caption, color=PALETTE["text"]), caption_position,
+                                  self.graph_group.width - 0.5) for step in steps]
+        max_right, max_bottom = frame_limits()
+        step_items = stack_below(steps_anchor, [pooled(MathTex, step.math, font_size=28, color=PALETTE["text"])
+                                                for step in steps], max_right=max_right, max_bottom=max_bottom)
+        labels = [label_for(step.label, step.end, PALETTE["final"] if step.is_last else PALETTE["text"])
+                  for step in steps]
+
+        @traced("add_step_math")
+        def add_step_math(item: MathTex):
+            """Fade in a Steps item at its precomputed place, then add it to the panel."""
+            self.play(FadeIn(item, shift=UP * 0.1), run_time=0.35)
+            steps_items.add(item)
+            self.registry.drop_top_level(item)  # drawn through the panel from now on
+
+        self.point_label = label_for(point_tex(self.spec.point), self.spec.point)
         self.add(self.point, self.point_label)
+        # Whole-graph mode: f's curves ride along with the point (one batched update per stage).
+        graph = None
+        if GRAPH_MODE:
+            graph = GraphMorph(self.axes, self.spec, GRAPH_FUNCTIONS, GRAPH_SAMPLES,
+                               colors=[PALETTE["path"], PALETTE["start"], PALETTE["final"]])
+            self.registry.register("graph_ghosts", graph.ghosts)
+            self.registry.register("graph_curves", graph.curves)
+            self.add(graph.ghosts)
+            self.play(Create(graph.curves), run_time=1.0)
+            self.bring_to_front(self.point, self.point_label)
         self.wait(PACING["hold_pad"])
 
-        def update_caption(new_text_str: str):
-            new_caption = Tex(new_text_str, color=PALETTE["text"])
-            if new_caption.width > self.graph_group.width - 0.5:
-                new_caption.set_width(self.graph_group.width - 0.5)
-            new_caption.move_to(caption_position)
-            self.play(self.caption.animate.become(new_caption))
-
-        # --- Steps (order mirrored top→bottom) ---
-        # 1) Reflect across y-axis  → k < 0
-        with self.voiceover(text=VO["y_reflect"]) if USE_PIPER else nullcontext() as tr:
-            update_caption("Reflect across the $y$-axis")
-            r_reset()
-            mxp.set_color(HIL_VAR_X)
-            mx_over_k.set_color(HIL_EXPR_X)
-            g_inside.set_color(HIL_FUNC)
-            self.play(pulse(VGroup(mxp, mx_over_k, g_inside)), run_time=0.35 if USE_PIPER else 0.4)
-            add_step_math(r"x' = \frac{1}{-1} = -1")
-            target = self.axes.c2p(-1, -2)
-            _purge_stray_dots()
-            self.play(self.point.animate.move_to(target), run_time=narr_time(tr))
-            new_label = relabel(r"(-1,-2)")
-            self.play(self.point_label.animate.become(new_label))
-            self.wait(PACING["hold_pad"])
-
-        # 2) Translate left by 1   → d = -1
-        with self.voiceover(text=VO["left_shift"]) if USE_PIPER else nullcontext() as tr:
-            update_caption("Translate left by $1$")
-            r_reset()
-            mxp.set_color(HIL_VAR_X)
-            md.set_color(HIL_EXPR_X)
-            g_inside.set_color(HIL_FUNC)
-            self.play(pulse(VGroup(md, g_inside)), run_time=0.35 if USE_PIPER else 0.4)
-            add_step_math(r"x'' = -1 + (-1) = -2")
-            target = self.axes.c2p(-2, -2)
-            _purge_stray_dots()
-            self.play(self.point.animate.move_to(target), run_time=narr_time(tr))
-            new_label = relabel(r"(-2,-2)")
-            self.play(self.point_label.animate.become(new_label))
-            self.wait(PACING["hold_pad"])
-
-        # 3) Reflect across x-axis → a < 0
-        with self.voiceover(text=VO["x_reflect"]) if USE_PIPER else nullcontext() as tr:
-            update_caption("Reflect across the $x$-axis")
-            r_reset()
-            myp.set_color(HIL_VAR_Y)
-            may.set_color(HIL_EXPR_Y)
-            g_minus.set_color(HIL_FUNC)
-            self.play(pulse(VGroup(myp, may, g_minus)), run_time=0.35 if USE_PIPER else 0.4)
-            add_step_math(r"y' = (-1) \cdot (-2) = 2")
-            target = self.axes.c2p(-2, 2)
-            _purge_stray_dots()
-            self.play(self.point.animate.move_to(target), run_time=narr_time(tr))
-            new_label = relabel(r"(-2,2)")
-            self.play(self.point_label.animate.become(new_label))
-            self.wait(PACING["hold_pad"])
-
-        # 4) Translate up by 3     → c = 3
-        with self.voiceover(text=VO["up_shift"]) if USE_PIPER else nullcontext() as tr:
-            update_caption("Translate up by $3$")
-            r_reset()
-            myp.set_color(HIL_VAR_Y)
-            mc.set_color(HIL_EXPR_Y)
-            g_plus3.set_color(HIL_FUNC)
-            self.play(pulse(VGroup(mc, g_plus3)), run_time=0.35 if USE_PIPER else 0.4)
-            add_step_math(r"y'' = 2 + 3 = 5")
-            target = self.axes.c2p(-2, 5)
-            _purge_stray_dots()
-            self.play(self.point.animate.move_to(target), run_time=narr_time(tr))
-            new_label = relabel(r"(-2,5)", color=PALETTE["final"])
-            self.play(self.point_label.animate.become(new_label))
-            self.play(self.point.animate.set_color(PALETTE["final"]))
-            self.wait(PACING["hold_pad"])
-
-        if DEBUG:
-            _guard_no_lingering_updaters(self.point)
-            _guard_no_lingering_updaters(self.point_label)
-
+        @traced("update_caption")
+        def update_caption(new_caption: Tex):
+            self.play(BecomeTransform(self.caption, new_caption))
+
+        # --- Steps (order mirrored top→bottom), generated from the spec ---
+        # e.g. default: reflect y-axis (k<0), left 1 (d), reflect x-axis (a<0), up 3 (c)
+        for step, caption, item, new_label in zip(steps, captions, step_items, labels):
+            with self.voiceover(text=self.vo[step.key]) if USE_PIPER else nullcontext() as tr:
+                update_caption(caption)
+                var, term, source = var_part[step.axis], map_part[step.map_term], g_part[step.g_term]
+                hl.apply({var: var_color[step.axis], term: expr_color[step.axis], source: HIL_FUNC})
+                # Reflections/scales pulse the primed variable too; shifts only the term.
+                pulsed = VGroup(*((var, term, source) if step.multiplicative else (term, source)))
+                self.play(pulse(pulsed), run_time=0.35 if USE_PIPER else 0.4)
+                self.registry.drop_top_level(pulsed)  # members stay in the right column
+                add_step_math(item)
+                target = self.axes.c2p(*step.end)
+                _purge_stray_dots()
+                stage = (graph.stage(step),) if graph is not None else ()
+                self.play(self.point.animate.move_to(target), *stage, run_time=narr_time(tr))
+                self.play(BecomeTransform(self.point_label, new_label))
+                if step.is_last:
+                    self.play(self.point.animate.set_color(PALETTE["final"]))
+                self.wait(PACING["hold_pad"])
+
+    @tracked_section
     def outro_scene(self):
         self.wait(0.5)
-        with self.voiceover(text=VO["wrap"]) if USE_PIPER else nullcontext() as tr:
+        with self.voiceover(text=self.vo["wrap"]) if USE_PIPER else nullcontext() as tr:
             run_time = narr_time(tr, min_rt=1.5) if USE_PIPER else 1.5
             summary_box = SurroundingRectangle(
                 VGroup(self.right_column, self.steps_panel),
@@ -371,5 +403,5 @@ class FinalAnimation(VoiceoverScene):
             )
         
         self.wait(2.0)
-        self.play(FadeOut(*self.mobjects), run_time=1.0)
+        self.play(FadeOut(*self.registry.on_scene()), run_time=1.0)
         self.wait(1.0)
\ No newline at end of file
@@ -1,16 +1,66 @@
 # config.py
 # [CHECKPOINT-1..5 Active; Mirrors CHECKPOINTS.md]
 # Project-wide constants (Manim CE v0.19.0)
+# WHY: plain values only, no manim import: the render drivers and tools read this module
+# in their parent process (helpers/startup_bench.py tracks the cost).
 
 from __future__ import annotations
-from manim import *
+import os
 
 # =============================
 # Global Settings
 # =============================
-USE_PIPER = True
+USE_PIPER = os.environ.get("FA_USE_PIPER", "1") != "0"   # FA_USE_PIPER=0 -> silent run (benchmarks)
 RANDOM_SEED = 7
 
+# ---- TTS pre-synthesis (helpers/presynth.py) ----
+# WHY: one parallel batch before construct() instead of a Piper round-trip per beat (FM-3).
+PRESYNTH = True
+TTS_WORKERS = None                  # process-pool size; None -> os.cpu_count()
+PIPER_WORKERS = 4                   # resident Piper processes (model loaded once); 0 -> one-shot per line
+PIPER_STREAM = True                 # one-shot path pipes Piper raw PCM -> ffmpeg (no WAV on disk)
+TTS_CACHE_MAX_MB = 512              # LRU size cap for media/voiceovers (helpers/audio_cache.py); None -> unbounded
+
+# ---- Speech backend ----
+# WHY: draft/CI renders keep narrated pacing without Piper (helpers/estimated_speech.py).
+SPEECH_BACKEND = os.environ.get("FA_SPEECH", "piper")   # "piper" | "estimate"
+ESTIMATE_WPM = None                 # None -> fitted from the Piper cache manifest (else 160)
+ESTIMATE_TONE_HZ = 0                # 0 -> silent clips; e.g. 220 for an audible placeholder
+
+# ---- TeX pre-pass (helpers/tex_cache.py) ----
+# WHY: one batched LaTeX job for all recorded Tex/MathTex strings instead of one compile each.
+TEX_PREPASS = True
+TEX_CACHE_DIR = None                # shared SVG cache (e.g. "~/.cache/fa_tex"); None -> media/Tex
+TEX_POOL_SIZE = 256                 # parsed Tex/MathTex prototypes kept in memory (helpers/tex_pool.py); 0 -> off
+
+# ---- Beat cache (helpers/beat_cache.py) ----
+# WHY: manim's per-play cache stays off (disable_caching); unchanged voiceover beats are reused instead.
+BEAT_CACHE = os.environ.get("FA_BEAT_CACHE", "1") != "0"   # FA_BEAT_CACHE=0 -> render every beat
+BEAT_CACHE_DIR = None               # None -> media/beat_cache
+
+# ---- Static layer (helpers/static_layer.py) ----
+# WHY: the plane/axes/right column are drawn once per layer, not once per frame (FM-3 speed).
+STATIC_LAYER = os.environ.get("FA_STATIC_LAYER", "marked")  # "marked" | "auto" | "off"
+
+# ---- Narration track (helpers/narration_track.py) ----
+# WHY: one NumPy-mixed track encoded once and stream-copied onto the video, not a pydub overlay per clip.
+NARRATION_PREMIX = os.environ.get("FA_NARRATION_PREMIX", "1") != "0"   # 0 -> manim mixes the clips
+NARRATION_RATE = 48000              # Hz, mono
+
+# ---- Frame encoding (helpers/chunked_encoder.py) ----
+# WHY: drawing never waits on the encoder; GOP-aligned chunks encode on every core and join by stream copy.
+ENCODER = os.environ.get("FA_ENCODER", "chunked")   # "chunked" | "manim" (in-process PyAV)
+ENCODER_JOBS = None                 # parallel ffmpeg processes; None -> min(4, cpu count)
+ENCODER_CHUNK_FRAMES = 240          # max frames per chunk (rounded down to a GOP multiple)
+ENCODER_GOP = 60                    # keyframe interval
+ENCODER_BUFFER_MB = 256             # raw-frame ring buffer; the drawing thread waits when it is full
+
+# ---- Whole-graph mode (helpers/graph_transform.py) ----
+# WHY: carry the full graph of f to g with the point; each stage is one NumPy op per curve.
+GRAPH_MODE = os.environ.get("FA_GRAPH_MODE", "0") == "1"   # FA_GRAPH_MODE=1 -> curves too
+GRAPH_FUNCTIONS = {"f": "0.25*x**2 - 2.25"}   # name -> NumPy expression in x (default f(1) = -2)
+GRAPH_SAMPLES = 12000                         # samples per curve
+
 # ---- Layout anchors (scene coordinates) ----
 # WHY: Hard coordinates prevent drift (FM-3, FM-8) vs to_edge()/to_corner() dynamics.
 ANCHOR_STEPS = (5.3, -3.0, 0)       # bottom-right area for StepsPanel
@@ -45,7 +95,7 @@ PALETTE = {
     "final": "#a9dc76",
     "axis": "#E6E6E6",
     "grid": "#6d7a86",
-    "text": WHITE,
+    "text": "#FFFFFF",              # manim WHITE
 }
 
 # =============================
@@ -57,9 +107,18 @@ PACING = {
     "hold_pad": 0.50,
 }
 
+# =============================
+# Problem (helpers/transformations.py)
+# =============================
+# g(x) = a·f(k(x − d)) + c applied to `point`. Steps, LaTeX and the step/wrap narration are
+# generated from this; helpers/batch_render.py overrides it per clip via FA_SPEC.
+PROBLEM = {"a": -1, "k": -1, "d": -1, "c": 3, "point": (1, -2)}
+
 # =============================
 # Voiceover Content (VO)
 # =============================
+# Problem-specific lines (announce_problem … wrap) are regenerated from PROBLEM at render
+# time; the text below is what the default PROBLEM produces.
 VO = {
     "theory_intro": "Here is the transformation map from functions to points...",
     "theory_x":     "First, x prime equals x over k plus d. This comes from the horizontal parameters...",
@@ -0,0 +1,212 @@
+# [CHECKPOINT-1..5 Active; Mirrors CHECKPOINTS.md]
+# WHY: Content-addressed TTS cache. Keys cover text + model file hash + speaker + tempo,
+# so hits are exact and never spawn Piper/ffmpeg; a size cap with LRU eviction keeps
+# media/voiceovers bounded on shared render hosts.
+# Manifest (tts_manifest.json): {"version", "models": {path: {size, mtime, sha256}},
+#                                "entries": {key: {file, text, duration, sample_rate, bytes, created, last_used,
+#                                                  voice, tempo}}}
+from __future__ import annotations
+
+import atexit
+import contextlib
+import hashlib
+import json
+import os
+import time
+from typing import Dict, Iterable, List, Optional
+
+MANIFEST_NAME = "tts_manifest.json"
+LOCK_NAME = "tts_manifest.lock"
+MANIFEST_VERSION = 1
+
+
+def file_sha256(path: str, chunk: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+class AudioCache:
+    """
+    Manifest-backed audio cache in `cache_dir`.
+    - key(): content address for one narration line
+    - lookup(): returns the entry on a hit (file present); its LRU stamp is batched in memory
+      and written with the next store()/evict()/flush() (and at exit), not once per hit
+    - store(): records a freshly encoded file, then evicts down to max_bytes
+    Manifest updates take a lock file so presynth workers and parallel renders can share it.
+    """
+    def __init__(self, cache_dir: str, max_bytes: Optional[int] = None, lock_timeout: float = 30.0):
+        self.cache_dir = str(cache_dir)
+        self.max_bytes = max_bytes
+        self.lock_timeout = lock_timeout
+        self.manifest_path = os.path.join(self.cache_dir, MANIFEST_NAME)
+        self._model_digests: Dict[tuple, str] = {}
+        self._touched: Dict[str, float] = {}  # key -> last hit, not yet in the manifest
+        self._flush_at_exit = False
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    # ---- manifest I/O ----
+    @contextlib.contextmanager
+    def _locked(self):
+        lock_path = os.path.join(self.cache_dir, LOCK_NAME)
+        deadline = time.monotonic() + self.lock_timeout
+        while True:
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                if time.monotonic() > deadline:
+                    # Stale lock from a killed run; the manifest itself is always replaced atomically.
+                    with contextlib.suppress(FileNotFoundError):
+                        os.remove(lock_path)
+                    deadline = time.monotonic() + self.lock_timeout
+                time.sleep(0.02)
+        try:
+            yield
+        finally:
+            os.close(fd)
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(lock_path)
+
+    def load(self) -> dict:
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == MANIFEST_VERSION:
+                return data
+        except (FileNotFoundError, ValueError):
+            pass
+        return {"version": MANIFEST_VERSION, "models": {}, "entries": {}}
+
+    def _save(self, data: dict):
+        tmp = self.manifest_path + f".{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.manifest_path)
+
+    # ---- keys ----
+    def model_digest(self, model_path: str) -> str:
+        """sha256 of the voice model, memoized per (path, size, mtime) in-process and in the manifest."""
+        st = os.stat(model_path)
+        sig = (os.path.abspath(model_path), st.st_size, int(st.st_mtime))
+        if sig in self._model_digests:
+            return self._model_digests[sig]
+        known = self.load()["models"].get(sig[0])
+        if known and (known["size"], known["mtime"]) == sig[1:]:
+            digest = known["sha256"]
+        else:
+            digest = file_sha256(model_path)
+            with self._locked():
+                data = self.load()
+                data["models"][sig[0]] = {"size": sig[1], "mtime": sig[2], "sha256": digest}
+                self._save(data)
+        self._model_digests[sig] = digest
+        return digest
+
+    def key(self, text: str, model_path: str, speaker: int | None, tempo: float) -> str:
+        payload = json.dumps({
+            "text": text, "model": self.model_digest(model_path),
+            "speaker": speaker, "tempo": round(float(tempo), 4),
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    # ---- entries ----
+    def path_for(self, entry: dict) -> str:
+        return os.path.join(self.cache_dir, entry["file"])
+
+    def peek(self, key: str) -> Optional[dict]:
+        """Entry for `key` if its file exists; does not touch the LRU stamp."""
+        entry = self.load()["entries"].get(key)
+        if entry and os.path.exists(self.path_for(entry)):
+            return entry
+        return None
+
+    def lookup(self, key: str) -> Optional[dict]:
+        # Read without the lock: _save() replaces the manifest atomically.
+        entry = self.load()["entries"].get(key)
+        if entry is None:
+            return None
+        if not os.path.exists(self.path_for(entry)):
+            with self._locked():
+                data = self.load()
+                if data["entries"].pop(key, None) is not None:
+                    self._save(data)
+            return None
+        entry["last_used"] = self._touched[key] = time.time()
+        if not self._flush_at_exit:
+            atexit.register(self.flush)
+            self._flush_at_exit = True
+        return entry
+
+    def _apply_touches(self, data: dict) -> bool:
+        """Merge the batched hit stamps into `data` (call under the lock); True if any changed."""
+        touched, self._touched = self._touched, {}
+        changed = False
+        for key, stamp in touched.items():
+            entry = data["entries"].get(key)
+            if entry is not None and entry.get("last_used", 0) < stamp:
+                entry["last_used"] = stamp
+                changed = True
+        return changed
+
+    def flush(self):
+        """Write the batched LRU stamps: one manifest rewrite for every hit since the last write."""
+        if not self._touched:
+            return
+        with self._locked():
+            data = self.load()
+            if self._apply_touches(data):
+                self._save(data)
+
+    def store(self, key: str, filename: str, text: str, duration: float, sample_rate: int,
+              voice: Optional[str] = None, tempo: Optional[float] = None) -> dict:
+        now = time.time()
+        entry = {
+            "file": filename, "text": text,
+            "duration": round(float(duration), 4), "sample_rate": int(sample_rate),
+            "bytes": os.path.getsize(os.path.join(self.cache_dir, filename)),
+            "created": now, "last_used": now,
+        }
+        if voice is not None:  # helpers/estimated_speech.py calibrates per voice/tempo
+            entry["voice"], entry["tempo"] = voice, round(float(tempo or 1.0), 4)
+        with self._locked():
+            data = self.load()
+            self._apply_touches(data)  # eviction below must see this process's hits
+            data["entries"][key] = entry
+            self._evict(data, keep=(key,))
+            self._save(data)
+        return entry
+
+    def total_bytes(self, entries: Optional[dict] = None) -> int:
+        entries = self.load()["entries"] if entries is None else entries
+        return sum(e.get("bytes", 0) for e in entries.values())
+
+    def _evict(self, data: dict, keep: Iterable[str] = ()) -> List[str]:
+        """Drop least-recently-used entries (and their files) until under max_bytes."""
+        if not self.max_bytes:
+            return []
+        entries, keep = data["entries"], set(keep)
+        total = self.total_bytes(entries)
+        removed = []
+        for key in sorted(entries, key=lambda k: entries[k].get("last_used", 0)):
+            if total <= self.max_bytes:
+                break
+            if key in keep:
+                continue
+            entry = entries.pop(key)
+            total -= entry.get("bytes", 0)
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self.path_for(entry))
+            removed.append(key)
+        return removed
+
+    def evict(self) -> List[str]:
+        with self._locked():
+            data = self.load()
+            touched = self._apply_touches(data)
+            removed = self._evict(data)
+            if removed or touched:
+                self._save(data)
+        return removed
@@ -0,0 +1,103 @@
+# [CHECKPOINT-1..5 Active; Mirrors CHECKPOINTS.md]
+# WHY: A problem bank is a list of TransformationSpecs; each renders FinalAnimation in its
+# own manim process (spec passed via FA_SPEC). TTS and TeX for the WHOLE bank are warmed
+# once up front, so workers only hit the shared caches.
+# Spec file: JSON list (or JSON lines) of {"a","k","d","c","point":[x,y],"name"?}.
+# Usage (repo root):  python -m helpers.batch_render problems.json [-j 4] [-- -qh]
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from helpers.ffmpeg_tools import BASE_DIR
+from helpers.manim_cli import render_scene
+from helpers.transformations import SPEC_ENV, TransformationSpec
+
+SCENE_FILE = "FinalAnimation.py"
+SCENE_NAME = "FinalAnimation"
+
+
+def load_specs(path: str) -> List[TransformationSpec]:
+    with open(path, "r", encoding="utf-8") as f:
+        raw = f.read().strip()
+    if raw.startswith("["):
+        data = json.loads(raw)
+    else:
+        data = [json.loads(line) for line in raw.splitlines() if line.strip()]
+    specs = [TransformationSpec.from_dict(d) for d in data]
+    slugs = [s.slug for s in specs]
+    dupes = sorted({s for s in slugs if slugs.count(s) > 1})
+    if dupes:
+        raise ValueError(f"Duplicate spec names/slugs in {path}: {', '.join(dupes)}")
+    return specs
+
+
+def warm_caches(specs: Sequence[TransformationSpec]):
+    """One TTS batch and one TeX batch for every spec, before any worker starts."""
+    from config import USE_PIPER, PRESYNTH, TTS_WORKERS, TEX_PREPASS, TEX_CACHE_DIR
+    if USE_PIPER and PRESYNTH:
+        from helpers.scene_setup import build_speech_service, narration_for
+        from helpers.presynth import presynthesize
+        texts = {t for spec in specs for t in narration_for(spec).values()}
+        presynthesize(build_speech_service(), texts, max_workers=TTS_WORKERS)
+    if TEX_PREPASS:
+        from helpers.scene_setup import scene_tex_items
+        from helpers.tex_cache import prepare_tex_cache
+        prepare_tex_cache(TEX_CACHE_DIR, [item for spec in specs for item in scene_tex_items(spec)])
+
+
+def batch_render(
+    specs: Sequence[TransformationSpec],
+    extra_args: Iterable[str] = (),
+    max_workers: Optional[int] = None,
+    media_dir: str = "media",
+) -> Dict[str, str]:
+    """Render every spec; returns {slug: movie path}. Failures are logged and reported, not fatal."""
+    extra_args = list(extra_args)
+    warm_caches(specs)
+
+    log_dir = os.path.join(BASE_DIR, media_dir, "logs", "batch")
+    os.makedirs(log_dir, exist_ok=True)
+    workers = max_workers or max(1, (os.cpu_count() or 2) // 2)
+    t0 = time.perf_counter()
+    done, failed = {}, {}
+    # Threads only wait on subprocesses; every spec is its own manim process.
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            spec.slug: pool.submit(
+                render_scene, SCENE_FILE, SCENE_NAME, f"{SCENE_NAME}_{spec.slug}",
+                env={SPEC_ENV: spec.to_json()}, extra_args=extra_args, media_dir=media_dir,
+                log_path=os.path.join(log_dir, f"{spec.slug}.log"),
+            )
+            for spec in specs
+        }
+        for slug, future in futures.items():
+            try:
+                done[slug] = future.result()
+            except (RuntimeError, FileNotFoundError) as exc:
+                failed[slug] = str(exc)
+                print(f"[batch] {slug}: {exc}")
+    print(f"Rendered {len(done)}/{len(specs)} spec(s) with {workers} worker(s) "
+          f"in {time.perf_counter() - t0:.1f}s" + (f"; {len(failed)} failed" if failed else ""))
+    return done
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Render FinalAnimation for every spec in a problem bank.")
+    ap.add_argument("specs", help="JSON list / JSON lines of {a, k, d, c, point, name?}")
+    ap.add_argument("-j", "--jobs", type=int, default=None, help="parallel manim processes (default: cpu_count // 2)")
+    ap.add_argument("--media_dir", default="media")
+    ap.add_argument("manim_args", nargs=argparse.REMAINDER, help="extra args after -- go to manim render")
+    args = ap.parse_args(argv)
+    extra = [a for a in args.manim_args if a != "--"]
+    specs = load_specs(args.specs)
+    done = batch_render(specs, extra, args.jobs, args.media_dir)
+    raise SystemExit(0 if len(done) == len(specs) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+# [CHECKPOINT-1..5 Active; Mirrors CHECKPOINTS.md]
+# WHY: manim.cfg disables manim's per-play cache (its hashes missed our state changes), so
+# every edit re-rendered everything. This caches whole beats (= voiceover blocks) instead,
+# keyed on everything that can change their pixels:
+#   VO text, audio bytes, the beat's `with` block source, the rest of the scene module
+#   (beats blanked out) + CODE_DEPENDENCIES, pixel-relevant config.py constants, render
+#   settings, RNG state and a hash of the scene state (mobjects + camera) at beat start.
+# Hit: the block still runs with plays skipped (state advances, no frames) and the stored
+# beat movie is spliced into the partial-movie list at combine time (the live list must stay
+# indexed by num_plays: partial_movie_files[num_plays] is the file of the current play). Miss: rendered normally, then the
+# beat's partial movies are stream-copied into the cache. Audio is added as usual.
+# Manim CE v0.19.0-compatible (Cairo + OpenGL renderers).
+from __future__ import annotations
+
+import ast
+import functools
+import hashlib
+import importlib
+import json
+import os
+import random
+import sys
+from contextlib import contextmanager
+from typing import Optional
+
+import numpy as np
+from manim import config, logger
+
+from helpers.ffmpeg_tools import BASE_DIR, concat_copy
+
+# Project modules whose code changes pixels inside beats (the scene module is hashed separately).
+CODE_DEPENDENCIES = ("utils", "helpers.highlighting", "helpers.transformations", "helpers.graph_transform",
+                     "helpers.layout", "helpers.tex_pool", "helpers.mobject_registry",
+                     "helpers.scene_setup")
+_CONFIG_NAMES = {"PALETTE", "PACING", "RANDOM_SEED", "SEED", "FPS", "RESOLUTION", "LINE_SPACING", "PROBLEM"}
+_CONFIG_PREFIXES = ("ANCHOR_", "FONT_", "HIGHLIGHT_", "PANEL_", "GRAPH_")
+_RENDER_KEYS = ("renderer", "pixel_width", "pixel_height", "frame_rate", "background_color",
+                "background_opacity", "movie_file_extension")
+# Per-mobject data that reaches the frame (Cairo and OpenGL attribute names).
+_MOBJECT_ATTRS = ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "stroke_width",
+                  "background_stroke_width", "fill_rgba", "stroke_rgba", "rgbas", "opacity",
+                  "z_index", "pixel_array")
+KEY_VERSION = 1
+
+_project_config = importlib.import_module("config")  # project config.py (not manim's config)
+
+
+def _sha(payload) -> str:
+    if not isinstance(payload, bytes):
+        payload = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _file_sha(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _is_voiceover_with(node) -> bool:
+    """`with self.voiceover(...)` beats; `super().voiceover(...)` inside overrides is plumbing."""
+    if not isinstance(node, ast.With):
+        return False
+    return any(isinstance(n, ast.Attribute) and n.attr == "voiceover"
+               and not (isinstance(n.value, ast.Call) and getattr(n.value.func, "id", None) == "super")
+               for item in node.items for n in ast.walk(item.context_expr))
+
+
+@functools.lru_cache(maxsize=None)
+def _module_beats(filename: str):
+    """(sha of module with every voiceover block blanked, [(first, header_end, last, block sha)])."""
+    with open(filename, "r", encoding="utf-8") as f:
+        source = f.read()
+    lines = source.splitlines()
+    beats = []
+    for node in ast.walk(ast.parse(source)):
+        if _is_voiceover_with(node):
+            block = "\n".join(lines[node.lineno - 1:node.end_lineno])
+            beats.append((node.lineno, node.body[0].lineno - 1, node.end_lineno, _sha(block.encode("utf-8"))))
+    for first, _, last, _ in beats:
+        lines[first - 1:last] = [""] * (last - first + 1)
+    return _sha("\n".join(lines).encode("utf-8")), beats
+
+
+def _caller_frame():
+    """First frame outside contextlib and the voiceover() overrides: the `with` site."""
+    frame = sys._getframe(1)
+    contextlib_file = sys.modules["contextlib"].__file__
+    while frame is not None and (frame.f_code.co_filename == contextlib_file or frame.f_code.co_name == "voiceover"):
+        frame = frame.f_back
+    return frame
+
+
+def beat_code_sha(frame) -> Optional[str]:
+    """Source hash of the voiceover block being entered at `frame`; None if it can't be located."""
+    filename = frame.f_code.co_filename
+    if not os.path.exists(filename):
+        return None
+    _, beats = _module_beats(filename)
+    line = frame.f_lineno
+    for first, header_end, _, block_sha in beats:
+        if first <= line <= max(first, header_end):
+            return block_sha
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _support_sha(scene_file: str) -> str:
+    blanked, _ = _module_beats(scene_file)
+    deps = {}
+    for name in CODE_DEPENDENCIES:
+        module = importlib.import_module(name)
+        deps[name] = _file_sha(module.__file__)
+    return _sha({"scene": blanked, "deps": deps})
+
+
+def clear_code_caches():
+    """Forget the per-process source hashes (a long-lived process whose sources changed)."""
+    for cached in (_file_sha, _module_beats, _support_sha):
+        cached.cache_clear()
+
+
+def _config_sha(scene) -> str:
+    project = _project_config
+    values = {name: getattr(project, name) for name in dir(project)
+              if name in _CONFIG_NAMES or name.startswith(_CONFIG_PREFIXES)}
+    values["render"] = {k: config[k] for k in _RENDER_KEYS}
+    values["tex_template"] = config.tex_template.body
+    spec = getattr(scene, "spec", None)
+    values["spec"] = spec.to_json() if spec is not None else None
+    return _sha(values)
+
+
+def hash_mobject(mob, h, family: bool = True):
+    """Feed `mob`'s geometry/style (and its family's) into hashlib object `h`."""
+    for m in (mob.get_family() if family else (mob,)):
+        h.update(type(m).__name__.encode())
+        points = getattr(m, "points", None)
+        if points is not None:
+            h.update(np.round(np.asarray(points, dtype=float), 6).tobytes())
+        for attr in _MOBJECT_ATTRS:
+            value = getattr(m, attr, None)
+            if value is None or callable(value):
+                continue
+            arr = np.asarray(value)
+            h.update(repr(value).encode() if arr.dtype == object else np.ascontiguousarray(arr).tobytes())
+
+
+def state_hash(scene) -> str:
+    """Scene state at a beat boundary: every mobject's geometry/style, camera, RNG state."""
+    h = hashlib.sha256()
+    for mob in scene.mobjects:
+        hash_mobject(mob, h)
+    camera = scene.renderer.camera
+    for attr in ("frame_center", "frame_width", "frame_height"):
+        if hasattr(camera, attr):
+            h.update(np.asarray(getattr(camera, attr), dtype=float).tobytes())
+    if hasattr(camera, "get_family"):  # OpenGL camera is itself a mobject
+        hash_mobject(camera, h)
+    h.update(repr(random.getstate()).encode())
+    h.update(np.random.get_state()[1].tobytes())
+    return h.hexdigest()
+
+
+class BeatCache:
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = os.path.expanduser(cache_dir) if cache_dir else os.path.join(BASE_DIR, "media", "beat_cache")
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + config["movie_file_extension"])
+
+    def key(self, scene, text: str, audio_path: str, code_sha: str, scene_file: str) -> str:
+        return _sha({
+            "v": KEY_VERSION,
+            "text": " ".join(text.split()),
+            "audio": _file_sha(os.path.abspath(audio_path)),
+            "code": code_sha,
+            "support": _support_sha(scene_file),
+            "config": _config_sha(scene),
+            "state": state_hash(scene),
+        })
+
+    def frames_path(self, key: str) -> str:
+        """Frame hashes of the stored beat (helpers/frame_hash.py), kept beside its movie."""
+        return os.path.join(self.cache_dir, key + ".frames.json")
+
+    def load_frames(self, key: str) -> Optional[list]:
+        try:
+            with open(self.frames_path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def store(self, key: str, partials, frames: Optional[list] = None) -> Optional[str]:
+        try:
+            path = concat_copy(partials, self.path(key))
+        except (RuntimeError, OSError, FileNotFoundError) as exc:  # no ffmpeg / failed copy: cache is optional
+            logger.warning(f"Beat cache: could not store {key[:12]} ({exc})")
+            return None
+        if frames is not None:
+            tmp = self.frames_path(key) + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(frames, f, separators=(",", ":"))
+            os.replace(tmp, self.frames_path(key))
+        return path
+
+
+class BeatCacheMixin:
+    """Scene mixin: reuse unchanged voiceover beats. Place before VoiceoverScene in the bases."""
+
+    BEAT_CACHE = getattr(_project_config, "BEAT_CACHE", True)
+    BEAT_CACHE_DIR: Optional[str] = getattr(_project_config, "BEAT_CACHE_DIR", None)
+    _beat_cache: Optional[BeatCache] = None
+    _beat_hits: Optional[list] = None  # (section, list index, section index, cached path, slots)
+
+    def _beat_cache_active(self) -> bool:
+        renderer = self.renderer
+        return (self.BEAT_CACHE and config.write_to_movie and not config.dry_run
+                and not renderer._original_skipping_status and not renderer.skip_animations)
+
+    @contextmanager
+    def voiceover(self, text=None, ssml=None, **kwargs):
+        if text is None or not self._beat_cache_active():
+            with super().voiceover(text=text, ssml=ssml, **kwargs) as tracker:
+                yield tracker
+            return
+        frame = _caller_frame()
+        code_sha = beat_code_sha(frame)
+        beat = None
+        with super().voiceover(text=text, ssml=ssml, **kwargs) as tracker:
+            if code_sha is not None:
+                beat = self._begin_beat(text, tracker, code_sha, frame.f_code.co_filename)
+            try:
+                yield tracker
+            except BaseException:
+                if beat is not None:
+                    self._end_beat(beat, store=False)
+                    beat = None
+                raise
+        if beat is not None:  # after the trailing voiceover wait: it belongs to the beat
+            self._end_beat(beat, store=True)
+
+    def _begin_beat(self, text, tracker, code_sha, scene_file) -> dict:
+        if self._beat_cache is None:
+            self._beat_cache = BeatCache(self.BEAT_CACHE_DIR)
+        audio = os.path.join(self.speech_service.cache_dir, tracker.data["final_audio"])
+        key = self._beat_cache.key(self, text, audio, code_sha, scene_file)
+        writer = self.renderer.file_writer
+        beat = {"key": key, "section": writer.sections[-1], "start": len(writer.partial_movie_files),
+                "section_start": len(writer.sections[-1].partial_movie_files)}
+        cached = self._beat_cache.path(key)
+        beat["hit"] = os.path.exists(cached)
+        hashes = getattr(self, "_frame_hashes", None)  # FA_FRAME_HASH: a hit must bring its frame hashes
+        if beat["hit"] and hashes is not None:
+            frames = self._beat_cache.load_frames(key)
+            beat["hit"] = frames is not None
+            if frames is not None:
+                hashes.replay(frames)
+        if beat["hit"]:
+            logger.info(f"Beat cache hit {key[:12]}")
+            beat["cached"] = cached
+            beat["restore"] = self._enter_skip_mode()
+        return beat
+
+    def _end_beat(self, beat: dict, store: bool):
+        writer = self.renderer.file_writer
+        if beat["hit"]:
+            self._leave_skip_mode(beat["restore"])
+            if self._beat_hits is None:
+                self._beat_hits = []
+                combine = writer.combine_to_movie
+
+                def combine_with_hits():
+                    self._splice_beat_hits()
+                    return combine()
+                writer.combine_to_movie = combine_with_hits
+            slots = len(writer.partial_movie_files) - beat["start"]  # None entries of the skipped plays
+            self._beat_hits.append((beat["section"], beat["start"], beat["section_start"], beat["cached"], slots))
+            return
+        partials = writer.partial_movie_files[beat["start"]:]
+        if store and partials and None not in partials and writer.sections[-1] is beat["section"]:
+            hashes = getattr(self, "_frame_hashes", None)
+            frames = hashes.last["frames"] if hashes is not None and hashes.last is not None else None
+            store = functools.partial(self._beat_cache.store, beat["key"], list(partials), frames)
+            encoder = getattr(self, "_chunk_encoder", None)
+            if encoder is not None:
+                encoder.defer(store)  # partials are still encoding (helpers/chunked_encoder.py)
+            else:
+                store()
+
+    def _splice_beat_hits(self):
+        """Put each hit's cached movie in place of its skipped plays (last first: indices stay valid)."""
+        writer = self.renderer.file_writer
+        for section, start, section_start, cached, slots in reversed(self._beat_hits or []):
+            for files, index in ((writer.partial_movie_files, start), (section.partial_movie_files, section_start)):
+                if slots:
+                    files[index] = cached
+                else:  # a beat without plays
+                    files.insert(index, cached)
+        self._beat_hits = []
+
+    def _enter_skip_mode(self) -> dict:
+        renderer = self.renderer
+        saved = {"skip": renderer._original_skipping_status, "attrs": {}}
+        renderer._original_skipping_status = True
+        renderer.skip_animations = True
+        for name in ("update_frame", "save_static_frame_data"):  # no rasterization for skipped plays
+            if hasattr(renderer, name):
+                saved["attrs"][name] = renderer.__dict__.get(name)
+                setattr(renderer, name, lambda *args, **kwargs: None)
+        return saved
+
+    def _leave_skip_mode(self, saved: dict):
+        renderer = self.renderer
+        renderer._original_skipping_status = saved["skip"]
+        renderer.skip_animations = saved["skip"]
+        for name, previous in saved["attrs"].items():
+            if previous is None:
+                delattr(renderer, name)
+            else:
+                setattr(renderer, name, previous)
@@ -0,0 +1,160 @@
+# [CHECKPOINT-1..5 Active; Mirrors CHECKPOINTS.md]
+# WHY: Catch FM-3-style slowdowns before they ship. Renders FinalAnimation and each section
+# in fixed configurations, one manim process per run with helpers/phase_timer.py enabled,
+# writes per-phase wall time / frames / peak RSS to JSON and compares with a baseline.
+# Usage (repo root):
+#   python -m helpers.benchmark                      # full matrix, compare with baseline
+#   python -m helpers.benchmark --update-baseline    # record this machine's baseline
+#   python -m helpers.benchmark --targets full --configs low-silent --tolerance 0.25
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+from typing import Dict, List, Optional, Sequence
+
+from helpers.ffmpeg_tools import BASE_DIR
+from helpers.manim_cli import render_scene
+from helpers.phase_timer import BENCH_ENV, PHASES
+from helpers.scene_setup import SECTION_ENV
+
+SCENE_FILE = "FinalAnimation.py"
+SCENE_NAME = "FinalAnimation"
+BENCH_DIR = os.path.join(BASE_DIR, "media", "bench")
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+
+# Fixed configurations: (manim args, narrated?)
+CONFIGS = {
+    "low-piper":      (["-ql"], True),
+    "low-silent":     (["-ql"], False),
+    "1080p30-piper":  (["-r", "1920,1080", "--fps", "30"], True),
+    "1080p30-silent": (["-r", "1920,1080", "--fps", "30"], False),
+}
+TARGETS = ("full", "whiteboard_intro", "point_transformation_sequence", "outro_scene")
+
+# Noise floors: a metric only regresses if it is over tolerance AND over its floor.
+MIN_DELTA = {"seconds": 0.10, "peak_rss_mb": 16.0}
+
+
+def run_once(target: str, config_name: str) -> dict:
+    manim_args, narrated = CONFIGS[config_name]
+    fd, out_path = tempfile.mkstemp(suffix=".json", prefix="bench_")
+    os.close(fd)
+    # Beat cache off: every run must actually render its frames.
+    env = {BENCH_ENV: out_path, "FA_USE_PIPER": "1" if narrated else "0", "FA_BEAT_CACHE": "0"}
+    if target != "full":
+        env[SECTION_ENV] = target
+    os.makedirs(BENCH_DIR, exist_ok=True)
+    t0 = time.perf_counter()
+    try:
+        render_scene(SCENE_FILE, SCENE_NAME, f"bench_{target}_{config_name}", env=env,
+                     extra_args=["--disable_caching", *manim_args],
+                     log_path=os.path.join(BENCH_DIR, f"{target}_{config_name}.log"))
+        wall = time.perf_counter() - t0
+        with open(out_path, "r", encoding="utf-8") as f:
+            scene = json.load(f)
+    finally:
+        os.remove(out_path)
+    return {"wall_seconds": round(wall, 4), **scene}
+
+
+def _median_run(runs: List[dict]) -> dict:
+    med = lambda xs: round(statistics.median(xs), 4)
+    out = {
+        "wall_seconds": med([r["wall_seconds"] for r in runs]),
+        "scene_seconds": med([r["scene_seconds"] for r in runs]),
+        "phases": {p: med([r["phases"][p] for r in runs]) for p in (*PHASES, "other")},
+        "frames": runs[0]["frames"],
+        "peak_rss_mb": None,
+    }
+    rss = [r["peak_rss_mb"] for r in runs if r["peak_rss_mb"] is not None]
+    if rss:
+        out["peak_rss_mb"] = round(max(rss), 1)
+    return out
+
+
+def run_suite(targets: Sequence[str] = TARGETS, configs: Sequence[str] = tuple(CONFIGS), repeat: int = 1) -> dict:
+    """Every (target, config) run `repeat` times sequentially; medians per metric."""
+    results = {}
+    for config_name in configs:
+        for target in targets:
+            key = f"{target}/{config_name}"
+            runs = [run_once(target, config_name) for _ in range(repeat)]
+            results[key] = _median_run(runs)
+            r = results[key]
+            phases = "  ".join(f"{p}={r['phases'][p]:.2f}" for p in (*PHASES, "other"))
+            print(f"{key:50s} wall={r['wall_seconds']:7.2f}s frames={r['frames']:5d} {phases}")
+    return {"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "repeat": repeat, "results": results}
+
+
+def _metrics(run: dict) -> Dict[str, Optional[float]]:
+    out = {"wall_seconds": run["wall_seconds"], "peak_rss_mb": run.get("peak_rss_mb")}
+    out.update({f"phases.{p}": s for p, s in run["phases"].items()})
+    return out
+
+
+def compare(current: dict, baseline: dict, tolerance: float = 0.15) -> List[str]:
+    """Regression messages (empty = pass). Frame-count changes are always reported."""
+    problems = []
+    for key, run in current["results"].items():
+        base = baseline.get("results", {}).get(key)
+        if base is None:
+            continue
+        if run["frames"] != base["frames"]:
+            problems.append(f"{key}: frames {base['frames']} -> {run['frames']}")
+        cur_m, base_m = _metrics(run), _metrics(base)
+        for metric, value in cur_m.items():
+            ref = base_m.get(metric)
+            if value is None or ref is None:
+                continue
+            floor = MIN_DELTA["peak_rss_mb" if metric == "peak_rss_mb" else "seconds"]
+            if value > ref * (1 + tolerance) and value - ref > floor:
+                problems.append(f"{key}: {metric} {ref:.2f} -> {value:.2f} (+{(value / ref - 1) * 100 if ref else 100:.0f}%)")
+    return problems
+
+
+def _write_json(data: dict, path: str):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1)
+    os.replace(tmp, path)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Per-phase render benchmark with baseline comparison.")
+    ap.add_argument("--targets", nargs="+", choices=TARGETS, default=list(TARGETS))
+    ap.add_argument("--configs", nargs="+", choices=list(CONFIGS), default=list(CONFIGS))
+    ap.add_argument("--repeat", type=int, default=1, help="runs per cell (median is kept)")
+    ap.add_argument("-o", "--output", default=None, help="results JSON (default: media/bench/bench_<time>.json)")
+    ap.add_argument("--baseline", default=DEFAULT_BASELINE)
+    ap.add_argument("--tolerance", type=float, default=0.15, help="allowed relative slowdown (0.15 = 15%%)")
+    ap.add_argument("--update-baseline", action="store_true", help="write results as the new baseline")
+    args = ap.parse_args(argv)
+
+    current = run_suite(args.targets, args.configs, args.repeat)
+    output = args.output or os.path.join(BENCH_DIR, time.strftime("bench_%Y%m%d_%H%M%S.json"))
+    _write_json(current, output)
+    print(f"Results -> {output}")
+
+    if args.update_baseline:
+        _write_json(current, args.baseline)
+        print(f"Baseline updated -> {args.baseline}")
+        return
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline to record one.")
+        return
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    problems = compare(current, baseline, args.tolerance)
+    for p in problems:
+        print(f"[REGRESSION] {p}")
+    print(f"{len(problems)} regression(s) at {args.tolerance:.0%} tolerance")
+    raise SystemExit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
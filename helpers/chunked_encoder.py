@@ -0,0 +1,292 @@
+# [CHECKPOINT-1..5 Active; Mirrors CHECKPOINTS.md]
+# WHY: manim encodes each partial movie with one in-process PyAV stream fed by an unbounded
+# queue, and end_animation() waits for that stream to drain: after every play the drawing
+# stops until the encoder has caught up, and the encoder never uses more than one stream.
+# Here frames are copied into a bounded pool of preallocated slots (the ring buffer) and
+# streamed as raw RGBA to a pool of ffmpeg processes. Each process encodes one chunk (at most
+# ENCODER_CHUNK_FRAMES frames of one partial movie, starting on a keyframe with GOP length
+# ENCODER_GOP), so chunks join by stream copy. end_animation() returns at once; the drawing
+# thread only waits when every slot is taken (backpressure: memory stays at
+# ENCODER_BUFFER_MB). finish() waits for the pool, joins multi-chunk partials, runs deferred
+# work (beat-cache stores) and logs render vs encode time.
+# ENCODER in config.py: "chunked" (default) | "manim" (FA_ENCODER=manim).
+# Manim CE v0.19.0-compatible (Cairo + OpenGL renderers; not for transparent/gif/png output).
+from __future__ import annotations
+
+import importlib
+import os
+import queue
+import subprocess
+import threading
+import time
+from typing import Callable, List, Optional
+
+import numpy as np
+from manim import config, logger
+from manim.constants import RendererType
+
+from helpers.ffmpeg_tools import concat_copy, find_ffmpeg
+
+_project_config = importlib.import_module("config")  # project config.py (not manim's config)
+ENCODER = getattr(_project_config, "ENCODER", "chunked")
+ENCODER_JOBS = getattr(_project_config, "ENCODER_JOBS", None)
+ENCODER_CHUNK_FRAMES = getattr(_project_config, "ENCODER_CHUNK_FRAMES", 240)
+ENCODER_GOP = getattr(_project_config, "ENCODER_GOP", 60)
+ENCODER_BUFFER_MB = getattr(_project_config, "ENCODER_BUFFER_MB", 256)
+
+_END = (None, 0)  # end of a chunk's frame stream
+
+
+def _chunk_path(partial: str, index: int) -> str:
+    root, ext = os.path.splitext(partial)
+    return f"{root}.chunk{index:03d}{ext}"
+
+
+class _Chunk:
+    def __init__(self, path: str, frames: int):
+        self.path = path
+        self.capacity = frames   # frames this chunk takes (GOP multiple unless it ends a partial)
+        self.written = 0
+        self.frames: "queue.Queue" = queue.Queue()  # (slot, repeat); bounded by the slot pool
+        self.drained = False     # _END taken off the queue
+
+
+class ChunkedEncoder:
+    """Bounded frame buffer -> pool of ffmpeg chunk encoders. One instance per scene/writer."""
+
+    def __init__(self, width: int, height: int, fps: float, codec_args: List[str],
+                 jobs: Optional[int] = None, chunk_frames: int = ENCODER_CHUNK_FRAMES,
+                 gop: int = ENCODER_GOP, buffer_mb: int = ENCODER_BUFFER_MB, ffmpeg: Optional[str] = None):
+        cores = os.cpu_count() or 1
+        self.jobs = max(1, jobs or min(4, cores))
+        self.threads = max(1, cores // self.jobs)  # encoder threads per process: all cores, no oversubscription
+        self.width, self.height, self.fps = width, height, fps
+        self.gop = max(1, gop)
+        self.chunk_frames = max(self.gop, chunk_frames // self.gop * self.gop)  # GOP-aligned chunks
+        self.codec_args = codec_args
+        self.ffmpeg = find_ffmpeg(ffmpeg)
+
+        frame_bytes = width * height * 4
+        self.capacity = max(2 * self.jobs, buffer_mb * 1024 * 1024 // frame_bytes)
+        self._slots: List[np.ndarray] = []  # allocated on demand, never more than capacity
+        self._free: "queue.Queue[int]" = queue.Queue()
+
+        self._tasks: "queue.Queue[Optional[_Chunk]]" = queue.Queue()
+        self._workers = [threading.Thread(target=self._work, name=f"chunk-encoder-{i}", daemon=True)
+                         for i in range(self.jobs)]
+        for w in self._workers:
+            w.start()
+        self._partial: Optional[str] = None
+        self._chunks: List[_Chunk] = []          # chunks of the open partial movie
+        self._joins: List[tuple] = []            # (partial path, chunk paths) for finish()
+        self._deferred: List[Callable] = []
+        self._error: Optional[BaseException] = None
+        self._lock = threading.Lock()
+        # report
+        self.frames = 0
+        self.chunks = 0
+        self.producer_wait = 0.0   # drawing thread blocked on a full buffer
+        self.encode_busy = 0.0     # summed seconds the ffmpeg processes were fed
+        self._t0: Optional[float] = None
+
+    # ---- drawing thread ----
+    def begin(self, path: str):
+        """Start a partial movie; its frames follow via write()."""
+        if self._t0 is None:
+            self._t0 = time.perf_counter()
+        self._partial, self._chunks = path, []
+
+    def write(self, frame, count: int = 1):
+        self._raise_error()
+        while count > 0:
+            chunk = self._chunks[-1] if self._chunks else None
+            if chunk is None or chunk.written == chunk.capacity:
+                chunk = self._new_chunk()
+            take = min(count, chunk.capacity - chunk.written)
+            slot = self._acquire()
+            np.copyto(self._slots[slot], frame)
+            chunk.frames.put((slot, take))
+            chunk.written += take
+            self.frames += take
+            count -= take
+
+    def end(self):
+        """Close the partial movie without waiting for its encode."""
+        if self._chunks:
+            self._chunks[-1].frames.put(_END)
+            if len(self._chunks) > 1:
+                self._joins.append((self._partial, [c.path for c in self._chunks]))
+        self._partial, self._chunks = None, []
+
+    def defer(self, fn: Callable):
+        """Run fn after every chunk is encoded (work that reads the partial movies)."""
+        self._deferred.append(fn)
+
+    def close(self):
+        """Wait for the pool, join multi-chunk partials, run deferred work; returns the report."""
+        t = time.perf_counter()
+        self.end()
+        for _ in self._workers:
+            self._tasks.put(None)
+        for w in self._workers:
+            w.join()
+        drain = time.perf_counter() - t
+        self._raise_error()
+        for partial, parts in self._joins:
+            first = _chunk_path(partial, 0)
+            os.replace(partial, first)  # chunk 0 was encoded to the partial path
+            parts = [first, *parts[1:]]
+            concat_copy(parts, partial, self.ffmpeg)
+            for p in parts:
+                os.remove(p)
+        for fn in self._deferred:
+            fn()
+        wall = time.perf_counter() - (self._t0 or t)
+        return {"frames": self.frames, "chunks": self.chunks, "jobs": self.jobs, "threads": self.threads,
+                "buffer_frames": len(self._slots), "wall": round(wall, 3),
+                "render": round(wall - drain - self.producer_wait, 3), "producer_wait": round(self.producer_wait, 3),
+                "drain": round(drain, 3), "encode_busy": round(self.encode_busy, 3)}
+
+    def _new_chunk(self) -> _Chunk:
+        if self._chunks:
+            self._chunks[-1].frames.put(_END)
+            chunk = _Chunk(_chunk_path(self._partial, len(self._chunks)), self.chunk_frames)
+        else:  # most partials fit one chunk: encode straight to the partial path
+            chunk = _Chunk(self._partial, self.chunk_frames)
+        self._chunks.append(chunk)
+        self.chunks += 1
+        self._tasks.put(chunk)
+        return chunk
+
+    def _acquire(self) -> int:
+        try:
+            return self._free.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._slots) < self.capacity:
+                self._slots.append(np.empty((self.height, self.width, 4), dtype=np.uint8))
+                return len(self._slots) - 1
+        t = time.perf_counter()
+        while True:  # backpressure: every slot is waiting for an encoder
+            self._raise_error()
+            try:
+                slot = self._free.get(timeout=0.5)
+                break
+            except queue.Empty:
+                continue
+        self.producer_wait += time.perf_counter() - t
+        return slot
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise RuntimeError(f"Chunked encoder failed: {self._error}") from self._error
+
+    # ---- encoder threads ----
+    def _cmd(self, path: str) -> List[str]:
+        return [self.ffmpeg, "-y", "-v", "error", "-f", "rawvideo", "-pix_fmt", "rgba",
+                "-s", f"{self.width}x{self.height}", "-framerate", str(self.fps), "-i", "pipe:0",
+                "-an", *self.codec_args, "-g", str(self.gop), "-threads", str(self.threads), path]
+
+    def _work(self):
+        while True:
+            chunk = self._tasks.get()
+            if chunk is None:
+                return
+            t = time.perf_counter()
+            try:
+                self._encode(chunk)
+            except BaseException as exc:  # keep draining so the drawing thread never deadlocks
+                self._error = self._error or exc
+                if not chunk.drained:
+                    self._discard(chunk)
+            with self._lock:
+                self.encode_busy += time.perf_counter() - t
+
+    def _encode(self, chunk: _Chunk):
+        if self._error is not None:
+            return self._discard(chunk)
+        proc = subprocess.Popen(self._cmd(chunk.path), stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+        try:
+            while True:
+                slot, repeat = chunk.frames.get()
+                if slot is None:
+                    chunk.drained = True
+                    break
+                data = memoryview(self._slots[slot]).cast("B")
+                try:
+                    for _ in range(repeat):
+                        proc.stdin.write(data)
+                finally:
+                    self._free.put(slot)
+        finally:
+            try:
+                proc.stdin.close()
+            except OSError:  # ffmpeg already gone; its exit code says why
+                pass
+            err = proc.stderr.read()
+            proc.wait()
+        if proc.returncode != 0:
+            raise RuntimeError(f"ffmpeg exit {proc.returncode} for {chunk.path}: {err.decode(errors='ignore')}")
+
+    def _discard(self, chunk: _Chunk):
+        while True:
+            slot, _ = chunk.frames.get()
+            if slot is None:
+                chunk.drained = True
+                return
+            self._free.put(slot)
+
+
+def _codec_args() -> Optional[List[str]]:
+    """Same codec/quality as manim's partial movies; None where the chunked path does not apply."""
+    if config.transparent or config.format in ("gif", "png"):
+        return None
+    if config.movie_file_extension == ".webm":
+        return ["-c:v", "libvpx-vp9", "-pix_fmt", "yuv420p", "-crf", "23", "-b:v", "0", "-auto-alt-ref", "1"]
+    return ["-c:v", "libx264", "-pix_fmt", "yuv420p", "-crf", "23"]
+
+
+def install_chunked_encoder(scene) -> Optional[ChunkedEncoder]:
+    """Replace the writer's in-process encoder with the chunked pool; call from setup()."""
+    codec_args = _codec_args()
+    if ENCODER != "chunked" or codec_args is None or config.dry_run or not config.write_to_movie:
+        return None
+    try:
+        find_ffmpeg()
+    except FileNotFoundError:
+        return None  # manim's PyAV encoder needs no ffmpeg binary
+    renderer = scene.renderer
+    writer = renderer.file_writer
+    enc = ChunkedEncoder(config.pixel_width, config.pixel_height, config.frame_rate, codec_args, ENCODER_JOBS)
+    opengl = config.renderer == RendererType.OPENGL
+
+    def open_partial_movie_stream(file_path=None):
+        if file_path is None:
+            file_path = writer.partial_movie_files[renderer.num_plays]
+        writer.partial_movie_file_path = file_path
+        enc.begin(str(file_path))
+
+    def close_partial_movie_stream():
+        enc.end()
+        logger.info(f"Animation {renderer.num_plays} : Partial movie file queued for {writer.partial_movie_file_path}")
+
+    def write_frame(frame_or_renderer, num_frames: int = 1):
+        enc.write(frame_or_renderer.get_frame() if opengl else frame_or_renderer, num_frames)
+
+    finish = writer.finish
+
+    def chunked_finish():
+        report = enc.close()
+        scene._encoder_report = report
+        logger.info("Encoder: {frames} frames in {chunks} chunk(s) on {jobs} ffmpeg x {threads} thread(s); "
+                    "render {render:.2f}s (+{producer_wait:.2f}s backpressure), drain {drain:.2f}s, "
+                    "encode busy {encode_busy:.2f}s".format(**report))
+        return finish()
+
+    writer.open_partial_movie_stream = open_partial_movie_stream
+    writer.close_partial_movie_stream = close_partial_movie_stream
+    writer.write_frame = write_frame
+    writer.finish = chunked_finish
+    scene._chunk_encoder = enc
+    return enc
@@ -0,0 +1,126 @@
+# [CHECKPOINT-1..5 Active; Mirrors CHECKPOINTS.md]
+# WHY: Draft renders (Linux CI, quick previews) need realistic pacing, not Piper. Each
+# line becomes a silent (or tone) WAV written in-process; its length is estimated from
+# the word count with a per-voice words-per-minute fit learned from the real Piper cache
+# manifest (helpers/audio_cache.py), so beats keep their narrated timing.
+# Use:  FA_SPEECH=estimate manim -pql FinalAnimation.py FinalAnimation
+# Manim CE v0.19.0-compatible.
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import re
+import struct
+import wave
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from manim_voiceover.services.base import SpeechService
+
+from helpers.audio_cache import AudioCache
+
+DEFAULT_WPM = 160.0
+DEFAULT_LEAD = 0.25    # seconds of leading/trailing silence per clip
+MIN_SECONDS = 0.4
+_WORD = re.compile(r"[A-Za-z0-9']+")
+
+
+def count_words(text: str) -> int:
+    return len(_WORD.findall(text))
+
+
+@dataclass(frozen=True)
+class Calibration:
+    """seconds = words * 60 / wpm + lead (at tempo 1.0)."""
+    wpm: float = DEFAULT_WPM
+    lead: float = DEFAULT_LEAD
+    samples: int = 0          # manifest clips the fit used (0 = defaults)
+
+    def seconds(self, text: str, tempo: float = 1.0) -> float:
+        return max(MIN_SECONDS, (count_words(text) * 60.0 / self.wpm + self.lead) / tempo)
+
+
+def fit_calibration(pairs: Iterable[tuple]) -> Calibration:
+    """Least-squares line through (words, seconds at tempo 1); ratio fit when that's degenerate."""
+    pairs = [(w, s) for w, s in pairs if w > 0 and s > 0]
+    if not pairs:
+        return Calibration()
+    n = len(pairs)
+    mean_w = sum(w for w, _ in pairs) / n
+    mean_s = sum(s for _, s in pairs) / n
+    var = sum((w - mean_w) ** 2 for w, _ in pairs)
+    slope = sum((w - mean_w) * (s - mean_s) for w, s in pairs) / var if var else 0.0
+    lead = mean_s - slope * mean_w
+    if n < 3 or slope <= 0 or not 0.0 <= lead <= 1.0:
+        slope, lead = sum(s for _, s in pairs) / sum(w for w, _ in pairs), 0.0
+    return Calibration(wpm=round(60.0 / slope, 2), lead=round(lead, 4), samples=n)
+
+
+def calibrate(cache_dir: str, voice: Optional[str] = None) -> Calibration:
+    """Fit from the Piper manifest in cache_dir: this voice's clips, or every clip if none match."""
+    if not os.path.exists(os.path.join(cache_dir, "tts_manifest.json")):
+        return Calibration()
+    entries = [e for e in AudioCache(cache_dir).load()["entries"].values() if e.get("text") and e.get("duration")]
+    if voice is not None and any(e.get("voice") == voice for e in entries):
+        entries = [e for e in entries if e.get("voice") == voice]
+    return fit_calibration((count_words(e["text"]), e["duration"] * e.get("tempo", 1.0)) for e in entries)
+
+
+class EstimatedSpeechService(SpeechService):
+    """Silent/tone WAV per line, timed by a Calibration. No subprocesses, no TTS model.
+    wpm overrides the calibrated rate; tone_hz > 0 writes a quiet sine instead of silence.
+    Clips are cached as est_<hash>.wav next to the Piper cache (kept out of its manifest)."""
+
+    synthesizes_in_process = True  # helpers/presynth.py: no pool needed
+
+    def __init__(self, voice: Optional[str] = None, tempo: float = 1.0, wpm: Optional[float] = None,
+                 tone_hz: float = 0.0, sample_rate: int = 22050, calibration_dir: Optional[str] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.voice = voice
+        self.tempo = float(tempo)
+        self.tone_hz = float(tone_hz)
+        self.sample_rate = int(sample_rate)
+        calibration = calibrate(str(calibration_dir or self.cache_dir), voice)
+        if wpm:
+            calibration = Calibration(wpm=float(wpm), lead=calibration.lead, samples=calibration.samples)
+        self.calibration = calibration
+
+    def estimate(self, text: str) -> float:
+        return round(self.calibration.seconds(" ".join(text.split()), self.tempo), 4)
+
+    def _basename(self, text: str) -> str:
+        payload = json.dumps({"text": text, "seconds": self.estimate(text), "tone": self.tone_hz,
+                              "rate": self.sample_rate}, sort_keys=True)
+        return "est_" + hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16] + ".wav"
+
+    def is_cached(self, text: str, cache_dir: Optional[str] = None) -> bool:
+        return os.path.exists(os.path.join(cache_dir or self.cache_dir, self._basename(" ".join(text.split()))))
+
+    def cached_duration(self, text: str, cache_dir: Optional[str] = None) -> float:
+        """Same API as PiperService.cached_duration; the estimate never misses."""
+        return self.estimate(text)
+
+    def _write_wav(self, path: str, seconds: float):
+        frames = int(round(seconds * self.sample_rate))
+        if self.tone_hz > 0:
+            step = 2 * math.pi * self.tone_hz / self.sample_rate
+            data = struct.pack(f"<{frames}h", *(int(1600 * math.sin(i * step)) for i in range(frames)))
+        else:
+            data = bytes(2 * frames)
+        part = path + ".part"
+        with wave.open(part, "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(self.sample_rate)
+            w.writeframes(data)
+        os.replace(part, path)
+
+    def generate_from_text(self, text: str, cache_dir: Optional[str] = None, path: Optional[str] = None) -> dict:
+        cache_dir = str(cache_dir or self.cache_dir)
+        name = self._basename(text)
+        audio_path = os.path.join(cache_dir, name)
+        if not os.path.exists(audio_path):
+            self._write_wav(audio_path, self.estimate(text))
+        return {"path": audio_path, "original_audio": name, "input_data": {"input_text": text, "service": "estimate"}}
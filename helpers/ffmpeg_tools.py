@@ -0,0 +1,54 @@
+# [CHECKPOINT-1..5 Active; Mirrors CHECKPOINTS.md]
+# WHY: One place to find ffmpeg and to join movies losslessly, shared by the render drivers.
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import tempfile
+from typing import Iterable, Optional
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def find_ffmpeg(explicit: Optional[str] = None) -> str:
+    """Explicit path > ffmpeg on PATH > bundled piper_runtime build (setup_piper.bat)."""
+    if explicit:
+        return explicit
+    on_path = shutil.which("ffmpeg")
+    if on_path:
+        return on_path
+    for name in ("ffmpeg.exe", "ffmpeg"):
+        bundled = os.path.join(BASE_DIR, "piper_runtime", "ffmpeg", "bin", name)
+        if os.path.exists(bundled):
+            return bundled
+    raise FileNotFoundError("ffmpeg not found on PATH or at piper_runtime/ffmpeg/bin/")
+
+
+def run_ffmpeg(args: Iterable[str], ffmpeg: Optional[str] = None, input: Optional[bytes] = None):
+    """Run ffmpeg quietly; `input` is fed to stdin ("-i pipe:0"). Raises with stderr on failure."""
+    cmd = [find_ffmpeg(ffmpeg), "-y", "-v", "error", *args]
+    proc = subprocess.run(cmd, input=input, capture_output=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed (exit {proc.returncode}).\nCmd: {' '.join(cmd)}\nSTDERR:\n{proc.stderr.decode(errors='ignore')}")
+    return proc
+
+
+def concat_copy(inputs: Iterable[str], output: str, ffmpeg: Optional[str] = None) -> str:
+    """Join movies with the concat demuxer and stream copy (no re-encode); written atomically."""
+    inputs = [os.path.abspath(p) for p in inputs]
+    if not inputs:
+        raise ValueError("concat_copy() needs at least one input")
+    fd, list_path = tempfile.mkstemp(suffix=".txt", prefix="concat_")
+    part = output + ".part" + os.path.splitext(output)[1]
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            for p in inputs:
+                f.write("file '{}'\n".format(p.replace("\\", "/").replace("'", "'\\''")))
+        run_ffmpeg(["-f", "concat", "-safe", "0", "-i", list_path, "-c", "copy", part], ffmpeg)
+        os.replace(part, output)
+    finally:
+        os.remove(list_path)
+        if os.path.exists(part):
+            os.remove(part)
+    return output
@@ -0,0 +1,251 @@
+# [CHECKPOINT-1..5 Active; Mirrors CHECKPOINTS.md]
+# WHY: CHECKPOINT-3 (determinism) was checked by eye or by diffing whole videos. With
+# FA_FRAME_HASH set, every frame handed to the movie writer is hashed as it streams by
+# (CRC-32 of the raw RGBA buffer) and a compact manifest is written next to the movie:
+# one entry per voiceover beat (plus the stretches between beats), each a run-length list
+# of [crc, repeat] pairs. Two runs compare in milliseconds, no decode, no reference video.
+# Beat-cache hits replay the hashes stored with the cached beat (marked "cached").
+# Use:
+#   FA_FRAME_HASH=1 manim -qh FinalAnimation.py FinalAnimation   # -> <movie>.frames.json
+#   FA_FRAME_HASH=out/run_a.json ...                              # explicit manifest path
+#   python -m helpers.frame_hash run_a.json run_b.json            # first diverging frame/beat
+# Manim CE v0.19.0-compatible (Cairo + OpenGL renderers).
+from __future__ import annotations
+
+import argparse
+import atexit
+import json
+import os
+import zlib
+from typing import Iterator, List, Optional, Tuple
+
+FRAME_HASH_ENV = "FA_FRAME_HASH"
+MANIFEST_VERSION = 1
+
+
+def frame_crc(frame) -> str:
+    """CRC-32 of one frame's pixels (C order), as 8 hex digits."""
+    import numpy as np
+    return f"{zlib.crc32(np.ascontiguousarray(frame)) & 0xFFFFFFFF:08x}"
+
+
+class _FrameSource:
+    """Hands an already-read OpenGL frame to SceneFileWriter.write_frame (no second readback)."""
+
+    def __init__(self, renderer, frame):
+        self._renderer = renderer
+        self._frame = frame
+
+    def get_frame(self):
+        return self._frame
+
+    def __getattr__(self, name):
+        return getattr(self._renderer, name)
+
+
+class FrameHashRecorder:
+    """Run-length frame hashes per segment; a segment is one beat or the frames between beats."""
+
+    def __init__(self, scene, out_path: str):
+        self.scene = scene
+        self.out_path = out_path
+        self.segments: List[dict] = []
+        self.current: Optional[dict] = None  # open beat
+        self.last: Optional[dict] = None     # beat closed most recently
+        self.frames = 0
+
+    def _target(self) -> dict:
+        if self.current is not None:
+            return self.current
+        if not self.segments or self.segments[-1]["key"] is not None:
+            self.segments.append({"key": None, "start": self.frames, "frames": []})
+        return self.segments[-1]
+
+    def _append(self, seg: dict, crc: str, count: int):
+        runs = seg["frames"]
+        if runs and runs[-1][0] == crc:
+            runs[-1][1] += count
+        else:
+            runs.append([crc, count])
+        self.frames += count
+
+    def add(self, frame, count: int = 1):
+        if count > 0:
+            self._append(self._target(), frame_crc(frame), count)
+
+    def replay(self, runs):
+        """Hashes of a beat that was not rendered (beat-cache hit)."""
+        seg = self._target()
+        seg["cached"] = True
+        for crc, count in runs:
+            self._append(seg, crc, count)
+
+    def begin_beat(self, key: str):
+        self.current = {"key": key, "start": self.frames, "frames": []}
+        self.segments.append(self.current)
+
+    def end_beat(self):
+        self.last, self.current = self.current, None
+
+    def report(self) -> dict:
+        from manim import config
+        return {
+            "version": MANIFEST_VERSION,
+            "scene": type(self.scene).__name__,
+            "renderer": config.renderer.value,
+            "pixel_size": [config.pixel_width, config.pixel_height],
+            "frame_rate": config.frame_rate,
+            "frames": self.frames,
+            "segments": self.segments,
+        }
+
+    def dump(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.out_path)), exist_ok=True)
+        tmp = f"{self.out_path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, separators=(",", ":"))
+        os.replace(tmp, self.out_path)
+
+
+def install_frame_hash(scene) -> Optional[FrameHashRecorder]:
+    """Hash every written frame if FA_FRAME_HASH is set; call from setup()."""
+    target = os.environ.get(FRAME_HASH_ENV)
+    from manim import config
+    from manim.constants import RendererType
+    if not target or target == "0" or config.dry_run or not config.write_to_movie:
+        return None
+    renderer = scene.renderer
+    writer = renderer.file_writer
+    out_path = str(writer.movie_file_path) + ".frames.json" if target == "1" else target
+    rec = FrameHashRecorder(scene, out_path)
+
+    write_frame = writer.write_frame
+    opengl = config.renderer == RendererType.OPENGL
+
+    def hashed_write_frame(frame_or_renderer, num_frames: int = 1):
+        if opengl:
+            frame = frame_or_renderer.get_frame()
+            rec.add(frame, num_frames)
+            return write_frame(_FrameSource(frame_or_renderer, frame), num_frames)
+        rec.add(frame_or_renderer, num_frames)
+        return write_frame(frame_or_renderer, num_frames)
+    writer.write_frame = hashed_write_frame
+
+    from helpers.timeline import beat_key, hook_voiceover_text
+    hook_voiceover_text(scene, lambda text, tracker: rec.begin_beat(beat_key(scene, text)))
+
+    wait_for_voiceover = scene.wait_for_voiceover
+
+    def hashed_wait_for_voiceover():
+        try:
+            return wait_for_voiceover()
+        finally:
+            rec.end_beat()  # the trailing wait belongs to the beat
+    scene.wait_for_voiceover = hashed_wait_for_voiceover
+
+    scene._frame_hashes = rec
+    atexit.register(rec.dump)
+    return rec
+
+
+# ---- compare ----
+def load_manifest(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"{path}: frame manifest version {data.get('version')} (expected {MANIFEST_VERSION})")
+    return data
+
+
+def _runs(manifest: dict) -> Iterator[Tuple[int, int, str, int]]:
+    """(first frame, count, crc, segment index) for every run, in frame order."""
+    frame = 0
+    for i, seg in enumerate(manifest["segments"]):
+        for crc, count in seg["frames"]:
+            yield frame, count, crc, i
+            frame += count
+
+
+def first_divergence(a: dict, b: dict) -> Optional[dict]:
+    """First frame whose hash differs (or where one run ends early); None if identical."""
+    runs_a, runs_b = _runs(a), _runs(b)
+    ra, rb = next(runs_a, None), next(runs_b, None)
+    used_a = used_b = 0  # frames of the current run already matched
+    while ra is not None and rb is not None:
+        if ra[2] != rb[2]:
+            return _divergence(a, b, ra[0] + used_a, ra[3], rb[3])
+        step = min(ra[1] - used_a, rb[1] - used_b)
+        used_a += step
+        used_b += step
+        if used_a == ra[1]:
+            ra, used_a = next(runs_a, None), 0
+        if used_b == rb[1]:
+            rb, used_b = next(runs_b, None), 0
+    if ra is None and rb is None:
+        return None
+    frame = (ra[0] + used_a) if ra is not None else (rb[0] + used_b)
+    return _divergence(a, b, frame, ra[3] if ra else None, rb[3] if rb else None)
+
+
+def _divergence(a: dict, b: dict, frame: int, seg_a: Optional[int], seg_b: Optional[int]) -> dict:
+    def where(manifest, seg):
+        if seg is None:
+            return {"beat": None, "frame_in_beat": None, "cached": False, "ended": True}
+        s = manifest["segments"][seg]
+        return {"beat": s["key"] or f"(between beats #{seg})", "frame_in_beat": frame - s["start"],
+                "cached": bool(s.get("cached")), "ended": False}
+    return {"frame": frame, "time": round(frame / float(a.get("frame_rate") or 1), 3),
+            "a": where(a, seg_a), "b": where(b, seg_b)}
+
+
+def differing_beats(a: dict, b: dict) -> List[str]:
+    """Beat keys whose frame hashes differ (beats matched by order of appearance)."""
+    beats_a = [s for s in a["segments"] if s["key"] is not None]
+    beats_b = [s for s in b["segments"] if s["key"] is not None]
+    out = [sa["key"] for sa, sb in zip(beats_a, beats_b) if sa["key"] != sb["key"] or sa["frames"] != sb["frames"]]
+    longer = beats_a if len(beats_a) > len(beats_b) else beats_b
+    out += [s["key"] for s in longer[min(len(beats_a), len(beats_b)):]]
+    return out
+
+
+def compare(a: dict, b: dict) -> List[str]:
+    """Human-readable findings (empty = identical frames)."""
+    notes = []
+    for field in ("renderer", "pixel_size", "frame_rate"):
+        if a.get(field) != b.get(field):
+            notes.append(f"{field}: {a.get(field)} vs {b.get(field)} (hashes are not comparable)")
+    if notes:
+        return notes
+    div = first_divergence(a, b)
+    if div is None:
+        return notes
+    da, db = div["a"], div["b"]
+    if da["ended"] or db["ended"]:
+        notes.append(f"frame counts differ: {a['frames']} vs {b['frames']} (first extra frame {div['frame']})")
+    else:
+        notes.append(f"first diverging frame {div['frame']} (t={div['time']:.3f}s): beat {da['beat']} "
+                     f"frame {da['frame_in_beat']}" + (f" / beat {db['beat']}" if db["beat"] != da["beat"] else ""))
+    if da["cached"] or db["cached"]:
+        notes.append("note: that beat came from the beat cache in one run; rerun with FA_BEAT_CACHE=0 to confirm")
+    beats = differing_beats(a, b)
+    if beats:
+        notes.append(f"{len(beats)} beat(s) differ: {', '.join(beats)}")
+    return notes
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Compare two frame-hash manifests (FA_FRAME_HASH).")
+    ap.add_argument("a")
+    ap.add_argument("b")
+    args = ap.parse_args(argv)
+    a, b = load_manifest(args.a), load_manifest(args.b)
+    notes = compare(a, b)
+    for note in notes:
+        print(note)
+    if not notes:
+        print(f"identical: {a['frames']} frames, {sum(1 for s in a['segments'] if s['key'])} beats")
+    raise SystemExit(1 if notes else 0)
+
+
+if __name__ == "__main__":
+    main()
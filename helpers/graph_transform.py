@@ -0,0 +1,114 @@
+# [CHECKPOINT-1..5 Active; Mirrors CHECKPOINTS.md]
+# WHY: Show the whole graph of f carried to g, not just one point. Each function is sampled
+# once into an (n,) NumPy array; every stage (x' = x/k, + d, a·y, + c from the spec's steps)
+# is one vectorized operation on the curve's point array, and one Animation drives all
+# curves per stage: no per-sample mobjects, no per-point Python loops. 10k+ samples per
+# curve stay cheap at 1080p30 (the per-frame update is a single array blend per curve).
+# Manim CE v0.19.0-compatible.
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from manim import Animation, VGroup, VMobject
+
+from helpers.transformations import TransformationSpec, TransformStep
+
+# Names an f(x) expression in config.GRAPH_FUNCTIONS may use (x is the sample array).
+_EXPR_NAMES = {
+    "np": np, "pi": np.pi, "e": np.e, "abs": np.abs, "sqrt": np.sqrt, "exp": np.exp, "log": np.log,
+    "sin": np.sin, "cos": np.cos, "tan": np.tan, "arctan": np.arctan, "tanh": np.tanh,
+}
+
+
+def sample_function(expr: str, x_min: float, x_max: float, samples: int) -> Tuple[np.ndarray, np.ndarray]:
+    """f(x) over [x_min, x_max] as (xs, ys), evaluated once on the whole array."""
+    xs = np.linspace(x_min, x_max, int(samples))
+    ys = eval(compile(expr, "<GRAPH_FUNCTIONS>", "eval"), {"__builtins__": {}, **_EXPR_NAMES}, {"x": xs})
+    ys = np.broadcast_to(np.asarray(ys, dtype=float), xs.shape).copy()
+    if not np.all(np.isfinite(ys)):
+        raise ValueError(f"f(x) = {expr} is not finite on [{x_min}, {x_max}]")
+    return xs, ys
+
+
+def stable_domain(spec: TransformationSpec, x_range: Sequence[float]) -> Tuple[float, float]:
+    """Largest [lo, hi] of x whose image stays inside x_range after every stage."""
+    x_min, x_max = x_range[0], x_range[1]
+    lo, hi = x_min, x_max
+    scale, offset = 1.0, 0.0  # composed x-map so far: x -> scale * x + offset
+    for step in spec.steps():
+        if step.axis != "x":
+            continue
+        scale, offset = scale * step.scale, offset * step.scale + step.offset
+        a, b = sorted(((x_min - offset) / scale, (x_max - offset) / scale))
+        lo, hi = max(lo, a), min(hi, b)
+    if lo >= hi:
+        raise ValueError("No part of f stays on the plane through every stage; widen the axes")
+    return lo, hi
+
+
+class AxesMap:
+    """Axes coordinates <-> scene points as one affine map (linear Axes only)."""
+
+    def __init__(self, axes):
+        self.origin = np.asarray(axes.c2p(0, 0), dtype=float)
+        self.ex = np.asarray(axes.c2p(1, 0), dtype=float) - self.origin
+        self.ey = np.asarray(axes.c2p(0, 1), dtype=float) - self.origin
+        self._inv = np.linalg.inv(np.array([self.ex[:2], self.ey[:2]]).T)
+
+    def to_points(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        return self.origin + np.outer(xs, self.ex) + np.outer(ys, self.ey)
+
+    def to_coords(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        xy = (points[:, :2] - self.origin[:2]) @ self._inv.T
+        return xy[:, 0], xy[:, 1]
+
+    def stage_points(self, points: np.ndarray, step: TransformStep) -> np.ndarray:
+        """Every point (anchors and handles) through one stage; affine, so curves stay exact."""
+        return self.to_points(*step.apply(*self.to_coords(points)))
+
+
+class StageTransform(Animation):
+    """One stage on every curve: points = start + t·(end − start), one array op per curve per frame."""
+
+    def __init__(self, curves: VGroup, axes_map: AxesMap, step: TransformStep, **kwargs):
+        super().__init__(curves, **kwargs)
+        self.axes_map = axes_map
+        self.step = step
+        self._starts: List[np.ndarray] = []
+        self._deltas: List[np.ndarray] = []
+
+    def begin(self):
+        self._starts = [np.array(curve.points) for curve in self.mobject]
+        self._deltas = [self.axes_map.stage_points(start, self.step) - start for start in self._starts]
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float):
+        t = self.rate_func(alpha)
+        for curve, start, delta in zip(self.mobject, self._starts, self._deltas):
+            curve.set_points(start + delta * t)
+
+
+class GraphMorph:
+    """Sampled curves of f (one VMobject each) plus a faint copy left behind as the reference."""
+
+    def __init__(self, axes, spec: TransformationSpec, functions: Dict[str, str], samples: int = 12000,
+                 colors: Optional[Iterable] = None, stroke_width: float = 4, ghost_opacity: float = 0.3,
+                 z_index: int = 0):
+        self.spec = spec
+        self.axes_map = AxesMap(axes)
+        x_min, x_max = stable_domain(spec, axes.x_range)
+        colors = list(colors or ())
+        curves = []
+        for i, expr in enumerate(functions.values()):
+            xs, ys = sample_function(expr, x_min, x_max, samples)
+            curve = VMobject(stroke_width=stroke_width)
+            curve.set_points_as_corners(self.axes_map.to_points(xs, ys))
+            if colors:
+                curve.set_stroke(color=colors[i % len(colors)])
+            curves.append(curve)
+        self.curves = VGroup(*curves).set_z_index(z_index)
+        self.ghosts = self.curves.copy().set_stroke(opacity=ghost_opacity)
+
+    def stage(self, step: TransformStep, **kwargs) -> StageTransform:
+        return StageTransform(self.curves, self.axes_map, step, **kwargs)
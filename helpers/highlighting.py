@@ -1,45 +1,145 @@
 # [CHECKPOINT-1..5 Active; Mirrors CHECKPOINTS.md]
 # WHY: Centralized highlight control avoids FM-2 (lingering updaters) and FM-4 (z-order).
+# One engine for token colors and surrounding boxes; it diffs against what is on screen,
+# so each play() only carries the mobjects whose color/box actually changes.
 # Manim CE v0.19.0-compatible.
 from __future__ import annotations
-from typing import Iterable, List, Optional
-from manim import VGroup, SurroundingRectangle, AnimationGroup, FadeOut, Create
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+from manim import (
+    YELLOW, AnimationGroup, Create, FadeOut, ManimColor, Mobject, SurroundingRectangle,
+)
 
+from helpers.tracing import traced
 
-class HighlightGroupController:
+
+def _hex(color) -> str:
+    return ManimColor(color).to_hex()
+
+
+class HighlightEngine:
     """
-    Ensures only ONE highlight group is active at a time.
-    - activate(targets): clears previous, highlights new targets
-    - clear(): remove current highlights
+    Diff-aware highlights.
+    - track(*mobjects): remember each mobject's original color once (deduplicated)
+    - apply({mob: color}): instant recolor; only mobjects whose color differs are touched,
+      other tracked mobjects go back to their original color
+    - highlight(mobjects, color) / clear(): the same diff as an AnimationGroup (None = no change)
+    - activate(targets): only ONE box group at a time; unchanged targets keep their box,
+      removed boxes go back to a pool and are refitted for the next targets
     WHY: Checkpoint-1 Regression Guard; FM-2/4 safety.
     """
-    def __init__(self, scene, color, stroke_width=4, fill_opacity=0.0, buff=0.08, z_index=10):
+    def __init__(self, scene, color=YELLOW, stroke_width=4, fill_opacity=0.0, buff=0.08, z_index=10):
         self.scene = scene
         self.style = dict(color=color, stroke_width=stroke_width, fill_opacity=fill_opacity, buff=buff)
-        self.active: Optional[VGroup] = None
         self.z_index = z_index
+        self._colors: Dict[int, List] = {}  # id -> [mobject, original hex, current hex]
+        self._boxes: Dict[int, Tuple[Mobject, SurroundingRectangle]] = {}  # target id -> (target, box)
+        self._pool: List[SurroundingRectangle] = []
+
+    # ---- colors ----
+    def track(self, *mobjects: Mobject) -> "HighlightEngine":
+        """Register mobjects (once each) so their original color can be restored."""
+        for m in mobjects:
+            if m is not None and id(m) not in self._colors:
+                color = _hex(m.get_color())
+                self._colors[id(m)] = [m, color, color]
+        return self
+
+    def _diff(self, colors: Mapping[Mobject, object], restore_others: bool) -> List[Tuple[Mobject, str]]:
+        self.track(*colors)
+        wanted = {id(m): _hex(c) for m, c in colors.items() if m is not None}
+        changes = []
+        for key, (m, original, current) in self._colors.items():
+            target = wanted.get(key, original if restore_others else current)
+            if target != current:
+                changes.append((m, target))
+        return changes
+
+    def _commit(self, changes):
+        for m, color in changes:
+            self._colors[id(m)][2] = color
+
+    def apply(self, colors: Optional[Mapping[Mobject, object]] = None, restore_others: bool = True) -> int:
+        """Set colors without animation; returns how many mobjects changed."""
+        changes = self._diff(colors or {}, restore_others)
+        for m, color in changes:
+            m.set_color(color)
+        self._commit(changes)
+        return len(changes)
+
+    def animate(self, colors: Optional[Mapping[Mobject, object]] = None, restore_others: bool = True,
+                run_time: float = 0.3, lag_ratio: float = 0.05) -> Optional[AnimationGroup]:
+        """Animated apply(); None when nothing would change (nothing to play)."""
+        changes = self._diff(colors or {}, restore_others)
+        if not changes:
+            return None
+        self._commit(changes)
+        return AnimationGroup(*(m.animate.set_color(color) for m, color in changes),
+                              lag_ratio=lag_ratio, run_time=run_time)
+
+    def highlight(self, mobjects: Iterable[Mobject], color=YELLOW, run_time: float = 0.3) -> Optional[AnimationGroup]:
+        """Color `mobjects` (others untouched)."""
+        return self.animate({m: color for m in mobjects if m is not None}, restore_others=False, run_time=run_time)
+
+    def clear(self, run_time: float = 0.3) -> Optional[AnimationGroup]:
+        """Restore original colors of the mobjects that are currently highlighted."""
+        return self.animate(restore_others=True, run_time=run_time, lag_ratio=0.02)
+
+    def reset(self, *mobjects: Mobject) -> int:
+        """Instantly restore `mobjects` (default: all tracked) to their original color."""
+        keys = [id(m) for m in mobjects] if mobjects else list(self._colors)
+        changes = []
+        for key in keys:
+            entry = self._colors.get(key)
+            if entry is not None and entry[2] != entry[1]:
+                changes.append((entry[0], entry[1]))
+        for m, color in changes:
+            m.set_color(color)
+        self._commit(changes)
+        return len(changes)
+
+    # ---- boxes ----
+    def _fit(self, box: SurroundingRectangle, target: Mobject) -> SurroundingRectangle:
+        buff = self.style["buff"]
+        box.stretch_to_fit_width(target.width + 2 * buff)
+        box.stretch_to_fit_height(target.height + 2 * buff)
+        return box.move_to(target)
+
+    def _box_for(self, target: Mobject) -> SurroundingRectangle:
+        if self._pool:
+            return self._fit(self._pool.pop(), target)
+        box = SurroundingRectangle(target, **self.style)
+        box.set_z_index(self.z_index)
+        return box
+
+    def _detach(self, keys: Iterable[int]) -> List[SurroundingRectangle]:
+        return [self._boxes.pop(key)[1] for key in keys]
+
+    @property
+    def active(self) -> List[SurroundingRectangle]:
+        return [box for _, box in self._boxes.values()]
+
+    def clear_boxes(self, fade_time: float = 0.2):
+        if self._boxes:
+            boxes = self._detach(list(self._boxes))
+            self._pool.extend(boxes)
+            self.scene.play(AnimationGroup(*(FadeOut(b) for b in boxes), lag_ratio=0.0, run_time=fade_time))
 
-    def _build_group(self, targets: Iterable) -> VGroup:
-        boxes: List[SurroundingRectangle] = []
-        for t in targets:
-            rect = SurroundingRectangle(t, **self.style)
-            rect.set_z_index(self.z_index)
-            boxes.append(rect)
-        return VGroup(*boxes)
-
-    def clear(self, fade_time: float = 0.2):
-        if self.active:
-            self.scene.play(AnimationGroup(*(FadeOut(m) for m in self.active), lag_ratio=0.0, run_time=fade_time))
-            for m in list(self.active):
-                try:
-                    self.scene.remove(m)
-                except Exception:
-                    pass
-            self.active = None
-
-    def activate(self, targets: Iterable, run_time: float = 0.25):
-        self.clear(fade_time=0.1)
-        group = self._build_group(targets)
-        self.active = group
-        self.scene.add(group)
-        self.scene.play(AnimationGroup(*(Create(m) for m in group), lag_ratio=0.05, run_time=run_time))
+    @traced("HighlightEngine.activate")
+    def activate(self, targets: Iterable[Mobject], run_time: float = 0.25):
+        """Box exactly `targets`; kept targets keep their box, only the difference is animated."""
+        wanted = {id(t): t for t in targets if t is not None}
+        for key in wanted.keys() & self._boxes.keys():  # still boxed: follow the target if it moved
+            self._fit(self._boxes[key][1], wanted[key])
+        gone = self._detach([key for key in self._boxes if key not in wanted])
+        new = []
+        for key, target in wanted.items():
+            if key not in self._boxes:
+                box = self._box_for(target)
+                self._boxes[key] = (target, box)
+                new.append(box)
+        self._pool.extend(gone)  # only after the new boxes are taken: these are still fading out
+        if not gone and not new:
+            return
+        self.scene.add(*new)
+        self.scene.play(AnimationGroup(*(FadeOut(b) for b in gone), *(Create(b) for b in new),
+                                       lag_ratio=0.05, run_time=run_time))
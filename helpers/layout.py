@@ -0,0 +1,70 @@
+# [CHECKPOINT-1..5 Active; Mirrors CHECKPOINTS.md]
+# WHY: Steps items, captions and point labels used to be built, measured and rescaled inside
+# the animation loop (each Steps item placed from the one rendered before it). Everything
+# they depend on is known before the first step (spec, axes, anchors), so one layout pass
+# measures each mobject once, resolves its final position/scale (overflow and the ≥28px
+# readability guard included, CHECKPOINT-2) and the loop only plays the result.
+# Manim CE v0.19.0-compatible.
+from __future__ import annotations
+
+from typing import List, Optional, Sequence
+
+import numpy as np
+from manim import DL, DOWN, LEFT, UL, Mobject, VGroup, config
+
+MIN_LABEL_PX = 28
+
+
+def guard_readable(mob: Mobject, min_px: int = MIN_LABEL_PX):
+    assert mob.height * 1080 >= min_px, (
+        f"[GUARD] Too small: {mob.height * 1080:.1f}px < {min_px}px"
+    )
+
+
+def fit_width(mob: Mobject, max_width: float) -> Mobject:
+    """Shrink (never grow) to max_width."""
+    if mob.width > max_width:
+        mob.set_width(max_width)
+    return mob
+
+
+def stack_below(anchor: Mobject, items: Sequence[Mobject], first_gap: float = 0.22, gap: float = 0.18,
+                max_right: Optional[float] = None, max_bottom: Optional[float] = None,
+                min_px: int = MIN_LABEL_PX) -> List[Mobject]:
+    """Place items top-to-bottom under anchor's bottom-left corner, left-aligned, in place.
+    If the stack would cross max_right / max_bottom it is shrunk uniformly about its top-left."""
+    if not items:
+        return []
+    stack = VGroup(*items).arrange(DOWN, aligned_edge=LEFT, buff=gap)
+    top_left = anchor.get_corner(DL) + DOWN * first_gap
+    stack.move_to(top_left, aligned_edge=UL)
+    factor = 1.0
+    if max_right is not None and stack.get_right()[0] > max_right:
+        factor = min(factor, (max_right - top_left[0]) / stack.width)
+    if max_bottom is not None and stack.get_bottom()[1] < max_bottom:
+        factor = min(factor, (top_left[1] - max_bottom) / stack.height)
+    if factor < 1.0:
+        stack.scale(factor, about_point=top_left)
+    for item in items:
+        guard_readable(item, min_px)
+    return list(items)
+
+
+def place_caption(caption: Mobject, position, max_width: float, min_px: int = MIN_LABEL_PX) -> Mobject:
+    fit_width(caption, max_width).move_to(position)
+    guard_readable(caption, min_px)
+    return caption
+
+
+def place_label(label: Mobject, marker: Mobject, at, direction, buff: float,
+                min_px: int = MIN_LABEL_PX) -> Mobject:
+    """label.next_to(marker, direction) as if marker were centered at `at` (marker is not moved)."""
+    edge = np.asarray(at, dtype=float) + (marker.get_critical_point(direction) - marker.get_center())
+    label.next_to(edge, direction, buff=buff)
+    guard_readable(label, min_px)
+    return label
+
+
+def frame_limits(margin: float = 0.25):
+    """(max_right, max_bottom) of the visible frame, `margin` inside its edges."""
+    return config.frame_width / 2 - margin, -config.frame_height / 2 + margin
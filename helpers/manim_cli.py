@@ -0,0 +1,65 @@
+# [CHECKPOINT-1..5 Active; Mirrors CHECKPOINTS.md]
+# WHY: Render drivers run each job as its own `manim render` process (one worker per
+# section/spec) and need the movie path back without parsing manim's console output.
+from __future__ import annotations
+
+import glob
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Dict, Iterable, Optional
+
+from helpers.ffmpeg_tools import BASE_DIR
+
+# manim.cfg turns preview on; workers must never open a player.
+_WORKER_CFG = "[CLI]\npreview = False\n"
+
+
+def worker_config_file() -> str:
+    path = os.path.join(tempfile.gettempdir(), "fa_worker_manim.cfg")
+    if not os.path.exists(path):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(_WORKER_CFG)
+    return path
+
+
+def render_scene(
+    scene_file: str,
+    scene_name: str,
+    output_name: str,
+    env: Optional[Dict[str, str]] = None,
+    extra_args: Iterable[str] = (),
+    media_dir: str = "media",
+    log_path: Optional[str] = None,
+    expect_movie: bool = True,
+) -> str:
+    """Render one scene in a fresh `manim` process; returns the absolute movie path ("" for --dry_run jobs)."""
+    cmd = [
+        sys.executable, "-m", "manim", "render",
+        "--config_file", worker_config_file(),
+        "--media_dir", media_dir,
+        "-o", output_name,
+        *extra_args,
+        scene_file, scene_name,
+    ]
+    run_env = dict(os.environ, **(env or {}))
+    log = open(log_path, "w", encoding="utf-8") if log_path else subprocess.DEVNULL
+    try:
+        proc = subprocess.run(cmd, cwd=BASE_DIR, env=run_env, stdout=log, stderr=subprocess.STDOUT)
+    finally:
+        if log_path:
+            log.close()
+    if proc.returncode != 0:
+        hint = f" (log: {log_path})" if log_path else ""
+        raise RuntimeError(f"manim render failed for {output_name} (exit {proc.returncode}){hint}")
+    return find_movie(scene_file, output_name, media_dir) if expect_movie else ""
+
+
+def find_movie(scene_file: str, output_name: str, media_dir: str = "media") -> str:
+    module = os.path.splitext(os.path.basename(scene_file))[0]
+    root = os.path.join(BASE_DIR, media_dir, "videos", module)
+    hits = glob.glob(os.path.join(root, "*", output_name + ".mp4"))
+    if not hits:
+        raise FileNotFoundError(f"No movie named {output_name}.mp4 under {root}")
+    return os.path.abspath(max(hits, key=os.path.getmtime))
@@ -0,0 +1,206 @@
+# [CHECKPOINT-1..5 Active; Mirrors CHECKPOINTS.md]
+# WHY: Section handoff state lived in ad-hoc scene attributes, stray dots were found by
+# scanning every scene mobject on every step, and leaks (FM-7) or lingering updaters (FM-2)
+# were only caught when someone flipped DEBUG. The registry records every mobject added to
+# the scene, tagged with the section that added it; handoff state is a named role
+# (Role descriptors: `self.caption = ...` registers, `self.caption` looks up). Type lookups
+# (on_scene(Dot)) come from an index kept by scene.add/remove. At each section boundary it
+# reconciles with scene.mobjects once and reports mobjects left on screen without a role
+# (orphans), mobjects with updaters still attached, and the point-array memory on screen;
+# with strict=True (DEBUG) any finding fails the render like the old [GUARD] asserts.
+# Manim CE v0.19.0-compatible (Cairo + OpenGL mobjects).
+from __future__ import annotations
+
+import functools
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Type
+
+from manim import Mobject, logger
+
+_CAIRO_ARRAYS = ("points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas")
+
+
+def family_nbytes(mob: Mobject, seen: Optional[set] = None) -> int:
+    """Bytes held by the point/color arrays of mob's family (each member counted once in `seen`)."""
+    seen = set() if seen is None else seen
+    total = 0
+    for m in mob.get_family():
+        if id(m) in seen:
+            continue
+        seen.add(id(m))
+        data = getattr(m, "data", None)
+        arrays = data.values() if isinstance(data, dict) else (getattr(m, a, None) for a in _CAIRO_ARRAYS)
+        total += sum(getattr(a, "nbytes", 0) for a in arrays)
+    return total
+
+
+def _describe(mob: Mobject, role: Optional[str], section: Optional[str]) -> str:
+    name = role or type(mob).__name__
+    return f"{name}@{section}" if section else name
+
+
+class _Entry:
+    __slots__ = ("mob", "section", "role")
+
+    def __init__(self, mob: Mobject, section: Optional[str], role: Optional[str] = None):
+        self.mob = mob
+        self.section = section
+        self.role = role
+
+
+class MobjectRegistry:
+    """Mobjects of one scene by role, section and type; audits at section boundaries."""
+
+    def __init__(self, scene, strict: bool = False):
+        self.scene = scene
+        self.strict = strict
+        self.current: Optional[str] = None
+        self.reports: List[dict] = []
+        self._entries: Dict[int, _Entry] = {}              # id -> entry (added or holding a role)
+        self._roles: Dict[str, Mobject] = {}
+        self._by_type: Dict[type, Dict[int, Mobject]] = {}  # top-level scene mobjects by class
+        self._dirty = False  # a submobject was removed: its group was split, rebuild on next lookup
+        add, remove = scene.add, scene.remove
+
+        def tracked_add(*mobjects):
+            result = add(*mobjects)
+            self._added(mobjects)
+            return result
+
+        def tracked_remove(*mobjects):
+            result = remove(*mobjects)
+            self._removed(mobjects)
+            return result
+        scene.add, scene.remove = tracked_add, tracked_remove
+
+    # ---- roles ----
+    def register(self, role: str, mob: Mobject) -> Mobject:
+        """Name mob as the holder of `role` (section handoff state); replaces the previous holder."""
+        old = self._roles.get(role)
+        if old is not None and old is not mob and id(old) in self._entries:
+            self._entries[id(old)].role = None
+        entry = self._entries.get(id(mob))
+        if entry is None:
+            entry = self._entries[id(mob)] = _Entry(mob, self.current)
+        entry.role = role
+        self._roles[role] = mob
+        return mob
+
+    def __getitem__(self, role: str) -> Mobject:
+        return self._roles[role]
+
+    def get(self, role: str, default=None):
+        return self._roles.get(role, default)
+
+    # ---- lookups ----
+    def on_scene(self, cls: Type[Mobject] = Mobject) -> List[Mobject]:
+        """Top-level scene mobjects that are instances of cls (index lookup, no scene scan)."""
+        if self._dirty:
+            self._reconcile()
+        return [m for t, mobs in self._by_type.items() if issubclass(t, cls) for m in mobs.values()]
+
+    def in_section(self, section: str) -> List[Mobject]:
+        return [e.mob for e in self._entries.values() if e.section == section]
+
+    # ---- scene hooks ----
+    def _added(self, mobjects):
+        for mob in mobjects:
+            entry = self._entries.get(id(mob))
+            if entry is None:
+                self._entries[id(mob)] = _Entry(mob, self.current)
+            self._by_type.setdefault(type(mob), {})[id(mob)] = mob
+
+    def _removed(self, mobjects):
+        for mob in mobjects:
+            if self._by_type.get(type(mob), {}).pop(id(mob), None) is None:
+                self._dirty = True
+
+    def drop_top_level(self, mob: Mobject):
+        """Take mob off the scene's top-level list only; it stays on screen through the group
+        holding it (or its members). For what a play added on top: a FadeIn item already put in
+        its panel, a temporary VGroup that was only pulsed. scene.remove() would split those groups."""
+        scene = self.scene
+        scene.mobjects = [m for m in scene.mobjects if m is not mob]
+        if getattr(scene, "moving_mobjects", None):  # Cairo
+            scene.moving_mobjects = [m for m in scene.moving_mobjects if m is not mob]
+        self._by_type.get(type(mob), {}).pop(id(mob), None)
+
+    # ---- section boundaries ----
+    @contextmanager
+    def section(self, name: str):
+        previous, self.current = self.current, name
+        try:
+            yield
+        finally:
+            self.current = previous
+        self.audit(name)
+
+    def _reconcile(self):
+        """Rebuild the type index from scene.mobjects (remove() of a submobject splits its group)."""
+        self._by_type = {}
+        for mob in self.scene.mobjects:
+            self._by_type.setdefault(type(mob), {})[id(mob)] = mob
+            if id(mob) not in self._entries:
+                self._entries[id(mob)] = _Entry(mob, self.current)
+        # Forget what is neither on screen nor a role: the registry must not keep leaks alive.
+        on = {id(m) for m in self.scene.mobjects}
+        self._entries = {k: e for k, e in self._entries.items() if k in on or e.role is not None}
+        self._dirty = False
+
+    def audit(self, section: str) -> dict:
+        """Orphans, lingering updaters and point memory after `section`; logs (strict: raises)."""
+        self._reconcile()
+        orphans, updaters, seen = [], [], set()
+        point_bytes = 0
+        for mob in self.scene.mobjects:
+            entry = self._entries[id(mob)]
+            if entry.role is None:
+                orphans.append(_describe(mob, None, entry.section))
+            for m in mob.get_family():
+                if m.updaters:
+                    e = self._entries.get(id(m))
+                    updaters.append(_describe(m, e.role if e else None, e.section if e else entry.section))
+            point_bytes += family_nbytes(mob, seen)
+        report = {"section": section, "mobjects": len(self.scene.mobjects), "family": len(seen),
+                  "orphans": orphans, "updaters": updaters, "point_bytes": point_bytes}
+        self.reports.append(report)
+        logger.info(f"Registry [{section}]: {report['mobjects']} on screen ({len(seen)} with submobjects), "
+                    f"{point_bytes / 1024:.0f} KiB point data, {len(orphans)} orphan(s), "
+                    f"{len(updaters)} with updaters")
+        problems = []
+        if orphans:
+            problems.append(f"orphaned mobjects (FM-7): {', '.join(orphans)}")
+        if updaters:
+            problems.append(f"lingering updaters (FM-2): {', '.join(updaters)}")
+        for p in problems:
+            if self.strict:
+                raise AssertionError(f"[GUARD] After {section}: {p}")
+            logger.warning(f"Registry [{section}]: {p}")
+        return report
+
+
+class Role:
+    """Scene attribute stored in scene.registry: `caption = Role()` in the class body."""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, scene, owner=None):
+        if scene is None:
+            return self
+        try:
+            return scene.registry[self.name]
+        except KeyError:
+            raise AttributeError(f"{type(scene).__name__}.{self.name} has not been set") from None
+
+    def __set__(self, scene, mob):
+        scene.registry.register(self.name, mob)
+
+
+def tracked_section(fn):
+    """Decorator for a scene's section methods: tag what they add, audit when they return."""
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        with self.registry.section(fn.__name__):
+            return fn(self, *args, **kwargs)
+    return wrapper
@@ -0,0 +1,216 @@
+# [CHECKPOINT-1..5 Active; Mirrors CHECKPOINTS.md]
+# WHY: Every voiceover beat calls scene.add_sound(); manim converts that MP3 to WAV, decodes
+# it with pydub and overlays it onto the whole growing track (one copy of the track per
+# clip), then exports a WAV, re-encodes AAC and remuxes the movie at the end. Here
+# add_sound() only records (clip, offset, gain). After the silent movie is combined, the
+# clips are decoded in parallel, summed into one PCM buffer with NumPy at their offsets,
+# encoded once and muxed onto the video by stream copy. The clip list is kept next to the
+# movie (<movie>.narration.json) with the encoded track, so a re-mux is a stream copy.
+# The manifest also logs each voiceover beat (key, clip, window, duration, narr_time caps)
+# for audio-only re-voicing (helpers/revoice.py).
+# Usage (repo root):  python -m helpers.narration_track <movie.mp4> [--rebuild]
+# NARRATION_PREMIX in config.py (FA_NARRATION_PREMIX=0 -> manim's own mixing).
+# Manim CE v0.19.0-compatible (Cairo + OpenGL renderers).
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence
+
+from helpers.ffmpeg_tools import find_ffmpeg, run_ffmpeg
+
+_project_config = importlib.import_module("config")  # project config.py (not manim's config)
+NARRATION_PREMIX = getattr(_project_config, "NARRATION_PREMIX", True)
+NARRATION_RATE = getattr(_project_config, "NARRATION_RATE", 48000)
+MANIFEST_VERSION = 1
+# Track codec per container (same choices as manim's own mux).
+_CODECS = {".mp4": ("aac", ".m4a"), ".mov": ("aac", ".m4a"), ".webm": ("libvorbis", ".ogg")}
+
+
+def manifest_path(movie: str) -> str:
+    return movie + ".narration.json"
+
+
+def track_path(movie: str) -> str:
+    _, ext = _CODECS.get(os.path.splitext(movie)[1].lower(), ("aac", ".m4a"))
+    return os.path.splitext(movie)[0] + ".narration" + ext
+
+
+def decode_pcm(path: str, rate: int = NARRATION_RATE, ffmpeg: Optional[str] = None):
+    """One clip as mono float32 samples at `rate`."""
+    import numpy as np
+    proc = run_ffmpeg(["-i", path, "-f", "s16le", "-acodec", "pcm_s16le", "-ac", "1", "-ar", str(rate), "pipe:1"],
+                      ffmpeg)
+    return np.frombuffer(proc.stdout, dtype=np.int16).astype(np.float32) / 32768.0
+
+
+def mix(clips: Sequence[dict], rate: int = NARRATION_RATE, duration: Optional[float] = None,
+        ffmpeg: Optional[str] = None):
+    """Every clip summed in at round(time * rate); gain in dB like manim's add_sound(). Returns int16
+    samples covering `duration` (video length) or, if None, the end of the last clip."""
+    import numpy as np
+    with ThreadPoolExecutor(max_workers=min(8, len(clips)) or 1) as pool:
+        decoded = list(pool.map(lambda c: decode_pcm(c["path"], rate, ffmpeg), clips))
+    starts = [int(round(c["time"] * rate)) for c in clips]
+    end = max((s + len(pcm) for s, pcm in zip(starts, decoded)), default=0)
+    length = int(math.ceil(duration * rate)) if duration is not None else end
+    track = np.zeros(length, dtype=np.float32)
+    for clip, start, pcm in zip(clips, starts, decoded):
+        n = min(len(pcm), length - start)
+        if n <= 0:
+            continue  # starts after the video ends (manim's -shortest drops it too)
+        gain = clip.get("gain")
+        track[start:start + n] += pcm[:n] * (10.0 ** (gain / 20.0)) if gain else pcm[:n]
+    np.clip(track, -1.0, 1.0, out=track)
+    return (track * 32767.0).astype(np.int16)
+
+
+def encode_track(samples, out_path: str, rate: int = NARRATION_RATE, ffmpeg: Optional[str] = None) -> str:
+    """Encode mono int16 samples once (codec from the track's extension); written atomically."""
+    codec = "libvorbis" if out_path.endswith(".ogg") else "aac"
+    part = out_path + ".part" + os.path.splitext(out_path)[1]
+    try:
+        run_ffmpeg(["-f", "s16le", "-ar", str(rate), "-ac", "1", "-i", "pipe:0",
+                    "-c:a", codec, "-b:a", "192k", part], ffmpeg, input=samples.tobytes())
+        os.replace(part, out_path)
+    finally:
+        if os.path.exists(part):
+            os.remove(part)
+    return out_path
+
+
+def mux(movie: str, track: str, ffmpeg: Optional[str] = None) -> str:
+    """Replace movie's audio with `track`: video and audio both stream-copied (no re-encode)."""
+    part = movie + ".part" + os.path.splitext(movie)[1]
+    try:
+        run_ffmpeg(["-i", movie, "-i", track, "-map", "0:v:0", "-map", "1:a:0", "-c", "copy",
+                    "-shortest", part], ffmpeg)
+        os.replace(part, movie)
+    finally:
+        if os.path.exists(part):
+            os.remove(part)
+    return movie
+
+
+def write_manifest(movie: str, clips: Sequence[dict], duration: Optional[float], rate: int = NARRATION_RATE,
+                   timeline: Optional[dict] = None):
+    data = {"version": MANIFEST_VERSION, "rate": rate, "duration": duration, "clips": list(clips)}
+    if timeline is not None:
+        data["timeline"] = timeline
+    tmp = manifest_path(movie) + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1)
+    os.replace(tmp, manifest_path(movie))
+
+
+def read_manifest(movie: str) -> dict:
+    with open(manifest_path(movie), "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version") != MANIFEST_VERSION:
+        raise SystemExit(f"{manifest_path(movie)}: version {data.get('version')} (expected {MANIFEST_VERSION})")
+    return data
+
+
+def build(movie: str, clips: Sequence[dict], duration: Optional[float], rate: int = NARRATION_RATE,
+          ffmpeg: Optional[str] = None, timeline: Optional[dict] = None) -> str:
+    """Mix, encode and mux the narration of `movie`; records the clip list for later re-muxes."""
+    track = encode_track(mix(clips, rate, duration, ffmpeg), track_path(movie), rate, ffmpeg)
+    write_manifest(movie, clips, duration, rate, timeline)
+    return mux(movie, track, ffmpeg)
+
+
+class NarrationRecorder:
+    """Collects the scene's add_sound() calls instead of mixing them, and its voiceover beats."""
+
+    def __init__(self):
+        self.clips: List[dict] = []
+        self.beats: List[dict] = []
+        self.beat: Optional[dict] = None  # voiceover block still running
+
+    def add_sound(self, sound_file: str, time: Optional[float] = None, gain: Optional[float] = None, **kwargs):
+        from manim.utils.sounds import get_full_sound_file_path
+        self.clips.append({"path": str(get_full_sound_file_path(sound_file)),
+                           "time": round(float(time or 0.0), 6), "gain": gain})
+
+    def begin_beat(self, key: str, text: str, section: Optional[str], start: float, tracker):
+        """A voiceover clip was just added: its block runs until end_beat()."""
+        self.beat = {"key": key, "text": text, "section": section, "clip": len(self.clips) - 1,
+                     "start": round(start, 6), "duration": round(float(tracker.duration), 6), "narr_time": []}
+        tracker.narr_uses = self.beat["narr_time"]  # utils.narr_time() logs its (min_rt, cap, extra)
+        self.beats.append(self.beat)
+
+    def end_beat(self, end: float):
+        """After the trailing voiceover wait: [start, end) is the beat's window in the movie."""
+        if self.beat is not None:
+            self.beat["end"] = round(end, 6)
+            self.beat = None
+
+
+def install_narration_track(scene) -> Optional[NarrationRecorder]:
+    """Pre-mix the scene's sounds into one track if NARRATION_PREMIX is on; call from setup()."""
+    from manim import config
+    extension = config.movie_file_extension
+    if (not NARRATION_PREMIX or config.dry_run or not config.write_to_movie or config.format == "gif"
+            or extension not in _CODECS):
+        return None
+    try:
+        find_ffmpeg()
+    except FileNotFoundError:
+        return None  # manim mixes through PyAV instead
+    renderer = scene.renderer
+    writer = renderer.file_writer
+    rec = NarrationRecorder()
+    writer.add_sound = rec.add_sound
+    from helpers.timeline import beat_key, hook_voiceover_text
+
+    def log_beat(text, tracker):  # the clip starts now: attaching it does not advance the clock
+        section = getattr(getattr(scene, "registry", None), "current", None)
+        rec.begin_beat(beat_key(scene, text), text, section, float(renderer.time), tracker)
+    hook_voiceover_text(scene, log_beat)
+
+    wait_for_voiceover = scene.wait_for_voiceover
+
+    def logged_wait_for_voiceover():
+        try:
+            return wait_for_voiceover()
+        finally:
+            rec.end_beat(float(renderer.time))
+    scene.wait_for_voiceover = logged_wait_for_voiceover
+
+    finish = writer.finish
+
+    def premixed_finish():
+        result = finish()  # includes_sound stays False: the combined movie is silent
+        movie = str(writer.movie_file_path)
+        if rec.clips and os.path.exists(movie):
+            spec = getattr(scene, "spec", None)
+            timeline = {"frame_rate": config.frame_rate, "spec": spec.to_dict() if spec is not None else None,
+                        "beats": rec.beats}
+            build(movie, rec.clips, float(renderer.time), timeline=timeline)
+        return result
+    writer.finish = premixed_finish
+    scene._narration = rec
+    return rec
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Re-mux a movie's pre-mixed narration (stream copy).")
+    ap.add_argument("movie")
+    ap.add_argument("--rebuild", action="store_true", help="re-mix the track from the clips (e.g. new TTS clips)")
+    ap.add_argument("--ffmpeg", default=None)
+    args = ap.parse_args(argv)
+    data = read_manifest(args.movie)
+    track = track_path(args.movie)
+    if args.rebuild or not os.path.exists(track):
+        build(args.movie, data["clips"], data["duration"], data["rate"], args.ffmpeg, data.get("timeline"))
+    else:
+        mux(args.movie, track, args.ffmpeg)
+    print(f"{len(data['clips'])} clip(s) -> {args.movie}")
+
+
+if __name__ == "__main__":
+    main()
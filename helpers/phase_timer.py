@@ -0,0 +1,143 @@
+# [CHECKPOINT-1..5 Active; Mirrors CHECKPOINTS.md]
+# WHY: Where does a render's wall time go? Opt-in (FA_BENCH=<out.json>) timers wrap the
+# TTS, TeX, frame-render and encode entry points of ONE manim process and dump exclusive
+# per-phase seconds, frame count and peak RSS at exit. Used by helpers/benchmark.py.
+# Exclusive: a nested phase pauses its parent (e.g. TeX inside a play counts as "tex").
+from __future__ import annotations
+
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+BENCH_ENV = "FA_BENCH"
+PHASES = ("tts", "tex", "render", "encode")
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process (MB); None where it can't be read."""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024  # bytes on macOS, KB elsewhere
+    except ImportError:  # Windows
+        try:
+            import psutil
+            return psutil.Process().memory_info().peak_wset / (1024 * 1024)
+        except (ImportError, AttributeError):
+            return None
+
+
+class PhaseTimer:
+    """Stack-based exclusive timer; only main-thread spans count (worker threads nest under them)."""
+
+    def __init__(self):
+        self.t0 = time.perf_counter()
+        self.seconds: Dict[str, float] = {p: 0.0 for p in PHASES}
+        self.frames = 0
+        self._stack: List[str] = []
+        self._last = self.t0
+
+    def enter(self, phase: str):
+        now = time.perf_counter()
+        if self._stack:
+            self.seconds[self._stack[-1]] += now - self._last
+        self._stack.append(phase)
+        self._last = now
+
+    def exit(self):
+        now = time.perf_counter()
+        self.seconds[self._stack.pop()] += now - self._last
+        self._last = now
+
+    def wrap(self, phase: str, fn):
+        main = threading.main_thread()
+
+        @functools.wraps(fn)
+        def timed(*args, **kwargs):
+            if threading.current_thread() is not main:
+                return fn(*args, **kwargs)
+            self.enter(phase)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.exit()
+        return timed
+
+    def report(self) -> dict:
+        total = time.perf_counter() - self.t0
+        phases = {p: round(s, 4) for p, s in self.seconds.items()}
+        phases["other"] = round(max(0.0, total - sum(self.seconds.values())), 4)
+        return {"scene_seconds": round(total, 4), "phases": phases,
+                "frames": self.frames, "peak_rss_mb": peak_rss_mb()}
+
+    def dump(self, path: str):
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=1)
+        os.replace(tmp, path)
+
+
+_active: Optional[PhaseTimer] = None  # the timer the shared (class/module-level) wrappers feed
+
+
+def _wrap_shared(owner, name: str, phase: str):
+    """Time owner.<name> for whichever timer is active. Installed once per process: a warm
+    render server installs a timer per render, and these entry points outlive the scene."""
+    fn = getattr(owner, name)
+    if getattr(fn, "_phase_timed", False):
+        return
+    main = threading.main_thread()
+
+    @functools.wraps(fn)
+    def timed(*args, **kwargs):
+        timer = _active
+        if timer is None or threading.current_thread() is not main:
+            return fn(*args, **kwargs)
+        timer.enter(phase)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            timer.exit()
+    timed._phase_timed = True
+    setattr(owner, name, timed)
+
+
+def install_phase_timer(scene) -> Optional[PhaseTimer]:
+    """Wrap this process's phase entry points if FA_BENCH is set; call at the top of setup()."""
+    global _active
+    out_path = os.environ.get(BENCH_ENV)
+    if not out_path:
+        _active = None  # a warm process: stop feeding an earlier render's timer
+        return None
+    from manim.mobject.text.tex_mobject import SingleStringMathTex
+    import helpers.tex_cache as tex_cache
+    from helpers.piper_service import PiperService
+
+    timer = _active = PhaseTimer()
+    # TTS: pre-synthesis batch (bound by name in the scene module) + per-beat lookups/synthesis.
+    _wrap_shared(PiperService, "generate_from_text", "tts")
+    scene_module = sys.modules.get(type(scene).__module__)
+    if hasattr(scene_module, "presynthesize"):
+        _wrap_shared(scene_module, "presynthesize", "tts")
+    # TeX: batched pre-pass + every TeX -> SVG -> mobject build (MathTex substrings nest).
+    _wrap_shared(tex_cache, "precompile", "tex")
+    _wrap_shared(SingleStringMathTex, "__init__", "tex")
+    # Render: everything inside renderer.play not claimed by a nested phase.
+    _wrap_shared(scene.renderer, "play", "render")  # the OpenGL renderer is reused across renders
+    # Encode: frame readback/hand-off, partial-movie flush, final combine.
+    writer = scene.renderer.file_writer
+    write_frame = writer.write_frame
+
+    def counted_write_frame(frame, num_frames=1):
+        timer.frames += num_frames
+        return write_frame(frame, num_frames)
+    writer.write_frame = timer.wrap("encode", counted_write_frame)
+    writer.end_animation = timer.wrap("encode", writer.end_animation)
+    writer.finish = timer.wrap("encode", writer.finish)
+    atexit.register(timer.dump, out_path)
+    return timer
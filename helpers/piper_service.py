@@ -0,0 +1,182 @@
+# [CHECKPOINT-1..5 Active; Mirrors CHECKPOINTS.md]
+# WHY: Moved out of utils.py so the drawing helpers (and config) import without
+# manim_voiceover; utils.PiperService still resolves here (lazily).
+# Manim CE v0.19.0-compatible.
+from __future__ import annotations
+
+import json
+import logging
+import os
+import subprocess
+import tempfile
+import wave
+
+from manim_voiceover.modify_audio import get_duration
+from manim_voiceover.services.base import SpeechService
+
+from helpers.audio_cache import AudioCache
+from helpers.ffmpeg_tools import find_ffmpeg
+from helpers.piper_worker import PiperWorkerError, PiperWorkerPool, piper_command
+
+logger = logging.getLogger("manim")
+
+
+class PiperService(SpeechService):
+    """Uses piper.exe to synthesize WAV, then converts to MP3 via bundled ffmpeg.
+    workers > 0 keeps that many resident Piper processes (helpers/piper_worker.py);
+    the one-shot subprocess path stays as the fallback. stream=True makes that one-shot
+    path pipe Piper's raw PCM into ffmpeg instead of writing a WAV first.
+    Clips are content-addressed in helpers/audio_cache.py; cache_max_bytes caps its size (LRU)."""
+    def __init__(self, piper_path: str, model_path: str, speaker: int | None = None, tempo: float = 1.0,
+                 workers: int = 0, cache_max_bytes: int | None = None, stream: bool = False, **kwargs):
+        super().__init__(**kwargs)
+        self.piper_path = piper_path
+        self.model_path = model_path
+        self.speaker = speaker
+        self.tempo = float(tempo)
+        self.workers = int(workers)
+        self.stream = bool(stream)
+        if not os.path.exists(self.piper_path):
+            raise FileNotFoundError(f"Piper EXE not found: {self.piper_path}")
+        if not os.path.exists(self.model_path):
+            raise FileNotFoundError(f"Piper model not found: {self.model_path}")
+        base_dir = os.path.dirname(self.piper_path)
+        # Bundled build next to Piper (setup_piper.bat), else ffmpeg on PATH (Linux/macOS).
+        bundled = [os.path.join(base_dir, "ffmpeg", "bin", n) for n in ("ffmpeg.exe", "ffmpeg")]
+        self.ffmpeg_path = next((p for p in bundled if os.path.exists(p)), None) or find_ffmpeg()
+        self._pool = PiperWorkerPool(piper_path, model_path, str(self.cache_dir), size=self.workers) if self.workers > 0 else None
+        self.cache_max_bytes = cache_max_bytes
+        self.audio_cache = AudioCache(self.cache_dir, max_bytes=cache_max_bytes)
+
+    def __getstate__(self):
+        # Worker processes are not picklable; a copy sent to a process pool runs one-shot.
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        return state
+
+    def _ffmpeg_atempo_args(self):
+        t = self.tempo
+        if abs(t - 1.0) < 1e-3: return []
+        if 0.5 <= t <= 2.0: return ["-af", f"atempo={t}"]
+        import math
+        a = math.sqrt(max(0.01, min(4.0, t)))
+        return ["-af", f"atempo={a},atempo={a}"]
+
+    def _cache_for(self, cache_dir) -> AudioCache:
+        if cache_dir is None or os.path.abspath(cache_dir) == os.path.abspath(self.cache_dir):
+            return self.audio_cache
+        return AudioCache(cache_dir, max_bytes=self.cache_max_bytes)
+
+    @property
+    def voice(self) -> str:
+        """Voice id for duration calibration (helpers/estimated_speech.py)."""
+        name = os.path.basename(self.model_path)
+        return name if self.speaker is None else f"{name}#{self.speaker}"
+
+    def cache_key(self, text: str, cache: AudioCache | None = None) -> str:
+        """Content address: text + model file hash + speaker + tempo."""
+        return (cache or self.audio_cache).key(text, self.model_path, self.speaker, self.tempo)
+
+    def _result(self, text: str, mp3_path: str, cache_dir) -> dict:
+        rel_mp3 = os.path.relpath(mp3_path, cache_dir).replace("\\", "/")
+        return {"path": mp3_path, "original_audio": rel_mp3, "input_data": {"input_text": text}}
+
+    def is_cached(self, text: str, cache_dir: str | None = None) -> bool:
+        """True when the manifest holds this line's clip (no Piper/ffmpeg needed)."""
+        cache = self._cache_for(cache_dir)
+        return cache.peek(self.cache_key(" ".join(text.split()), cache)) is not None
+
+    def cached_duration(self, text: str, cache_dir: str | None = None) -> float | None:
+        """Clip length from the manifest (no audio decode); None on a miss."""
+        cache = self._cache_for(cache_dir)
+        entry = cache.peek(self.cache_key(" ".join(text.split()), cache))
+        return entry["duration"] if entry else None
+
+    def _model_sample_rate(self) -> int:
+        """Piper's raw output carries no header; the rate lives in <model>.onnx.json."""
+        try:
+            with open(self.model_path + ".json", "r", encoding="utf-8") as f:
+                return int(json.load(f)["audio"]["sample_rate"])
+        except (OSError, KeyError, ValueError):
+            return 22050
+
+    def _piper_cmd(self, *out_args: str) -> list[str]:
+        cmd = piper_command(self.piper_path) + ["--model", self.model_path, *out_args]
+        if self.speaker is not None:
+            cmd += ["--speaker", str(self.speaker)]
+        return cmd
+
+    def _mp3_args(self, part_path: str) -> list[str]:
+        return self._ffmpeg_atempo_args() + ["-acodec", "libmp3lame", "-b:a", "192k", "-f", "mp3", part_path]
+
+    def _stream_to_mp3(self, text: str, part_path: str) -> int:
+        """Piper --output-raw piped straight into ffmpeg's stdin; both run concurrently, no WAV on disk."""
+        sample_rate = self._model_sample_rate()
+        with tempfile.TemporaryFile() as piper_err, tempfile.TemporaryFile() as ff_err:
+            piper = subprocess.Popen(self._piper_cmd("--output-raw"), stdin=subprocess.PIPE,
+                                     stdout=subprocess.PIPE, stderr=piper_err)
+            ff_cmd = [self.ffmpeg_path, "-y", "-v", "error", "-f", "s16le", "-ar", str(sample_rate),
+                      "-ac", "1", "-i", "pipe:0"] + self._mp3_args(part_path)
+            ff = subprocess.Popen(ff_cmd, stdin=piper.stdout, stderr=ff_err)
+            piper.stdout.close()  # ffmpeg owns the read end; Piper gets SIGPIPE if ffmpeg dies
+            try:
+                piper.stdin.write(text.encode("utf-8"))
+                piper.stdin.close()
+            except BrokenPipeError:
+                pass
+            ff_rc, piper_rc = ff.wait(), piper.wait()
+            if piper_rc != 0 or ff_rc != 0:
+                piper_err.seek(0)
+                ff_err.seek(0)
+                raise RuntimeError(f"Streamed Piper->ffmpeg failed (piper exit {piper_rc}, ffmpeg exit {ff_rc}).\nPiper STDERR:\n{piper_err.read().decode(errors='ignore')}\nffmpeg STDERR:\n{ff_err.read().decode(errors='ignore')}")
+        return sample_rate
+
+    def _wav_to_mp3(self, wav_path: str, part_path: str) -> int:
+        with wave.open(wav_path, "rb") as w:
+            sample_rate = w.getframerate()
+        ff = [self.ffmpeg_path, "-y", "-v", "error", "-i", wav_path] + self._mp3_args(part_path)
+        proc2 = subprocess.run(ff, capture_output=True)
+        os.remove(wav_path)
+        if proc2.returncode != 0:
+            raise RuntimeError(f"ffmpeg failed converting WAV->MP3.\nSTDOUT:\n{proc2.stdout.decode(errors='ignore')}\nSTDERR:\n{proc2.stderr.decode(errors='ignore')}")
+        return sample_rate
+
+    def _encode(self, text: str, wav_path: str, part_path: str) -> int:
+        """Synthesize + encode `text` into part_path; returns the sample rate."""
+        if self._pool is not None:
+            try:
+                self._pool.synthesize(text, wav_path, self.speaker)
+                return self._wav_to_mp3(wav_path, part_path)
+            except PiperWorkerError as exc:
+                logger.warning(f"Resident Piper failed ({exc}); falling back to one-shot")
+        if self.stream:
+            return self._stream_to_mp3(text, part_path)
+        cmd = self._piper_cmd("--output_file", wav_path)
+        proc = subprocess.run(cmd, input=text.encode("utf-8"), capture_output=True)
+        if proc.returncode != 0:
+            raise RuntimeError(f"Piper failed (exit {proc.returncode}).\nCmd: {' '.join(cmd)}\nSTDOUT:\n{proc.stdout.decode(errors='ignore')}\nSTDERR:\n{proc.stderr.decode(errors='ignore')}")
+        return self._wav_to_mp3(wav_path, part_path)
+
+    def generate_from_text(self, text: str, cache_dir: str | None = None, path: str | None = None) -> dict:
+        cache_dir = cache_dir or self.cache_dir
+        cache = self._cache_for(cache_dir)
+        key = self.cache_key(text, cache)
+        # WHY: pre-synthesis (helpers/presynth.py) fills the cache; beats only look it up.
+        hit = cache.lookup(key)
+        if hit is not None:
+            return self._result(text, cache.path_for(hit), cache_dir)
+        stem = self.get_audio_basename({"input_text": text, "cache_key": key})
+        wav_path = os.path.join(cache_dir, stem + ".wav")
+        mp3_path = os.path.join(cache_dir, stem + ".mp3")
+        # Encode to a side file and rename, so an interrupted run never leaves a truncated cache hit.
+        part_path = mp3_path + ".part"
+        try:
+            sample_rate = self._encode(text, wav_path, part_path)
+            os.replace(part_path, mp3_path)
+        finally:
+            for leftover in (part_path, wav_path):
+                if os.path.exists(leftover):
+                    os.remove(leftover)
+        cache.store(key, os.path.basename(mp3_path), text, get_duration(mp3_path), sample_rate,
+                    voice=self.voice, tempo=self.tempo)
+        return self._result(text, mp3_path, cache_dir)
@@ -0,0 +1,62 @@
+# [CHECKPOINT-1..5 Active; Mirrors CHECKPOINTS.md]
+# Local stand-in for the `piper` executable so the TTS pipeline can be exercised
+# without the voice model: writes silent 16-bit mono audio, ~0.06 s per character.
+# Supports the one-shot (`--output_file` or `--output-raw`, text on stdin) and `--json-input` modes.
+# Usage: PiperService("helpers/piper_stub.py", <any existing .onnx path>, ...)
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import wave
+
+SAMPLE_RATE = 22050
+SECONDS_PER_CHAR = 0.06
+
+
+def _silence(text: str) -> bytes:
+    return b"\x00\x00" * int(SAMPLE_RATE * SECONDS_PER_CHAR * max(1, len(text)))
+
+
+def _write_silence(path: str, text: str):
+    with wave.open(path, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(SAMPLE_RATE)
+        w.writeframes(_silence(text))
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--model", required=True)
+    ap.add_argument("--output_file")
+    ap.add_argument("--output_dir", default=".")
+    ap.add_argument("--speaker")
+    ap.add_argument("--json-input", action="store_true")
+    ap.add_argument("--output-raw", "--output_raw", action="store_true")
+    args = ap.parse_args(argv)
+    if not os.path.exists(args.model):
+        print(f"Model not found: {args.model}", file=sys.stderr)
+        return 1
+
+    if args.output_raw:
+        sys.stdout.buffer.write(_silence(sys.stdin.read()))
+        sys.stdout.buffer.flush()
+        return 0
+    if not args.json_input:
+        _write_silence(args.output_file, sys.stdin.read())
+        return 0
+
+    for n, line in enumerate(sys.stdin):
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        path = request.get("output_file") or os.path.join(args.output_dir, f"{n}.wav")
+        _write_silence(path, request.get("text", ""))
+        print(path, flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
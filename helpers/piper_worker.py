@@ -0,0 +1,158 @@
+# [CHECKPOINT-1..5 Active; Mirrors CHECKPOINTS.md]
+# WHY: Piper reloads the ONNX voice on every one-shot call, which costs more than
+# synthesizing our short VO lines. Resident workers keep the model loaded (FM-3).
+# Protocol: `piper --json-input` reads one JSON object per stdin line and prints the
+# written WAV path per line on stdout. helpers/piper_stub.py speaks the same protocol.
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import queue
+import subprocess
+import sys
+import threading
+from typing import List, Optional
+
+logger = logging.getLogger("manim")  # manim's logger, without importing manim
+
+
+class PiperWorkerError(RuntimeError):
+    """A resident worker died, timed out, or answered out of protocol."""
+
+
+def piper_command(piper_path: str) -> List[str]:
+    """Executable prefix for Piper; `.py` paths (e.g. the stub) run under this interpreter."""
+    if piper_path.endswith(".py"):
+        return [sys.executable, piper_path]
+    return [piper_path]
+
+
+class PiperWorker:
+    """One long-lived `piper --json-input` process with the model loaded once."""
+
+    def __init__(self, command: List[str], model_path: str, output_dir: str, timeout: float = 60.0):
+        self.command = list(command)
+        self.model_path = model_path
+        self.output_dir = output_dir
+        self.timeout = timeout
+        self.proc: Optional[subprocess.Popen] = None
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        self.restarts = 0
+
+    # ---- lifecycle ----
+    def start(self):
+        os.makedirs(self.output_dir, exist_ok=True)
+        cmd = self.command + ["--model", self.model_path, "--json-input", "--output_dir", self.output_dir]
+        self.proc = subprocess.Popen(
+            cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, encoding="utf-8", bufsize=1,
+        )
+        self._lines = queue.Queue()
+        # Reader thread: a portable way to time out on a pipe (select() does not work on Windows pipes).
+        threading.Thread(target=self._pump, args=(self.proc, self._lines), daemon=True).start()
+        return self
+
+    @staticmethod
+    def _pump(proc: subprocess.Popen, lines: "queue.Queue[Optional[str]]"):
+        for line in proc.stdout:
+            lines.put(line.strip())
+        lines.put(None)  # EOF sentinel -> process exited
+
+    def alive(self) -> bool:
+        return self.proc is not None and self.proc.poll() is None
+
+    def stop(self):
+        if self.proc is None:
+            return
+        try:
+            self.proc.stdin.close()
+            self.proc.wait(timeout=2)
+        except Exception:
+            self.proc.kill()
+        self.proc = None
+
+    def restart(self):
+        self.stop()
+        self.restarts += 1
+        return self.start()
+
+    # ---- requests ----
+    def synthesize(self, text: str, wav_path: str, speaker: int | None = None) -> str:
+        """Write `text` to `wav_path`; raises PiperWorkerError on crash/timeout."""
+        if not self.alive():
+            raise PiperWorkerError(f"Piper worker not running: {' '.join(self.command)}")
+        request = {"text": text, "output_file": wav_path}
+        if speaker is not None:
+            request["speaker_id"] = speaker
+        try:
+            self.proc.stdin.write(json.dumps(request) + "\n")
+            self.proc.stdin.flush()
+        except OSError as exc:
+            raise PiperWorkerError(f"Piper worker stdin closed: {exc}") from exc
+        try:
+            reply = self._lines.get(timeout=self.timeout)
+        except queue.Empty:
+            raise PiperWorkerError(f"Piper worker timed out after {self.timeout:.0f}s")
+        if reply is None:
+            raise PiperWorkerError(f"Piper worker exited (code {self.proc.poll()})")
+        if not os.path.exists(wav_path):
+            raise PiperWorkerError(f"Piper worker replied {reply!r} but wrote no WAV")
+        return wav_path
+
+
+class PiperWorkerPool:
+    """
+    Fixed-size pool of resident Piper workers.
+    - synthesize(): borrows an idle worker, restarts it once if it is unhealthy/crashes
+    - health_check(): restarts any dead workers; returns how many are alive
+    - close(): stops all workers (also registered with atexit)
+    """
+    def __init__(self, piper_path: str, model_path: str, output_dir: str, size: int = 2, timeout: float = 60.0):
+        self.size = max(1, int(size))
+        command = piper_command(piper_path)
+        self.workers = [PiperWorker(command, model_path, output_dir, timeout) for _ in range(self.size)]
+        self._idle: "queue.Queue[PiperWorker]" = queue.Queue()
+        self._started = False
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._started:
+                return
+            for w in self.workers:
+                w.start()
+                self._idle.put(w)
+            self._started = True
+
+    def health_check(self) -> int:
+        self._ensure_started()
+        for w in self.workers:
+            if not w.alive():
+                logger.warning("Restarting dead Piper worker")
+                w.restart()
+        return sum(w.alive() for w in self.workers)
+
+    def synthesize(self, text: str, wav_path: str, speaker: int | None = None) -> str:
+        self._ensure_started()
+        worker = self._idle.get()
+        try:
+            if not worker.alive():
+                worker.restart()
+            try:
+                return worker.synthesize(text, wav_path, speaker)
+            except PiperWorkerError as exc:
+                # One restart per request; a second failure goes to the caller's fallback.
+                logger.warning(f"{exc}; restarting worker and retrying once")
+                worker.restart()
+                return worker.synthesize(text, wav_path, speaker)
+        finally:
+            self._idle.put(worker)
+
+    def close(self):
+        for w in self.workers:
+            w.stop()
+        self._started = False
+        self._idle = queue.Queue()
@@ -0,0 +1,63 @@
+# [CHECKPOINT-1..5 Active; Mirrors CHECKPOINTS.md]
+# WHY: Synthesizing every VO line up front turns ~12 serial Piper+ffmpeg round-trips
+# into one parallel batch; each voiceover beat then only hits the cache (FM-3).
+# Manim CE v0.19.0-compatible.
+from __future__ import annotations
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Iterable, List, Optional
+
+logger = logging.getLogger("manim")  # manim's logger, without importing manim
+
+
+def _normalize(text: str) -> str:
+    # Mirrors SpeechService._wrap_generate_from_text so cache stems match the scene's lookups.
+    return " ".join(text.split())
+
+
+def _synthesize(service, text: str) -> dict:
+    """Process-pool entry point: the service is pickled into the worker."""
+    return service.generate_from_text(text)
+
+
+def pending_texts(service, texts: Iterable[str]) -> List[str]:
+    """Unique, non-empty lines (in order) whose audio is not cached yet."""
+    seen, pending = set(), []
+    for text in texts:
+        text = _normalize(text or "")
+        if not text or text in seen:
+            continue
+        seen.add(text)
+        if not service.is_cached(text):
+            pending.append(text)
+    return pending
+
+
+def presynthesize(service, texts: Iterable[str], max_workers: Optional[int] = None) -> int:
+    """
+    Fill the voiceover cache for every line in `texts` on a process pool.
+    - service: a SpeechService exposing is_cached(text) (e.g. utils.PiperService)
+    - max_workers: pool size; None -> os.cpu_count()
+    Services with resident workers (PiperService(workers=N)) are driven from threads
+    instead: synthesis already runs in the N Piper processes, which hold the model.
+    Returns the number of lines synthesized.
+    """
+    pending = pending_texts(service, texts)
+    if not pending:
+        return 0
+    resident = getattr(service, "workers", 0)
+    workers = max(1, min(len(pending), resident or max_workers or os.cpu_count() or 1))
+    if getattr(service, "synthesizes_in_process", False):  # e.g. EstimatedSpeechService: no pool
+        workers = 1
+    logger.info(f"Pre-synthesizing {len(pending)} narration line(s) on {workers} worker(s)")
+    if workers == 1:
+        for text in pending:
+            _synthesize(service, text)
+        return len(pending)
+    executor = ThreadPoolExecutor if resident else ProcessPoolExecutor
+    with executor(max_workers=workers) as pool:
+        # list() re-raises the first worker error here instead of at beat time.
+        list(pool.map(_synthesize, [service] * len(pending), pending))
+    return len(pending)
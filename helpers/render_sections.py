@@ -0,0 +1,94 @@
+# [CHECKPOINT-1..5 Active; Mirrors CHECKPOINTS.md]
+# WHY: whiteboard_intro / point_transformation_sequence / outro_scene are independent
+# once the outro's handoff state is rebuilt (FinalAnimation.render_section), so each
+# renders in its own manim process and the partial movies are joined by stream copy.
+# Usage (repo root):  python -m helpers.render_sections [-j 3] [-o out.mp4] [-- -qh]
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional, Sequence
+
+from helpers.ffmpeg_tools import BASE_DIR, concat_copy
+from helpers.manim_cli import render_scene
+from helpers.scene_setup import SECTIONS, SECTION_ENV
+
+SCENE_FILE = "FinalAnimation.py"
+SCENE_NAME = "FinalAnimation"
+
+
+def warm_tts_cache():
+    """Synthesize every VO line once here so the section workers only hit the cache."""
+    from config import USE_PIPER, PRESYNTH, TTS_WORKERS, PROBLEM
+    if not (USE_PIPER and PRESYNTH):
+        return
+    from helpers.scene_setup import build_speech_service, narration_for
+    from helpers.presynth import presynthesize
+    from helpers.transformations import TransformationSpec
+    spec = TransformationSpec.from_env() or TransformationSpec.from_dict(PROBLEM)
+    service = build_speech_service()
+    presynthesize(service, narration_for(spec).values(), max_workers=TTS_WORKERS)
+
+
+def warm_tex_cache():
+    """Run the batched TeX pre-pass once so the section workers don't compile the same strings."""
+    from config import TEX_PREPASS, TEX_CACHE_DIR, PROBLEM
+    if TEX_PREPASS:
+        from helpers.scene_setup import scene_tex_items
+        from helpers.tex_cache import prepare_tex_cache
+        from helpers.transformations import TransformationSpec
+        spec = TransformationSpec.from_env() or TransformationSpec.from_dict(PROBLEM)
+        prepare_tex_cache(TEX_CACHE_DIR, scene_tex_items(spec))
+
+
+def render_sections(
+    sections: Optional[Sequence[str]] = None,
+    extra_args: Iterable[str] = (),
+    output: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    media_dir: str = "media",
+    ffmpeg: Optional[str] = None,
+) -> str:
+    """Render each section in parallel and concatenate (no re-encode). Returns the movie path."""
+    sections = tuple(sections or SECTIONS)
+    extra_args = list(extra_args)
+    warm_tts_cache()
+    warm_tex_cache()
+
+    log_dir = os.path.join(BASE_DIR, media_dir, "logs", "sections")
+    os.makedirs(log_dir, exist_ok=True)
+    t0 = time.perf_counter()
+    # Threads only wait on subprocesses; every section is its own manim process.
+    with ThreadPoolExecutor(max_workers=max_workers or len(sections)) as pool:
+        futures = {
+            name: pool.submit(
+                render_scene, SCENE_FILE, SCENE_NAME, f"{SCENE_NAME}_{name}",
+                env={SECTION_ENV: name}, extra_args=extra_args, media_dir=media_dir,
+                log_path=os.path.join(log_dir, f"{name}.log"),
+            )
+            for name in sections
+        }
+        partials = [futures[name].result() for name in sections]
+    output = output or os.path.join(os.path.dirname(partials[0]), f"{SCENE_NAME}_parallel.mp4")
+    concat_copy(partials, output, ffmpeg)
+    print(f"Rendered {len(sections)} section(s) in {time.perf_counter() - t0:.1f}s -> {output}")
+    return output
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Section-parallel render of FinalAnimation.")
+    ap.add_argument("-j", "--jobs", type=int, default=None, help="parallel manim processes (default: one per section)")
+    ap.add_argument("-o", "--output", default=None, help="final movie path")
+    ap.add_argument("--sections", nargs="+", default=None, help="subset of sections, in order")
+    ap.add_argument("--media_dir", default="media")
+    ap.add_argument("--ffmpeg", default=None)
+    ap.add_argument("manim_args", nargs=argparse.REMAINDER, help="extra args after -- go to manim render")
+    args = ap.parse_args(argv)
+    extra = [a for a in args.manim_args if a != "--"]
+    render_sections(args.sections, extra, args.output, args.jobs, args.media_dir, args.ffmpeg)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,389 @@
+# [CHECKPOINT-1..5 Active; Mirrors CHECKPOINTS.md]
+# WHY: Every edit -> `manim render` pays for the interpreter, manim/voiceover imports, the
+# OpenGL context, LaTeX and Piper start-up, and the plane/axes build before the first frame,
+# then re-renders all three sections. The server pays once: it keeps one process (and one
+# OpenGL renderer, the speech service, the Tex pool and the plane prototype) warm, watches
+# FinalAnimation.py, config.py and utils.py, and re-renders in-process only the sections
+# whose code or settings changed (AST diff + reference closure per section; dependents from
+# SECTION_DEPENDENCIES). helpers/ modules are not reloaded (that is the warm state): restart
+# after editing them, or after changing a config value a helper copies at import time
+# (ENCODER_*, BEAT_CACHE*, NARRATION_*, TEX_POOL_SIZE ...): the server says so and does not
+# re-render with the old value. A failing edit is reported and the server keeps serving.
+# Usage (repo root):  python -m helpers.render_server [-q l] [--sections ...] [--no-initial]
+# Output: the latest section movies joined into media/.../FinalAnimation_live.mp4.
+# Manim CE v0.19.0-compatible (OpenGL renderer reused; Cairo gets a fresh one per render).
+from __future__ import annotations
+
+import argparse
+import ast
+import importlib
+import os
+import sys
+import time
+import traceback
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+from helpers.ffmpeg_tools import BASE_DIR, concat_copy
+from helpers.scene_setup import SECTIONS, SECTION_DEPENDENCIES, SECTION_ENV
+
+SCENE_NAME = "FinalAnimation"
+WATCHED = {"FinalAnimation": "FinalAnimation.py", "config": "config.py", "utils": "utils.py"}
+RELOAD_ORDER = ("config", "utils", "FinalAnimation")  # dependencies first
+# Changes reachable from these re-render everything (they run for every section).
+ROOTS = tuple(f"{SCENE_NAME}.{name}" for name in ("setup", "construct", "render_section", "tear_down"))
+QUALITY = {"l": "low_quality", "m": "medium_quality", "h": "high_quality",
+           "p": "production_quality", "k": "fourk_quality"}
+
+
+# ---- change analysis (no manim) ----
+def definitions(source: str, scene: Optional[str] = None) -> Dict[str, ast.AST]:
+    """Top-level name -> defining node; methods of class `scene` as "<scene>.<method>".
+    Imports collect under "<imports>", any other statement under "<module>"."""
+    out: Dict[str, ast.AST] = {}
+    misc: Dict[str, List[ast.AST]] = {"<imports>": [], "<module>": []}
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.ClassDef) and node.name == scene:
+            body = []
+            for item in node.body:
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    out[f"{scene}.{item.name}"] = item
+                else:
+                    body.append(item)
+            misc[scene] = [*node.bases, *node.decorator_list, *body]
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            out[node.name] = node
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            names = [n.id for t in targets for n in ast.walk(t) if isinstance(n, ast.Name)]
+            for name in names or ["<module>"]:
+                out[name] = node
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            misc["<imports>"].append(node)
+        else:
+            misc["<module>"].append(node)
+    for key, nodes in misc.items():
+        out[key] = ast.Module(body=[n if isinstance(n, ast.stmt) else ast.Expr(n) for n in nodes],
+                              type_ignores=[])
+    return out
+
+
+def changed_names(old: Dict[str, ast.AST], new: Dict[str, ast.AST]) -> Set[str]:
+    """Names added, removed or edited (formatting, comments and line moves do not count)."""
+    return {name for name in old.keys() | new.keys()
+            if name not in old or name not in new or ast.dump(old[name]) != ast.dump(new[name])}
+
+
+def references(node: ast.AST) -> Set[str]:
+    """Identifiers a definition may reach: names, attributes (self.x, module.x), string constants."""
+    refs = set()
+    for n in ast.walk(node):
+        if isinstance(n, ast.Name):
+            refs.add(n.id)
+        elif isinstance(n, ast.Attribute):
+            refs.add(n.attr)
+        elif isinstance(n, ast.Constant) and isinstance(n.value, str) and n.value.isidentifier():
+            refs.add(n.value)  # getattr(self, "name")
+    return refs
+
+
+def config_values(module) -> Dict[str, str]:
+    return {name: repr(getattr(module, name)) for name in dir(module)
+            if not name.startswith("_") and not callable(getattr(module, name))}
+
+
+class SourceSnapshot:
+    """Last successfully loaded state of the watched files: definitions, config values, reference graph."""
+
+    def __init__(self, defs: Dict[str, Dict[str, ast.AST]], config: Dict[str, str]):
+        self.defs = defs
+        self.config = config
+        # Graph nodes are "<module>:<name>"; edges go to every node a reference could mean.
+        self.nodes = {f"{mod}:{name}": node for mod, d in defs.items() for name, node in d.items()}
+        self.by_token: Dict[str, Set[str]] = {}
+        for key in self.nodes:
+            token = key.split(":", 1)[1].rsplit(".", 1)[-1]
+            self.by_token.setdefault(token, set()).add(key)
+        for name in config:
+            self.by_token.setdefault(name, set()).add(f"config:{name}")
+        self._refs = {key: references(node) for key, node in self.nodes.items()}
+
+    def closure(self, starts: Iterable[str], stop: Iterable[str] = ()) -> Set[str]:
+        stop, seen = set(stop), set()
+        todo = [s for s in starts if s in self.nodes]
+        while todo:
+            key = todo.pop()
+            if key in seen:
+                continue
+            seen.add(key)
+            for token in self._refs.get(key, ()):
+                todo.extend(k for k in self.by_token.get(token, ()) if k not in seen and k not in stop)
+        return seen
+
+    def referenced_anywhere(self, token: str) -> bool:
+        return any(token in refs for refs in self._refs.values())
+
+
+def helper_references(helpers_dir: str = os.path.join(BASE_DIR, "helpers")) -> Set[str]:
+    """Every identifier the helper modules mention (they read config values the graph cannot follow)."""
+    refs = set()
+    for name in sorted(os.listdir(helpers_dir)):
+        if name.endswith(".py"):
+            with open(os.path.join(helpers_dir, name), "r", encoding="utf-8") as f:
+                refs |= references(ast.parse(f.read()))
+    return refs
+
+
+def helper_import_time_config(helpers_dir: str = os.path.join(BASE_DIR, "helpers")) -> Set[str]:
+    """Config names the helper modules copy when imported (module or class level):
+    `X = getattr(_project_config, "X", ...)`, `project_config.X`, `from config import X`.
+    A reloaded config.py does not reach those copies."""
+    config_aliases = {"_project_config", "project_config", "config"}
+    names = set()
+    for name in sorted(os.listdir(helpers_dir)):
+        if not name.endswith(".py"):
+            continue
+        with open(os.path.join(helpers_dir, name), "r", encoding="utf-8") as f:
+            body = list(ast.parse(f.read()).body)
+        while body:
+            node = body.pop()
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue  # runs at call time
+            if isinstance(node, ast.ClassDef):
+                body.extend(node.body)
+                continue
+            if isinstance(node, ast.ImportFrom) and node.module == "config":
+                names |= {alias.name for alias in node.names}
+                continue
+            for n in ast.walk(node):
+                if (isinstance(n, ast.Call) and getattr(n.func, "id", None) == "getattr" and len(n.args) >= 2
+                        and getattr(n.args[0], "id", None) in config_aliases
+                        and isinstance(n.args[1], ast.Constant)):
+                    names.add(n.args[1].value)
+                elif isinstance(n, ast.Attribute) and getattr(n.value, "id", None) in config_aliases - {"config"}:
+                    names.add(n.attr)
+    return names
+
+
+def affected_sections(old: SourceSnapshot, new: SourceSnapshot, sections: Sequence[str] = SECTIONS,
+                      external: Iterable[str] = ()) -> List[str]:
+    """Sections to re-render for the change old -> new, in render order. `external`: names read
+    outside the watched files (helper_references()); a changed config value among them, or one
+    nothing reads, re-renders everything."""
+    changed = {f"{mod}:{name}" for mod in new.defs
+               for name in changed_names(old.defs.get(mod, {}), new.defs[mod])}
+    changed |= {f"config:{name}" for name in old.config.keys() | new.config.keys()
+                if old.config.get(name) != new.config.get(name)}
+    if not changed:
+        return []
+    section_keys = [f"FinalAnimation:{SCENE_NAME}.{s}" for s in sections]
+    if any(key.split(":", 1)[1] in ("<imports>", "<module>", SCENE_NAME) for key in changed):
+        return list(sections)
+    external = set(external)
+    for key in changed:
+        mod, name = key.split(":", 1)
+        if mod == "config" and (name in external
+                                or not (new.referenced_anywhere(name) or old.referenced_anywhere(name))):
+            return list(sections)
+    for snap in (old, new):
+        shared = snap.closure([f"FinalAnimation:{r}" for r in ROOTS], stop=section_keys)
+        if changed & shared:
+            return list(sections)
+    hit = {s for s, key in zip(sections, section_keys)
+           if changed & (old.closure([key]) | new.closure([key]))}
+    grew = True
+    while grew:  # dependents replay their dependencies (render_section)
+        grew = False
+        for section, deps in SECTION_DEPENDENCIES.items():
+            if section in sections and section not in hit and hit & set(deps):
+                hit.add(section)
+                grew = True
+    return [s for s in sections if s in hit]
+
+
+# ---- server ----
+class RenderServer:
+    def __init__(self, quality: Optional[str] = None, media_dir: str = "media",
+                 poll: float = 0.5, debounce: float = 0.3, ffmpeg: Optional[str] = None):
+        os.chdir(BASE_DIR)  # manim reads ./manim.cfg when it is first imported
+        if BASE_DIR not in sys.path:
+            sys.path.insert(0, BASE_DIR)
+        from manim import config
+        from manim.constants import RendererType
+        self.config = config
+        config.preview = False
+        config.write_to_movie = True
+        config.media_dir = media_dir
+        config.input_file = os.path.join(BASE_DIR, WATCHED[SCENE_NAME])
+        if quality:
+            config.quality = QUALITY.get(quality, quality)
+        self.opengl = config.renderer == RendererType.OPENGL
+        self.poll, self.debounce, self.ffmpeg = poll, debounce, ffmpeg
+        self.modules = {name: importlib.import_module(name) for name in RELOAD_ORDER}
+        self.snapshot = self._snapshot()
+        self.external = helper_references()
+        self.frozen = helper_import_time_config()
+        self.started_with = self.snapshot.config  # values the helpers copied at import
+        self.stale: Set[str] = set()
+        self.mtimes = self._mtimes()
+        self.pending: Set[str] = set()  # changed files not yet reloaded successfully
+        self.movies: Dict[str, str] = {}
+        self._renderer = None
+
+    def _path(self, name: str) -> str:
+        return os.path.join(BASE_DIR, WATCHED[name])
+
+    def _mtimes(self) -> Dict[str, float]:
+        return {name: os.stat(self._path(name)).st_mtime_ns for name in WATCHED}
+
+    def _snapshot(self, sources: Optional[Dict[str, str]] = None) -> SourceSnapshot:
+        sources = sources or self._read()
+        defs = {name: definitions(src, SCENE_NAME if name == SCENE_NAME else None)
+                for name, src in sources.items() if name != "config"}
+        return SourceSnapshot(defs, config_values(self.modules["config"]))
+
+    def _read(self) -> Dict[str, str]:
+        out = {}
+        for name in WATCHED:
+            with open(self._path(name), "r", encoding="utf-8") as f:
+                out[name] = f.read()
+        return out
+
+    def renderer(self):
+        """The shared OpenGL renderer, reset to a fresh scene's state (None -> Cairo builds its own)."""
+        if not self.opengl:
+            return None
+        from manim.renderer.opengl_renderer import OpenGLCamera, OpenGLRenderer
+        r = self._renderer
+        if r is None:
+            r = self._renderer = OpenGLRenderer()
+            return r
+        cls = type(r)
+        for name in [n for n, v in vars(r).items() if callable(v) and hasattr(cls, n)]:
+            del r.__dict__[name]  # per-scene wrappers (static layer, timers) from the last render
+        r.__dict__.pop("static_image", None)
+        r._original_skipping_status = r.skip_animations = False
+        r.animation_start_time = r.animation_elapsed_time = r.time = 0
+        r.animations_hashes = []
+        r.num_plays = 0
+        r.camera = OpenGLCamera()
+        return r
+
+    def render_section(self, section: str) -> str:
+        from manim import tempconfig
+        previous = os.environ.get(SECTION_ENV)
+        os.environ[SECTION_ENV] = section
+        try:
+            with tempconfig({"output_file": f"{SCENE_NAME}_{section}"}):
+                scene = getattr(self.modules[SCENE_NAME], SCENE_NAME)(self.renderer())
+                scene.render()
+                movie = str(scene.renderer.file_writer.movie_file_path)
+                hashes = getattr(scene, "_frame_hashes", None)
+                if hashes is not None:
+                    hashes.dump()  # the process outlives this render
+        finally:
+            if previous is None:
+                os.environ.pop(SECTION_ENV, None)
+            else:
+                os.environ[SECTION_ENV] = previous
+        return movie
+
+    def render(self, sections: Sequence[str]) -> Optional[str]:
+        t0 = time.perf_counter()
+        for section in sections:
+            t = time.perf_counter()
+            self.movies[section] = self.render_section(section)
+            print(f"[render_server] {section}: {time.perf_counter() - t:.1f}s")
+        parts = [self.movies[s] for s in SECTIONS if s in self.movies]
+        if not parts:
+            return None
+        output = os.path.join(os.path.dirname(parts[0]), f"{SCENE_NAME}_live.mp4")
+        concat_copy(parts, output, self.ffmpeg)
+        print(f"[render_server] {len(sections)} section(s) in {time.perf_counter() - t0:.1f}s -> {output}")
+        return output
+
+    def reload(self) -> List[str]:
+        """Re-import the changed files; returns the sections to re-render. Raises on a bad edit
+        (the previous snapshot and the pending files stay, so the next attempt still covers it)."""
+        sources = self._read()
+        for name in (n for n in WATCHED if n != "config"):
+            definitions(sources[name])  # SyntaxError before anything is reloaded
+        for name in RELOAD_ORDER:  # utils imports config, the scene imports both
+            if name == SCENE_NAME or "config" in self.pending or name in self.pending:
+                self.modules[name] = importlib.reload(self.modules[name])
+        self.pending.clear()
+        from helpers.beat_cache import clear_code_caches
+        clear_code_caches()
+        new = self._snapshot(sources)
+        self.stale = {n for n in self.frozen if new.config.get(n) != self.started_with.get(n)}
+        sections = affected_sections(self.snapshot, new, external=self.external)
+        self.snapshot = new
+        return sections
+
+    def wait_for_change(self) -> List[str]:
+        """Block until a watched file changed and then stayed unchanged for `debounce` seconds;
+        returns the changed module names."""
+        while True:
+            time.sleep(self.poll)
+            current = self._mtimes()
+            if current == self.mtimes:
+                continue
+            while True:
+                time.sleep(self.debounce)
+                settled = self._mtimes()
+                if settled == current:
+                    break
+                current = settled
+            changed = [n for n in WATCHED if current[n] != self.mtimes[n]]
+            self.pending.update(changed)
+            self.mtimes = current
+            return changed
+
+    def serve(self, initial: Optional[Sequence[str]] = SECTIONS):
+        if initial:
+            self._guarded(lambda: self.render(initial))
+        print(f"[render_server] watching {', '.join(WATCHED.values())} (Ctrl+C to stop)")
+        while True:
+            changed = ", ".join(WATCHED[n] for n in self.wait_for_change())
+            sections = self._guarded(self.reload)
+            if sections is None:
+                continue
+            if self.stale:
+                print(f"[render_server] {changed}: {', '.join(sorted(self.stale))} changed, but helpers read "
+                      "it at import; restart the server to apply (not re-rendering)")
+                continue
+            if not sections:
+                print(f"[render_server] {changed}: no section affected")
+                continue
+            print(f"[render_server] {changed}: re-rendering {', '.join(sections)}")
+            self._guarded(lambda: self.render(sections))
+
+    @staticmethod
+    def _guarded(fn):
+        try:
+            return fn()
+        except KeyboardInterrupt:
+            raise
+        except BaseException:  # SyntaxError, a failing guard, SystemExit from manim...
+            traceback.print_exc()
+            print("[render_server] failed; fix the file and save again")
+            return None
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Warm FinalAnimation render server with per-section hot reload.")
+    ap.add_argument("-q", "--quality", default=None, choices=sorted(QUALITY), help="manim quality flag (default: manim.cfg)")
+    ap.add_argument("--sections", nargs="+", default=None, choices=SECTIONS, help="initial render (default: all)")
+    ap.add_argument("--no-initial", action="store_true", help="wait for the first change before rendering")
+    ap.add_argument("--media_dir", default="media")
+    ap.add_argument("--poll", type=float, default=0.5, help="seconds between file checks")
+    ap.add_argument("--ffmpeg", default=None)
+    args = ap.parse_args(argv)
+    server = RenderServer(args.quality, args.media_dir, args.poll, ffmpeg=args.ffmpeg)
+    try:
+        server.serve(None if args.no_initial else (args.sections or SECTIONS))
+    except KeyboardInterrupt:
+        print("[render_server] stopped")
+
+
+if __name__ == "__main__":
+    main()
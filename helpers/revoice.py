@@ -0,0 +1,118 @@
+# [CHECKPOINT-1..5 Active; Mirrors CHECKPOINTS.md]
+# WHY: Rewording config.VO, swapping the Piper voice or changing PACING["voice_tempo"] used
+# to mean a full re-render although no frame changes. The narration manifest of a render
+# (helpers/narration_track.py) logs every voiceover beat: its clip, its window in the movie
+# (from the `with` start to the end of the trailing voiceover wait), the clip duration and the
+# narr_time() caps it fed. This re-synthesizes the lines with the current settings (cache
+# hits for unchanged clips) and checks each new duration against its window:
+#   every beat fits -> re-mix the narration track and mux it onto the same frames (stream copy);
+#   a beat overruns -> list the beats (and sections) whose frames need a re-render; no output.
+# A beat whose narr_time() run time would change but whose clip still fits is reported as
+# "retimed" (the motion keeps the old pacing); --exact treats those as re-renders too.
+# Usage (repo root):  python -m helpers.revoice <movie.mp4> [-o variant.mp4] [--check] [--exact]
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import time
+from typing import List, Optional
+
+from helpers.narration_track import build, read_manifest
+
+_EPS = 1e-3  # seconds; rounding in the manifest
+
+
+def _narr_time(duration: float, min_rt: float, cap: float, extra: float) -> float:
+    return max(min_rt, min(duration + extra, cap))  # utils.narr_time
+
+
+def plan(timeline: dict, durations: List[float]) -> List[dict]:
+    """Per beat: window, old/new duration and status ("ok" | "retimed" | "overrun")."""
+    frame = 1.0 / float(timeline.get("frame_rate") or 30)  # waits under one frame are skipped
+    rows = []
+    for beat, new in zip(timeline["beats"], durations):
+        window = beat["end"] - beat["start"]
+        retimed = any(abs(_narr_time(new, *use) - _narr_time(beat["duration"], *use)) > _EPS
+                      for use in beat["narr_time"])
+        status = "overrun" if new > window + frame + _EPS else "retimed" if retimed else "ok"
+        rows.append({"key": beat["key"], "section": beat.get("section"), "start": beat["start"],
+                     "window": round(window, 4), "old": beat["duration"], "new": round(new, 4),
+                     "status": status})
+    return rows
+
+
+def revoice(movie: str, output: Optional[str] = None, check: bool = False, exact: bool = False,
+            ffmpeg: Optional[str] = None) -> dict:
+    """Re-voice `movie` with the current VO/voice/tempo if its frames still fit the new narration."""
+    from helpers.presynth import presynthesize
+    from helpers.scene_setup import narration_for, shared_speech_service
+    from helpers.transformations import TransformationSpec
+
+    data = read_manifest(movie)
+    timeline = data.get("timeline")
+    if not timeline or not timeline.get("beats"):
+        raise SystemExit(f"{movie}: no beat log in its narration manifest (render it once with NARRATION_PREMIX)")
+    import config as project_config
+    spec_data = timeline.get("spec")
+    vo = narration_for(TransformationSpec.from_dict(spec_data or project_config.PROBLEM))
+    beats = timeline["beats"]
+    texts = [" ".join(vo[b["key"]].split()) if b["key"] in vo else b["text"] for b in beats]
+
+    service = shared_speech_service()
+    synthesized = presynthesize(service, texts, max_workers=getattr(project_config, "TTS_WORKERS", None))
+    clips = [dict(c) for c in data["clips"]]
+    durations, changed = [], 0
+    for beat, text in zip(beats, texts):
+        result = service._wrap_generate_from_text(text)  # cache hit after presynthesize()
+        path = os.path.join(str(service.cache_dir), result["final_audio"])
+        clip = clips[beat["clip"]]
+        if os.path.abspath(path) == os.path.abspath(clip["path"]):
+            durations.append(beat["duration"])  # same clip: the render's own measurement
+            continue
+        changed += 1
+        clip["path"] = path
+        durations.append(float(service.cached_duration(text)))
+
+    rows = plan(timeline, durations)
+    blocking = [r for r in rows if r["status"] == "overrun" or (exact and r["status"] == "retimed")]
+    report = {"movie": movie, "beats": rows, "changed": changed, "synthesized": synthesized,
+              "rerender": [r["key"] for r in blocking],
+              "sections": sorted({r["section"] for r in blocking if r["section"]}), "output": None}
+    if blocking or check or not changed:
+        return report
+    target = output or movie
+    if target != movie:
+        shutil.copyfile(movie, target)
+    new_beats = [dict(b, text=t, duration=round(d, 6)) for b, t, d in zip(beats, texts, durations)]
+    build(target, clips, data["duration"], data["rate"], ffmpeg, dict(timeline, beats=new_beats))
+    report["output"] = target
+    return report
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Re-voice a rendered movie without re-rendering frames.")
+    ap.add_argument("movie")
+    ap.add_argument("-o", "--output", default=None, help="write the re-voiced movie here (default: in place)")
+    ap.add_argument("--check", action="store_true", help="only report which beats fit")
+    ap.add_argument("--exact", action="store_true", help="a beat whose narr_time() pacing changes needs frames too")
+    ap.add_argument("--ffmpeg", default=None)
+    args = ap.parse_args(argv)
+    t0 = time.perf_counter()
+    report = revoice(args.movie, args.output, args.check, args.exact, args.ffmpeg)
+    for r in report["beats"]:
+        print(f"{r['start']:7.2f}s  {r['key']:18s} window={r['window']:5.2f}  "
+              f"audio {r['old']:5.2f} -> {r['new']:5.2f}  {r['status']}")
+    print(f"{report['changed']} changed clip(s), {report['synthesized']} synthesized")
+    if report["rerender"]:
+        print(f"Re-render needed for {len(report['rerender'])} beat(s): {', '.join(report['rerender'])}"
+              + (f" (section(s): {', '.join(report['sections'])})" if report["sections"] else ""))
+        raise SystemExit(1)
+    if report["output"]:
+        print(f"Narration re-mixed onto the same frames in {time.perf_counter() - t0:.1f}s -> {report['output']}")
+    elif not report["changed"]:
+        print("Narration unchanged; nothing to do")
+
+
+if __name__ == "__main__":
+    main()
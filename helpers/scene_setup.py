@@ -0,0 +1,92 @@
+# [CHECKPOINT-1..5 Active; Mirrors CHECKPOINTS.md]
+# WHY: The render drivers (render_sections, batch_render, benchmark, timeline) need the
+# section list, the narration and the speech service, not the scene; importing
+# FinalAnimation pulls in all of manim. Nothing here imports manim at module load:
+# the speech services are imported when one is built. config values are read at call
+# time, so a reloaded config.py (helpers/render_server.py) takes effect without reloading this.
+from __future__ import annotations
+
+import glob
+import os
+import shutil
+
+import config as project_config
+from helpers.ffmpeg_tools import BASE_DIR
+from helpers.transformations import TransformationSpec
+
+# Section-parallel rendering (helpers/render_sections.py)
+# WHY: sections render in separate processes; only the outro needs handoff state
+# (right_column, steps_panel, point, point_label), rebuilt by a silent replay (FM-7).
+SECTION_ENV = "FA_SECTION"
+SECTIONS = ("whiteboard_intro", "point_transformation_sequence", "outro_scene")
+SECTION_DEPENDENCIES = {"outro_scene": ("point_transformation_sequence",)}
+
+
+def narration_for(spec: TransformationSpec) -> dict:
+    """VO lines for one problem: static theory text + the spec's generated beats."""
+    return {**project_config.VO, **spec.narrations()}
+
+
+# Fixed Tex/MathTex strings of the scene (FinalAnimation builds its mobjects from these), so
+# the TeX pre-pass (helpers/tex_cache.py) can compile them before anything is typeset.
+INTRO_TITLE = r"\textbf{Transformation Map (Function $\to$ Points)}"
+G_EQ_TOKENS = (r"g(x)", "=", "a", r"f(", "k", r"(x-d)", ")", "+", "c")
+MAPPING_TOKENS = (r"x'", "=", r"\frac{x}{k}", "+", "d", r",\quad", r"y'", "=", r"a\,y", "+", "c")
+INTRO_BULLETS = (
+    r"Inside $\Rightarrow$ horizontal, acts on $x$",
+    r"Outside $\Rightarrow$ vertical, acts on $y$",
+    r"$a<0 \Rightarrow$ reflect across $x$-axis",
+    r"$k<0 \Rightarrow$ reflect across $y$-axis",
+)
+STEPS_TITLE = "Steps"
+
+
+def mathtex_items(*tex_strings: str) -> list:
+    """What MathTex(*tex_strings) typesets: the joined string, then each substring."""
+    items = [(" ".join(tex_strings), "align*")]
+    if len(tex_strings) > 1:
+        items += [(t, "align*") for t in tex_strings]
+    return items
+
+
+def scene_tex_items(spec: TransformationSpec) -> list:
+    """(expression, environment) of every Tex/MathTex the scene builds for `spec`."""
+    items = [(INTRO_TITLE, "center"), (STEPS_TITLE, "center")] + [(b, "center") for b in INTRO_BULLETS]
+    return items + mathtex_items(*G_EQ_TOKENS) + mathtex_items(*MAPPING_TOKENS) + spec.tex_items()
+
+
+def build_speech_service():
+    """Piper service from piper_runtime/ (shared by the scene and the render drivers).
+    SPEECH_BACKEND="estimate" -> silent clips timed from the text (no Piper needed)."""
+    cfg = project_config
+    rt = os.path.join(BASE_DIR, "piper_runtime")
+    models = sorted(glob.glob(os.path.join(rt, "*.onnx")))
+    if cfg.SPEECH_BACKEND == "estimate":
+        from helpers.estimated_speech import EstimatedSpeechService
+        # Calibrated against this voice's clips in the Piper cache when there are any.
+        voice = os.path.basename(models[0]) if models else None
+        return EstimatedSpeechService(voice=voice, tempo=cfg.PACING["voice_tempo"], wpm=cfg.ESTIMATE_WPM,
+                                      tone_hz=cfg.ESTIMATE_TONE_HZ)
+    from helpers.piper_service import PiperService
+    if not models:
+        raise FileNotFoundError("Piper voice model not found in piper_runtime.")
+    # piper.exe (Windows bundle) or piper (Linux/macOS build) in piper_runtime/, else on PATH.
+    candidates = [os.path.join(rt, name) for name in ("piper.exe", "piper")]
+    piper_exe = next((p for p in candidates if os.path.exists(p)), None) or shutil.which("piper") or candidates[0]
+    cache_cap = cfg.TTS_CACHE_MAX_MB * 1024 * 1024 if cfg.TTS_CACHE_MAX_MB else None
+    return PiperService(piper_exe, models[0], tempo=cfg.PACING["voice_tempo"],
+                        workers=cfg.PIPER_WORKERS, cache_max_bytes=cache_cap, stream=cfg.PIPER_STREAM)
+
+
+_SERVICE_SETTINGS = ("SPEECH_BACKEND", "PACING", "PIPER_WORKERS", "PIPER_STREAM", "TTS_CACHE_MAX_MB",
+                     "ESTIMATE_WPM", "ESTIMATE_TONE_HZ")
+_shared: dict = {}
+
+
+def shared_speech_service():
+    """build_speech_service() once per process and settings: a warm render server keeps the
+    same service (and its resident Piper workers) across renders; one-shot renders build one."""
+    key = repr([getattr(project_config, name, None) for name in _SERVICE_SETTINGS])
+    if _shared.get("key") != key:
+        _shared["service"], _shared["key"] = build_speech_service(), key
+    return _shared["service"]
@@ -0,0 +1,172 @@
+# [CHECKPOINT-1..5 Active; Mirrors CHECKPOINTS.md]
+# WHY: config/utils/the render drivers are imported by every tool and every parent process;
+# an accidental `from manim import *` there costs seconds per invocation. This measures the
+# import cost of each entry module in a fresh interpreter via `python -X importtime`
+# (cumulative time of the top-level import, modules loaded, whether manim came in) and
+# compares with a baseline or with another git revision.
+# Usage (repo root):
+#   python -m helpers.startup_bench                     # compare with baseline
+#   python -m helpers.startup_bench --update-baseline   # record this machine's baseline
+#   python -m helpers.startup_bench --rev HEAD~1        # same modules at another revision
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional, Sequence
+
+from helpers.ffmpeg_tools import BASE_DIR
+
+BENCH_DIR = os.path.join(BASE_DIR, "media", "bench")
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "startup_baseline.json")
+
+# Entry modules; the last one is the scene itself (always pays for manim, kept as reference).
+MODULES = (
+    "config",
+    "utils",
+    "helpers.transformations",
+    "helpers.scene_setup",
+    "helpers.batch_render",
+    "helpers.render_sections",
+    "helpers.timeline",
+    "FinalAnimation",
+)
+HEAVY = ("manim", "manim_voiceover", "numpy")  # packages a light module must not pull in
+
+# "import time:       self [us] |  cumulative | imported package"
+_LINE = re.compile(r"^import time:\s+(\d+)\s*\|\s*(\d+)\s*\|( *)(\S+)\s*$")
+MIN_DELTA_MS = 15.0  # noise floor for a regression
+
+
+def parse_importtime(stderr: str, module: str) -> dict:
+    """Cumulative ms of `module`'s own import, modules loaded, heavy packages seen."""
+    names, total_us = [], None
+    for line in stderr.splitlines():
+        m = _LINE.match(line)
+        if not m:
+            continue
+        names.append(m.group(4))
+        if m.group(4) == module and len(m.group(3)) == 1:  # top level: one space of indent
+            total_us = int(m.group(2))
+    heavy = sorted({n.split(".")[0] for n in names} & set(HEAVY))
+    return {"ms": None if total_us is None else round(total_us / 1000.0, 2),
+            "modules": len(names), "heavy": heavy}
+
+
+def measure(module: str, cwd: str = BASE_DIR, python: str = sys.executable) -> dict:
+    proc = subprocess.run([python, "-X", "importtime", "-c", f"import {module}"], cwd=cwd,
+                          capture_output=True, text=True, env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"})
+    out = parse_importtime(proc.stderr, module)
+    if proc.returncode != 0:
+        out["error"] = (proc.stderr.strip().splitlines() or ["exit %d" % proc.returncode])[-1]
+    return out
+
+
+def run_suite(modules: Sequence[str] = MODULES, repeat: int = 5, cwd: str = BASE_DIR) -> dict:
+    """Each module `repeat` times in a fresh interpreter (after one warm-up for .pyc files); medians."""
+    results = {}
+    for module in modules:
+        measure(module, cwd)
+        runs = [measure(module, cwd) for _ in range(repeat)]
+        times = [r["ms"] for r in runs if r["ms"] is not None]
+        r = {**runs[-1], "ms": round(statistics.median(times), 2) if times else None}
+        results[module] = r
+        ms = f"{r['ms']:8.1f}ms" if r["ms"] is not None else "       n/a"
+        print(f"{module:28s} {ms}  modules={r['modules']:5d}  heavy={','.join(r['heavy']) or '-'}"
+              + (f"  ERROR: {r['error']}" if "error" in r else ""))
+    return {"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "repeat": repeat, "results": results}
+
+
+def run_at_rev(rev: str, modules: Sequence[str] = MODULES, repeat: int = 5) -> dict:
+    """run_suite() on a temporary detached worktree of `rev`."""
+    tmp = tempfile.mkdtemp(prefix="fa_startup_")
+    path = os.path.join(tmp, "tree")
+    subprocess.run(["git", "worktree", "add", "--detach", path, rev], cwd=BASE_DIR, check=True,
+                   capture_output=True)
+    try:
+        return run_suite(modules, repeat, cwd=path)
+    finally:
+        subprocess.run(["git", "worktree", "remove", "--force", path], cwd=BASE_DIR, capture_output=True)
+        os.rmdir(tmp)
+
+
+def compare(current: dict, baseline: dict, tolerance: float = 0.25) -> List[str]:
+    """Regression messages (empty = pass). A module newly pulling in a heavy package always counts."""
+    problems = []
+    for module, run in current["results"].items():
+        base = baseline.get("results", {}).get(module)
+        if base is None:
+            continue
+        gained = sorted(set(run["heavy"]) - set(base["heavy"]))
+        if gained:
+            problems.append(f"{module}: now imports {', '.join(gained)}")
+        value, ref = run["ms"], base["ms"]
+        if value is not None and ref is not None and value > ref * (1 + tolerance) and value - ref > MIN_DELTA_MS:
+            problems.append(f"{module}: {ref:.1f}ms -> {value:.1f}ms (+{(value / ref - 1) * 100 if ref else 100:.0f}%)")
+    return problems
+
+
+def speedups(current: dict, other: dict) -> Dict[str, Optional[float]]:
+    """other/current per module (2.0 = twice as fast now); None if either import failed."""
+    out = {}
+    for module, run in current["results"].items():
+        base = other.get("results", {}).get(module, {})
+        ok = "error" not in run and "error" not in base and base.get("ms") and run["ms"]
+        out[module] = round(base["ms"] / run["ms"], 2) if ok else None
+    return out
+
+
+def _write_json(data: dict, path: str):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1)
+    os.replace(tmp, path)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Import-time startup benchmark (python -X importtime).")
+    ap.add_argument("--modules", nargs="+", default=list(MODULES))
+    ap.add_argument("--repeat", type=int, default=5, help="fresh interpreters per module (median is kept)")
+    ap.add_argument("--rev", default=None, help="also measure this git revision and print the speedup")
+    ap.add_argument("-o", "--output", default=None, help="results JSON (default: media/bench/startup_<time>.json)")
+    ap.add_argument("--baseline", default=DEFAULT_BASELINE)
+    ap.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slowdown (0.25 = 25%%)")
+    ap.add_argument("--update-baseline", action="store_true", help="write results as the new baseline")
+    args = ap.parse_args(argv)
+
+    current = run_suite(args.modules, args.repeat)
+    output = args.output or os.path.join(BENCH_DIR, time.strftime("startup_%Y%m%d_%H%M%S.json"))
+    if args.rev:
+        print(f"--- {args.rev} ---")
+        other = run_at_rev(args.rev, args.modules, args.repeat)
+        current["speedup_vs"] = {"rev": args.rev, "results": other["results"], "speedup": speedups(current, other)}
+        for module, x in current["speedup_vs"]["speedup"].items():
+            print(f"{module:28s} {'n/a' if x is None else f'{x:.2f}x'}")
+    _write_json(current, output)
+    print(f"Results -> {output}")
+
+    if args.update_baseline:
+        _write_json(current, args.baseline)
+        print(f"Baseline updated -> {args.baseline}")
+        return
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline to record one.")
+        return
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    problems = compare(current, baseline, args.tolerance)
+    for p in problems:
+        print(f"[REGRESSION] {p}")
+    print(f"{len(problems)} regression(s) at {args.tolerance:.0%} tolerance")
+    raise SystemExit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+# [CHECKPOINT-1..5 Active; Mirrors CHECKPOINTS.md]
+# WHY: In point_transformation_sequence the plane, axes, coordinate labels and right column
+# sit still while one dot moves, yet they were redrawn for every frame. The static layer
+# rasterizes the non-moving mobjects once at output resolution and reuses that image:
+#   OpenGL: the leading run of scene.mobjects that is static for the current play (marked
+#           via mark_static(), or any such run with STATIC_LAYER="auto") is rendered once
+#           into an offscreen framebuffer; every frame copies it in and draws only the rest.
+#   Cairo:  manim already splits static/moving per play but re-rasterizes the static part
+#           at every play; identical static sets now reuse the previous raster.
+# A layer is keyed on its mobjects' geometry/style hash, the camera and the frame size, so
+# any change (recolor, new step item, camera move) just builds a new layer. Frames are
+# identical to a normal render: same mobjects, same order, same blending.
+# STATIC_LAYER in config.py: "marked" (default), "auto", "off"; Cairo reuse is on unless "off".
+# Manim CE v0.19.0-compatible.
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import List, Optional
+
+import numpy as np
+from manim import config
+from manim.constants import RendererType
+
+from helpers.beat_cache import hash_mobject
+
+MODES = ("off", "marked", "auto")
+MAX_LAYERS = 4  # rasters kept (LRU); each is one full frame
+
+
+def _has_updaters(mob) -> bool:
+    return len(mob.get_family_updaters()) > 0
+
+
+class StaticLayer:
+    """Per-scene static layer state; see install_static_layer()."""
+
+    def __init__(self, scene, mode: str = "marked", max_layers: int = MAX_LAYERS):
+        if mode not in MODES:
+            raise ValueError(f"STATIC_LAYER must be one of {MODES}, got {mode!r}")
+        self.scene = scene
+        self.mode = mode
+        self.max_layers = max_layers
+        self.marked = set()
+        self.layers: "OrderedDict[str, object]" = OrderedDict()  # key -> raster (ndarray or framebuffer)
+        self.current: Optional[tuple] = None  # (mobjects, raster) for the running play
+        self.hits = 0
+        self.builds = 0
+
+    def mark(self, *mobjects):
+        self.marked.update(id(m) for m in mobjects)
+
+    def unmark(self, *mobjects):
+        self.marked.difference_update(id(m) for m in mobjects)
+
+    # ---- keys ----
+    def key(self, mobjects, family: bool = True) -> str:
+        renderer = self.scene.renderer
+        h = hashlib.sha256()
+        for m in mobjects:
+            h.update(id(m).to_bytes(8, "little"))
+            hash_mobject(m, h, family=family)
+        camera = renderer.camera
+        for attr in ("frame_center", "frame_width", "frame_height"):
+            if hasattr(camera, attr):
+                h.update(np.asarray(getattr(camera, attr), dtype=float).tobytes())
+        if hasattr(camera, "get_family"):  # OpenGL camera is itself a mobject
+            hash_mobject(camera, h)
+        h.update(repr((config.pixel_width, config.pixel_height, str(config.background_color))).encode())
+        return h.hexdigest()
+
+    def _cached(self, key: str):
+        raster = self.layers.get(key)
+        if raster is not None:
+            self.layers.move_to_end(key)
+            self.hits += 1
+        return raster
+
+    def _store(self, key: str, raster):
+        self.builds += 1
+        self.layers[key] = raster
+        while len(self.layers) > self.max_layers:
+            _, old = self.layers.popitem(last=False)
+            self._release(old)
+
+    def _release(self, raster):
+        if hasattr(raster, "release"):  # OpenGL framebuffer + its attachments
+            for attachment in (*raster.color_attachments, raster.depth_attachment):
+                if attachment is not None:
+                    attachment.release()
+            raster.release()
+
+    def release(self):
+        while self.layers:
+            self._release(self.layers.popitem()[1])
+        self.current = None
+
+    # ---- OpenGL ----
+    def static_prefix(self) -> List:
+        """Leading scene.mobjects that nothing in the current play moves (and, if 'marked', are marked)."""
+        scene = self.scene
+        moving = {id(m) for mob in scene.get_moving_mobjects(*scene.animations) for m in mob.get_family()}
+        prefix = []
+        for mob in scene.mobjects:
+            if self.mode == "marked" and id(mob) not in self.marked:
+                break
+            if _has_updaters(mob) or any(id(m) in moving for m in mob.get_family()):
+                break
+            prefix.append(mob)
+        return prefix
+
+    def _render_gl(self, mobjects):
+        renderer = self.scene.renderer
+        fbo = renderer.get_frame_buffer_object(renderer.context, 0)
+        fbo.use()
+        try:
+            fbo.clear(*renderer.background_color)
+            renderer.refresh_perspective_uniforms(self.scene.camera)
+            for mob in mobjects:
+                if mob.should_render:
+                    renderer.render_mobject(mob)
+        finally:
+            renderer.frame_buffer_object.use()
+        return fbo
+
+    def begin_play_gl(self):
+        self.current = None
+        scene = self.scene
+        if scene.renderer.skip_animations or scene.is_current_animation_frozen_frame():
+            return  # nothing drawn / a single frame: no gain from a layer
+        prefix = self.static_prefix()
+        if not prefix:
+            return
+        key = self.key(prefix)
+        raster = self._cached(key)
+        if raster is None:
+            raster = self._render_gl(prefix)
+            self._store(key, raster)
+        self.current = (prefix, raster)
+
+    def update_frame_gl(self, update_frame, scene):
+        # Mirrors OpenGLRenderer.update_frame (v0.19.0) with the static prefix copied in.
+        current = self.current
+        if current is None:
+            return update_frame(scene)
+        prefix, fbo = current
+        n = len(prefix)
+        if len(scene.mobjects) < n or any(a is not b for a, b in zip(scene.mobjects, prefix)):
+            return update_frame(scene)  # scene list changed mid-play: draw everything
+        renderer = scene.renderer
+        renderer.context.copy_framebuffer(renderer.frame_buffer_object, fbo)
+        renderer.refresh_perspective_uniforms(scene.camera)
+        for mobject in scene.mobjects[n:]:
+            if mobject.should_render:
+                renderer.render_mobject(mobject)
+        for obj in scene.meshes:
+            for mesh in obj.get_meshes():
+                mesh.set_uniforms(renderer)
+                mesh.render()
+        renderer.animation_elapsed_time = time.time() - renderer.animation_start_time
+
+    # ---- Cairo ----
+    def save_static_frame_data_cairo(self, save_static_frame_data, scene, static_mobjects):
+        renderer = scene.renderer
+        if not static_mobjects or renderer.skip_animations:
+            return save_static_frame_data(scene, static_mobjects)
+        key = self.key(static_mobjects, family=False)  # manim passes flattened family members
+        image = self._cached(key)
+        if image is None:
+            image = save_static_frame_data(scene, static_mobjects)
+            self._store(key, image)
+        renderer.static_image = image
+        return image
+
+
+def install_static_layer(scene, mode: str = "marked") -> Optional[StaticLayer]:
+    """Enable static-layer reuse for this scene (call from setup()); None when off/unsupported."""
+    if mode == "off":
+        return None
+    layer = StaticLayer(scene, mode)
+    renderer = scene.renderer
+    if config.renderer == RendererType.OPENGL:
+        if getattr(renderer, "window", None) is not None:
+            return None  # interactive preview draws to the window's own framebuffer
+        begin_animations = scene.begin_animations
+
+        def layered_begin_animations():
+            begin_animations()
+            layer.begin_play_gl()
+        scene.begin_animations = layered_begin_animations
+        update_frame = renderer.update_frame
+        renderer.update_frame = lambda s: layer.update_frame_gl(update_frame, s)
+    else:
+        save_static_frame_data = renderer.save_static_frame_data
+        renderer.save_static_frame_data = (
+            lambda s, mobs: layer.save_static_frame_data_cairo(save_static_frame_data, s, mobs))
+    scene._static_layer = layer
+    return layer
+
+
+def mark_static(scene, *mobjects):
+    """Mark mobjects as static-layer candidates; no-op when the layer is off."""
+    layer = getattr(scene, "_static_layer", None)
+    if layer is not None:
+        layer.mark(*mobjects)
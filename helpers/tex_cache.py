@@ -0,0 +1,167 @@
+# [CHECKPOINT-1..5 Active; Mirrors CHECKPOINTS.md]
+# WHY: Every Tex/MathTex (and every MathTex substring) is its own LaTeX->DVI->SVG run,
+# which dominates cold starts. This pre-pass compiles all missing SVGs in ONE multi-page
+# LaTeX job + ONE dvisvgm call, writing them under manim's own content-hashed names
+# (tex_hash of the full .tex source) so tex_to_svg_file() finds them as cache hits.
+# The strings come from the scene itself (its Tex/MathTex arguments, collected in setup()
+# before anything is typeset); tex_manifest.json, recorded by every render/worker, adds
+# whatever that list missed.
+# Manim CE v0.19.0-compatible.
+from __future__ import annotations
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from manim import config, logger
+from manim.utils.tex_file_writing import compile_tex, tex_hash, tex_to_svg_file
+
+MANIFEST_NAME = "tex_manifest.json"
+TexItem = Tuple[str, Optional[str]]  # (expression, environment)
+
+_recorded: Dict[str, TexItem] = {}
+
+
+def _texcode(expression: str, environment: Optional[str], tex_template) -> str:
+    if environment is not None:
+        return tex_template.get_texcode_for_expression_in_env(expression, environment)
+    return tex_template.get_texcode_for_expression(expression)
+
+
+def _tex_dir() -> Path:
+    tex_dir = config.get_dir("tex_dir")
+    tex_dir.mkdir(parents=True, exist_ok=True)
+    return tex_dir
+
+
+# ---- recording ----
+def install_recorder():
+    """Wrap tex_mobject.tex_to_svg_file so every default-template request is recorded."""
+    from manim.mobject.text import tex_mobject
+    original = tex_mobject.tex_to_svg_file
+    if getattr(original, "_fa_recorder", False):
+        return
+
+    def recording_tex_to_svg_file(expression, environment=None, tex_template=None):
+        if tex_template is None or tex_template.body == config.tex_template.body:
+            _recorded[tex_hash(_texcode(expression, environment, config.tex_template))] = (expression, environment)
+        return original(expression, environment, tex_template)
+
+    recording_tex_to_svg_file._fa_recorder = True
+    tex_mobject.tex_to_svg_file = recording_tex_to_svg_file
+
+
+def load_manifest() -> List[TexItem]:
+    try:
+        with open(_tex_dir() / MANIFEST_NAME, "r", encoding="utf-8") as f:
+            return [(e, env) for e, env in json.load(f)]
+    except (FileNotFoundError, ValueError):
+        return []
+
+
+def save_manifest() -> int:
+    """Merge this process's recorded strings into the shared manifest (atomic replace)."""
+    if not _recorded:
+        return 0
+    items = set(load_manifest()) | set(_recorded.values())
+    path = _tex_dir() / MANIFEST_NAME
+    tmp = path.with_name(f"{MANIFEST_NAME}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(sorted(items, key=lambda it: (it[0], it[1] or "")), f, indent=1)
+    os.replace(tmp, path)
+    return len(items)
+
+
+# ---- batched compile ----
+_STANDALONE = re.compile(r"\\documentclass(?:\[([^\]]*)\])?\{standalone\}")
+
+
+def _batch_document(codes: List[str]) -> Optional[str]:
+    """One standalone[multi] document with a page per expression; None if the template can't batch."""
+    head, _, _ = codes[0].partition(r"\begin{document}")
+    match = _STANDALONE.search(head)
+    if match is None:
+        return None
+    opts = [o.strip() for o in (match.group(1) or "").split(",") if o.strip()]
+    if not any(o.startswith("multi") for o in opts):
+        opts.append("multi")
+    head = head[:match.start()] + r"\documentclass[" + ",".join(opts) + r"]{standalone}" + head[match.end():]
+    pages = []
+    for code in codes:
+        if not code.startswith(codes[0].partition(r"\begin{document}")[0]):
+            return None  # mixed templates
+        body = code.partition(r"\begin{document}")[2].rpartition(r"\end{document}")[0]
+        pages.append("\\begin{standalone}\n" + body.strip("\n") + "\n\\end{standalone}")
+    return head + "\\begin{document}\n" + "\n".join(pages) + "\n\\end{document}\n"
+
+
+def _compile_batch(missing: List[Tuple[str, str]], tex_template, tex_dir: Path) -> bool:
+    document = _batch_document([code for _, code in missing])
+    if document is None:
+        return False
+    # A name of its own per call: workers batching the same strings must not share (or, on
+    # cleanup, delete) one .tex/.dvi, and compile_tex() would reuse an existing .dvi as-is.
+    fd, name = tempfile.mkstemp(prefix="batch_", suffix=".tex", dir=tex_dir)
+    batch_tex = Path(name)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(document)
+    out_dir = Path(tempfile.mkdtemp(prefix="svg_", dir=tex_dir))
+    try:
+        dvi = compile_tex(batch_tex, tex_template.tex_compiler, tex_template.output_format)
+        subprocess.run([
+            "dvisvgm", *(["--pdf"] if tex_template.output_format == ".pdf" else []),
+            f"--page=1-{len(missing)}", "--no-fonts", "--verbosity=0",
+            f"--output={(out_dir / 'page-%p.svg').as_posix()}", dvi.as_posix(),
+        ], stdout=subprocess.DEVNULL)
+        pages = {int(m.group(1)): out_dir / name
+                 for name in os.listdir(out_dir) if (m := re.fullmatch(r"page-0*(\d+)\.svg", name))}
+        if sorted(pages) != list(range(1, len(missing) + 1)):
+            logger.warning(f"TeX batch produced {len(pages)} page(s) for {len(missing)} item(s); compiling individually")
+            return False
+        for n, (h, _) in enumerate(missing, start=1):
+            os.replace(pages[n], tex_dir / f"{h}.svg")  # atomic: concurrent workers only ever see whole SVGs
+        return True
+    except (ValueError, RuntimeError) as exc:  # compile_tex's errors for a failed LaTeX run
+        logger.warning(f"TeX batch failed ({exc}); compiling individually")
+        return False
+    finally:
+        shutil.rmtree(out_dir, ignore_errors=True)
+        if not config["no_latex_cleanup"]:
+            for suffix in (".tex", ".aux", ".log", ".dvi", ".xdv", ".pdf"):
+                batch_tex.with_suffix(suffix).unlink(missing_ok=True)
+
+
+def precompile(items: Optional[Iterable[TexItem]] = None, tex_template=None) -> int:
+    """Compile every missing SVG for `items` (default: the recorded manifest). Returns how many."""
+    tex_template = tex_template or config.tex_template
+    tex_dir = _tex_dir()
+    items = load_manifest() if items is None else list(items)
+    missing, seen = [], set()
+    for expression, environment in items:
+        code = _texcode(expression, environment, tex_template)
+        h = tex_hash(code)
+        if h in seen or (tex_dir / f"{h}.svg").exists():
+            continue
+        seen.add(h)
+        missing.append((h, code, expression, environment))
+    if not missing:
+        return 0
+    logger.info(f"TeX pre-pass: compiling {len(missing)} expression(s) in one batch")
+    if not _compile_batch([(h, code) for h, code, _, _ in missing], tex_template, tex_dir):
+        for _, _, expression, environment in missing:
+            tex_to_svg_file(expression, environment, tex_template)
+    return len(missing)
+
+
+def prepare_tex_cache(tex_dir: Optional[str] = None, items: Iterable[TexItem] = ()) -> int:
+    """Point manim at the shared cache dir, start recording, and run the batched pre-pass over
+    `items` (the strings about to be typeset) plus the recorded manifest."""
+    if tex_dir:
+        config.tex_dir = os.path.expanduser(tex_dir)
+    install_recorder()
+    return precompile([*items, *load_manifest()])
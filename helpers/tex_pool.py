@@ -0,0 +1,115 @@
+# [CHECKPOINT-1..5 Active; Mirrors CHECKPOINTS.md]
+# WHY: Captions, Steps items and point labels are new Tex/MathTex objects that differ only
+# in content; each one re-parses its SVG into fresh point arrays, and become() then copies
+# those arrays again. The pool keeps one parsed prototype per (class, tex strings, font
+# size, color, ...) under an LRU bound and hands out copies (a deep copy of the arrays, no
+# SVG parse). BecomeTransform skips become()'s intermediate copies, and reads the target
+# directly when the two mobjects already have the same layout (family size and array
+# lengths). Matters most when one process renders many problems (batch/warm server).
+# TEX_POOL_SIZE in config.py: prototypes kept (0 -> no pooling).
+# Manim CE v0.19.0-compatible (Cairo + OpenGL mobjects).
+from __future__ import annotations
+
+import importlib
+from collections import OrderedDict
+from typing import Dict
+
+import numpy as np
+from manim import Animation, ManimColor, Mobject, Transform
+
+_project_config = importlib.import_module("config")  # project config.py (not manim's config)
+TEX_POOL_SIZE = getattr(_project_config, "TEX_POOL_SIZE", 256)
+
+
+def _freeze(name: str, value):
+    if name in ("color", "fill_color", "stroke_color") and value is not None:
+        return ManimColor(value).to_hex()
+    return repr(value)
+
+
+class TexPool:
+    """LRU of parsed text/math prototypes; get() returns an independent copy."""
+
+    def __init__(self, max_entries: int = TEX_POOL_SIZE):
+        self.max_entries = max_entries
+        self._protos: "OrderedDict[tuple, Mobject]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, cls, tex_strings, kwargs) -> tuple:
+        return (cls.__module__, cls.__qualname__, tuple(tex_strings),
+                tuple(sorted((k, _freeze(k, v)) for k, v in kwargs.items())))
+
+    def _fetch(self, key, factory) -> Mobject:
+        proto = self._protos.get(key)
+        if proto is None:
+            self.misses += 1
+            proto = self._protos[key] = factory()
+            while len(self._protos) > self.max_entries:
+                self._protos.popitem(last=False)
+        else:
+            self.hits += 1
+            self._protos.move_to_end(key)
+        return proto.copy()
+
+    def get(self, cls, *tex_strings: str, **kwargs) -> Mobject:
+        if self.max_entries <= 0:
+            return cls(*tex_strings, **kwargs)
+        return self._fetch(self.key(cls, tex_strings, kwargs), lambda: cls(*tex_strings, **kwargs))
+
+    def cached(self, key, factory) -> Mobject:
+        """Copy of factory() for any other prototype (e.g. the plane); key must cover its inputs.
+        The factory's code object is part of the key, so an edited factory never hits."""
+        if self.max_entries <= 0:
+            return factory()
+        return self._fetch(("cached", getattr(factory, "__code__", factory), key), factory)
+
+    def clear(self):
+        self._protos.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._protos), "hits": self.hits, "misses": self.misses}
+
+
+POOL = TexPool()
+
+
+def pooled(cls, *tex_strings: str, **kwargs) -> Mobject:
+    """cls(*tex_strings, **kwargs) through the shared pool, e.g. pooled(MathTex, r"x'", color=RED)."""
+    return POOL.get(cls, *tex_strings, **kwargs)
+
+
+# ---- copy-free become ----
+def _buffers(mob) -> Dict[str, np.ndarray]:
+    data = getattr(mob, "data", None)
+    if isinstance(data, dict):  # OpenGL: every per-vertex array lives in .data
+        return data
+    return {"points": mob.points}
+
+
+def same_layout(a: Mobject, b: Mobject) -> bool:
+    """Same family size and, member by member, the same arrays with the same shapes."""
+    fa, fb = a.get_family(), b.get_family()
+    if len(fa) != len(fb):
+        return False
+    for m1, m2 in zip(fa, fb):
+        if len(m1.submobjects) != len(m2.submobjects):
+            return False
+        d1, d2 = _buffers(m1), _buffers(m2)
+        if d1.keys() != d2.keys():
+            return False
+        if any(np.shape(d1[k]) != np.shape(d2[k]) for k in d1):
+            return False
+    return True
+
+
+class BecomeTransform(Transform):
+    """Animated mob -> target; ends like mob.animate.become(target) without that path's copies
+    of mob and target. When the layouts already match, target is read directly (not even the
+    aligned copy Transform normally makes); target itself is never modified or added."""
+
+    def begin(self):
+        if not same_layout(self.mobject, self.target_mobject):
+            return super().begin()
+        self.target_copy = self.target_mobject  # alignment would be a no-op: nothing to protect
+        Animation.begin(self)  # skips Transform.begin's copy + align
@@ -0,0 +1,218 @@
+# [CHECKPOINT-1..5 Active; Mirrors CHECKPOINTS.md]
+# WHY: FM-3 pacing checks shouldn't need a render. With FA_TIMELINE=<out.json> the scene
+# runs construct() with every play skipped (no rasterization, no encode) and voiceover
+# durations read from the TTS cache manifest, then writes the beat schedule:
+# key, start, audio duration, animation run times, slack (+) / overrun (−) vs. the audio.
+# Usage (repo root):  python -m helpers.timeline [-o media/timeline.json] [--section NAME]
+from __future__ import annotations
+
+import argparse
+import atexit
+import json
+import os
+import time
+from typing import List, Optional
+
+TIMELINE_ENV = "FA_TIMELINE"
+TIGHT_SLACK = 0.10  # seconds; below this a beat is flagged "tight"
+
+
+def beat_key(scene, text: str) -> str:
+    """VO key of a (whitespace-normalized) voiceover line; "?" when it isn't in scene.vo."""
+    vo = getattr(scene, "vo", None) or {}
+    return next((k for k, line in vo.items() if " ".join(line.split()) == text), "?")
+
+
+def _voiceover_entry(scene) -> str:
+    """Method voiceover() adds its clip through: manim-voiceover 0.4 calls the private
+    _add_voiceover_text(text, service_kwargs=..., subcaption...), 0.3 the public
+    add_voiceover_text(text, subcaption..., **service_kwargs) (0.4 routes that one to the private)."""
+    return "_add_voiceover_text" if hasattr(scene, "_add_voiceover_text") else "add_voiceover_text"
+
+
+def hook_voiceover_text(scene, after):
+    """Call after(text, tracker) once each voiceover clip is attached (text whitespace-normalized)."""
+    name = _voiceover_entry(scene)
+    original = getattr(scene, name)
+
+    def hooked(text, *args, **kwargs):
+        tracker = original(text, *args, **kwargs)
+        after(" ".join(text.split()), tracker)
+        return tracker
+    setattr(scene, name, hooked)
+
+
+def replace_voiceover_text(scene, add):
+    """Route voiceover clips to add(text, service_kwargs) -> tracker instead of the speech service."""
+    if _voiceover_entry(scene) == "_add_voiceover_text":
+        def replaced(text, service_kwargs=None, **_subcaption):
+            return add(text, service_kwargs or {})
+        scene._add_voiceover_text = replaced
+    else:
+        def replaced(text, subcaption=None, max_subcaption_len=70, subcaption_buff=0.1, **service_kwargs):
+            return add(text, service_kwargs)
+        scene.add_voiceover_text = replaced
+
+
+class DurationTracker:
+    """Stand-in for VoiceoverTracker: same timing API, no audio attached."""
+
+    def __init__(self, scene, duration: float):
+        self.scene = scene
+        self.duration = duration
+        self.start_t = scene.renderer.time
+        self.end_t = self.start_t + duration
+
+    def get_remaining_duration(self, buff: float = 0.0) -> float:
+        return max(self.end_t - float(self.scene.renderer.time) + buff, 0.0)
+
+
+class TimelineRecorder:
+    def __init__(self, scene, out_path: str):
+        self.scene = scene
+        self.out_path = out_path
+        self.t0 = time.perf_counter()
+        self.segments: List[dict] = []
+        self.beat: Optional[dict] = None
+        self.pad_beat: Optional[dict] = None  # beat whose trailing voiceover wait is running
+        self.misses = 0
+
+    # ---- scene hooks ----
+    def _now(self) -> float:
+        return round(float(self.scene.renderer.time), 4)
+
+    def record_play(self, names: str, start: float, run_time: float):
+        if self.pad_beat is not None:
+            self.pad_beat["pad_wait"] = round(run_time, 4)
+            return
+        if self.beat is not None:
+            target = self.beat
+        elif self.segments and self.segments[-1]["key"] is None:
+            target = self.segments[-1]
+        else:  # plays outside any voiceover block
+            target = {"key": None, "start": round(start, 4), "animations": []}
+            self.segments.append(target)
+        target["animations"].append({"name": names, "start": round(start, 4), "run_time": round(run_time, 4)})
+
+    def begin_beat(self, text: str, duration: float):
+        self.beat = {"key": beat_key(self.scene, text), "start": self._now(), "audio_duration": round(duration, 4), "animations": []}
+        self.segments.append(self.beat)
+
+    def end_beat_animations(self):
+        """Called when the `with` body ends (before the trailing voiceover wait)."""
+        beat = self.beat
+        if beat is None:
+            return
+        beat["anim_time"] = round(self._now() - beat["start"], 4)
+        beat["slack"] = round(beat["audio_duration"] - beat["anim_time"], 4)
+        beat["status"] = "overrun" if beat["slack"] < 0 else "tight" if beat["slack"] < TIGHT_SLACK else "ok"
+        beat["pad_wait"] = 0.0
+        self.beat, self.pad_beat = None, beat
+
+    # ---- output ----
+    def report(self) -> dict:
+        for seg in self.segments:
+            if seg["key"] is None:
+                seg["anim_time"] = round(sum(a["run_time"] for a in seg["animations"]), 4)
+        beats = [s for s in self.segments if s["key"] is not None]
+        return {
+            "scene": type(self.scene).__name__,
+            "total_duration": self._now(),
+            "beats": len(beats),
+            "overruns": [b["key"] for b in beats if b.get("status") == "overrun"],
+            "tight": [b["key"] for b in beats if b.get("status") == "tight"],
+            "uncached_lines": self.misses,
+            "wall_seconds": round(time.perf_counter() - self.t0, 3),
+            "timeline": self.segments,
+        }
+
+    def dump(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.out_path)), exist_ok=True)
+        tmp = f"{self.out_path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=1)
+        os.replace(tmp, self.out_path)
+
+
+def install_timeline(scene) -> Optional[TimelineRecorder]:
+    """Switch this scene to dry-run timeline mode if FA_TIMELINE is set; call from setup()."""
+    out_path = os.environ.get(TIMELINE_ENV)
+    if not out_path:
+        return None
+    rec = TimelineRecorder(scene, out_path)
+    renderer = scene.renderer
+    # Every play jumps to its end state; the clock still advances by its run time.
+    renderer._original_skipping_status = True
+    renderer.skip_animations = True
+    for name in ("update_frame", "save_static_frame_data"):
+        if hasattr(renderer, name):
+            setattr(renderer, name, lambda *args, **kwargs: None)
+
+    play = scene.play
+
+    def timed_play(*args, **kwargs):
+        start = renderer.time
+        result = play(*args, **kwargs)
+        rec.record_play(",".join(type(a).__name__ for a in args), start, renderer.time - start)
+        return result
+    scene.play = timed_play
+
+    def add_voiceover_text(text, service_kwargs):
+        service = scene.speech_service
+        duration = service.cached_duration(text)
+        if duration is None:  # not pre-synthesized: fill the cache once, then read the manifest
+            rec.misses += 1
+            service._wrap_generate_from_text(text, **service_kwargs)
+            duration = service.cached_duration(text) or 0.0
+        tracker = DurationTracker(scene, duration)
+        scene.current_tracker = tracker
+        rec.begin_beat(" ".join(text.split()), duration)
+        return tracker
+    replace_voiceover_text(scene, add_voiceover_text)
+
+    wait_for_voiceover = scene.wait_for_voiceover
+
+    def timed_wait_for_voiceover():
+        rec.end_beat_animations()
+        try:
+            return wait_for_voiceover()
+        finally:
+            rec.pad_beat = None
+    scene.wait_for_voiceover = timed_wait_for_voiceover
+
+    atexit.register(rec.dump)
+    return rec
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Dry-run FinalAnimation and write the beat timeline (no frames).")
+    ap.add_argument("-o", "--output", default=os.path.join("media", "timeline.json"))
+    ap.add_argument("--section", default=None, help="only this section (helpers/scene_setup.SECTIONS)")
+    args = ap.parse_args(argv)
+
+    from helpers.ffmpeg_tools import BASE_DIR
+    from helpers.manim_cli import render_scene
+    from helpers.scene_setup import SECTION_ENV
+    output = os.path.abspath(os.path.join(BASE_DIR, args.output))
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    env = {TIMELINE_ENV: output}
+    if args.section:
+        env[SECTION_ENV] = args.section
+    t0 = time.perf_counter()
+    render_scene("FinalAnimation.py", "FinalAnimation", "timeline", env=env, expect_movie=False,
+                 extra_args=["--dry_run", "--renderer=cairo", "--disable_caching"],
+                 log_path=os.path.join(os.path.dirname(output), "timeline.log"))
+    with open(output, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    for seg in data["timeline"]:
+        if seg["key"] is None:
+            continue
+        print(f"{seg['start']:7.2f}s  {seg['key']:18s} audio={seg['audio_duration']:5.2f}  "
+              f"anim={seg['anim_time']:5.2f}  slack={seg['slack']:+5.2f}  {seg['status']}")
+    print(f"Total {data['total_duration']:.2f}s, {data['beats']} beat(s), "
+          f"{len(data['overruns'])} overrun(s), {data['uncached_lines']} uncached line(s) "
+          f"in {time.perf_counter() - t0:.1f}s -> {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+# [CHECKPOINT-1..5 Active; Mirrors CHECKPOINTS.md]
+# WHY: Which beat is slow, and is it slow because the scene keeps growing? Opt-in
+# (FA_TRACE=<trace.json>) spans for every play / wait / voiceover block and the scene
+# helpers, written as Chrome trace JSON (chrome://tracing, ui.perfetto.dev).
+# Each span carries frames produced, mobject count (start/end), scene clock and VO key.
+# Mix into any VoiceoverScene:  class MyScene(TracingMixin, VoiceoverScene)
+# Helpers opt in with @traced("name"); both are pass-through when tracing is off.
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+TRACE_ENV = "FA_TRACE"
+logger = logging.getLogger("manim")  # manim's logger, without importing manim
+
+_active: Optional["Tracer"] = None
+
+
+def active_tracer() -> Optional["Tracer"]:
+    return _active
+
+
+def traced(name: Optional[str] = None, cat: str = "helper"):
+    """Decorator: record a span per call while a scene is being traced; otherwise a plain call."""
+    def decorate(fn):
+        label = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            tracer = _active
+            if tracer is None:
+                return fn(*args, **kwargs)
+            with tracer.span(label, cat):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+class Tracer:
+    """Collects Chrome trace 'X' (complete) events for one scene render."""
+
+    def __init__(self, scene, path: str):
+        self.scene = scene
+        self.path = path
+        self.frames = 0
+        self.vo_key: Optional[str] = None
+        self.events = []
+        self._t0 = time.perf_counter()
+        self._pid = os.getpid()
+
+    def _us(self) -> float:
+        return (time.perf_counter() - self._t0) * 1e6
+
+    def _state(self):
+        renderer = self.scene.renderer
+        return len(self.scene.mobjects), self.frames, round(renderer.time, 4)
+
+    @contextmanager
+    def span(self, name: str, cat: str, **args):
+        start = self._us()
+        mobs0, frames0, clock0 = self._state()
+        try:
+            yield
+        finally:
+            mobs1, frames1, clock1 = self._state()
+            args.update(
+                frames=frames1 - frames0, mobjects_start=mobs0, mobjects_end=mobs1,
+                scene_time=[clock0, clock1], skipped=bool(self.scene.renderer.skip_animations),
+            )
+            if self.vo_key is not None:
+                args.setdefault("vo_key", self.vo_key)
+            self.events.append({
+                "name": name, "cat": cat, "ph": "X", "ts": round(start, 1),
+                "dur": round(self._us() - start, 1), "pid": self._pid,
+                "tid": threading.get_ident(), "args": args,
+            })
+
+    def check_frames(self):
+        """Rendered plays but no frames counted: something replaced write_frame after the counter."""
+        rendered = [e for e in self.events if e["cat"] == "play" and not e["args"]["skipped"]]
+        if rendered and self.frames == 0:
+            logger.warning(f"Trace: {len(rendered)} rendered play(s) but 0 frames counted; "
+                           "the writer's write_frame was replaced after the trace counter")
+
+    def save(self) -> str:
+        meta = [{"name": "process_name", "ph": "M", "pid": self._pid,
+                 "args": {"name": type(self.scene).__name__}}]
+        tmp = f"{self.path}.{self._pid}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": meta + self.events, "displayTimeUnit": "ms"}, f)
+        os.replace(tmp, self.path)
+        return self.path
+
+
+class TracingMixin:
+    """Scene mixin: spans for setup/construct/tear_down and every play/wait/voiceover."""
+
+    _tracer: Optional[Tracer] = None
+
+    def render(self, preview: bool = False):
+        global _active
+        path = os.environ.get(TRACE_ENV)
+        if not path:
+            return super().render(preview)
+        tracer = self._tracer = _active = Tracer(self, path)
+        writer = self.renderer.file_writer
+        setup = self.setup
+
+        def counted_setup():
+            # Counter goes on after setup(): its install_* hooks (chunked encoder, frame hash)
+            # replace writer.write_frame, and the chunked encoder does not chain to the previous one.
+            result = setup()
+            write_frame = writer.write_frame
+
+            def counted_write_frame(frame, num_frames=1):
+                tracer.frames += num_frames
+                return write_frame(frame, num_frames)
+            writer.write_frame = counted_write_frame
+            return result
+        self.setup = counted_setup
+        for stage in ("setup", "construct", "tear_down"):
+            setattr(self, stage, traced(stage, cat="scene")(getattr(self, stage)))
+        try:
+            with tracer.span("render", "scene"):
+                return super().render(preview)
+        finally:
+            _active = None
+            tracer.check_frames()
+            tracer.save()
+
+    def play(self, *args, **kwargs):
+        if self._tracer is None:
+            return super().play(*args, **kwargs)
+        # An animation's own name (e.g. Indicate(..., name="pulse")) else its class. vars(): a
+        # .animate builder answers getattr() by queueing a method call.
+        names = ",".join(getattr(a, "__dict__", {}).get("name") or type(a).__name__ for a in args)
+        with self._tracer.span("play", "play", animations=names):
+            return super().play(*args, **kwargs)
+
+    def wait(self, *args, **kwargs):
+        if self._tracer is None:
+            return super().wait(*args, **kwargs)
+        with self._tracer.span("wait", "play"):
+            return super().wait(*args, **kwargs)
+
+    def _vo_key_for(self, text) -> Optional[str]:
+        vo = getattr(self, "vo", None) or {}
+        return next((key for key, line in vo.items() if line == text), None)
+
+    @contextmanager
+    def voiceover(self, text=None, ssml=None, **kwargs):
+        tracer = self._tracer
+        if tracer is None:
+            with super().voiceover(text=text, ssml=ssml, **kwargs) as tracker:
+                yield tracker
+            return
+        outer_key, tracer.vo_key = tracer.vo_key, self._vo_key_for(text)
+        try:
+            with tracer.span(f"voiceover:{tracer.vo_key or '?'}", "voiceover"):
+                with super().voiceover(text=text, ssml=ssml, **kwargs) as tracker:
+                    yield tracker
+        finally:
+            tracer.vo_key = outer_key
@@ -0,0 +1,292 @@
+# [CHECKPOINT-1..5 Active; Mirrors CHECKPOINTS.md]
+# WHY: One problem = one TransformationSpec. g(x) = a·f(k(x − d)) + c applied to a point
+# gives the step list, coordinates, LaTeX, captions and narration, so a problem bank is
+# data instead of hand-edited step blocks. Pure Python (no manim) so drivers stay light.
+# Step order mirrors the scene: x/k (k), + d, a·y, + c; identity steps are omitted.
+from __future__ import annotations
+
+import json
+import math
+import os
+import re
+from dataclasses import dataclass, field
+from fractions import Fraction
+from typing import Dict, List, Optional, Tuple
+
+SPEC_ENV = "FA_SPEC"  # JSON spec for the scene (set by helpers/batch_render.py)
+
+_WORDS = ["zero", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine", "ten",
+          "eleven", "twelve", "thirteen", "fourteen", "fifteen", "sixteen", "seventeen",
+          "eighteen", "nineteen", "twenty"]
+
+
+def _frac(v: float) -> Fraction:
+    return Fraction(v).limit_denominator(100)
+
+
+def tex_num(v: float) -> str:
+    """-1 -> '-1', 0.5 -> '\\frac{1}{2}'."""
+    f = _frac(v)
+    if f.denominator == 1:
+        return str(f.numerator)
+    sign = "-" if f < 0 else ""
+    return rf"{sign}\frac{{{abs(f.numerator)}}}{{{f.denominator}}}"
+
+
+def tex_paren(v: float) -> str:
+    """Parenthesize negatives inside arithmetic: -2 -> '(-2)'."""
+    return f"({tex_num(v)})" if v < 0 else tex_num(v)
+
+
+def say_num(v: float) -> str:
+    """Spoken form for narration: -2 -> 'negative two', 0.5 -> 'one half'."""
+    f = _frac(v)
+    sign = "negative " if f < 0 else ""
+    f = abs(f)
+    if f.denominator == 1:
+        n = f.numerator
+        return sign + (_WORDS[n] if n < len(_WORDS) else str(n))
+    if f == Fraction(1, 2):
+        return sign + "one half"
+    return sign + f"{say_num(f.numerator)} over {say_num(f.denominator)}"
+
+
+def _units(v: float) -> str:
+    return f"{say_num(v)} unit" + ("" if abs(v) == 1 else "s")
+
+
+@dataclass(frozen=True)
+class TransformStep:
+    key: str                       # VO/beat key, e.g. "y_reflect"
+    axis: str                      # "x" | "y"
+    map_term: str                  # token of x' = x/k + d, y' = a y + c: "x/k" | "d" | "ay" | "c"
+    g_term: str                    # token of g(x): "inner" | "a" | "c"
+    multiplicative: bool           # reflections/scales also pulse the primed variable
+    start: Tuple[float, float]
+    end: Tuple[float, float]
+    math: str                      # Steps-panel justification
+    caption: str
+    narration: str
+    is_last: bool = False
+    scale: float = 1.0             # the stage on its axis: v' = scale * v + offset
+    offset: float = 0.0
+
+    @property
+    def label(self) -> str:
+        return point_tex(self.end)
+
+    def apply(self, x, y):
+        """Stage map on scalars or whole NumPy arrays (one operation per axis)."""
+        if self.axis == "x":
+            return x * self.scale + self.offset, y
+        return x, y * self.scale + self.offset
+
+
+def point_tex(p: Tuple[float, float]) -> str:
+    return f"({tex_num(p[0])},{tex_num(p[1])})"
+
+
+@dataclass(frozen=True)
+class TransformationSpec:
+    a: float
+    k: float
+    d: float
+    c: float
+    point: Tuple[float, float]
+    name: Optional[str] = field(default=None, compare=False)
+
+    def __post_init__(self):
+        if self.k == 0:
+            raise ValueError("k must be non-zero (x' = x/k + d)")
+        object.__setattr__(self, "point", tuple(self.point))
+
+    # ---- construction ----
+    @classmethod
+    def from_dict(cls, data: dict) -> "TransformationSpec":
+        return cls(a=data["a"], k=data["k"], d=data["d"], c=data["c"],
+                   point=tuple(data["point"]), name=data.get("name"))
+
+    @classmethod
+    def from_env(cls) -> Optional["TransformationSpec"]:
+        raw = os.environ.get(SPEC_ENV)
+        return cls.from_dict(json.loads(raw)) if raw else None
+
+    def to_dict(self) -> dict:
+        data = {"a": self.a, "k": self.k, "d": self.d, "c": self.c, "point": list(self.point)}
+        if self.name:
+            data["name"] = self.name
+        return data
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), sort_keys=True)
+
+    @property
+    def slug(self) -> str:
+        if self.name:
+            return re.sub(r"[^A-Za-z0-9_-]+", "_", self.name)
+        parts = [f"{n}{tex_num(v)}" for n, v in (("a", self.a), ("k", self.k), ("d", self.d), ("c", self.c))]
+        parts.append("p{}_{}".format(*(tex_num(v) for v in self.point)))
+        return re.sub(r"[^A-Za-z0-9_-]+", "", "_".join(parts).replace("-", "m").replace(r"\frac", "f"))
+
+    # ---- geometry ----
+    def final_point(self) -> Tuple[float, float]:
+        x, y = self.point
+        return (x / self.k + self.d, self.a * y + self.c)
+
+    def path(self) -> List[Tuple[float, float]]:
+        return [self.point] + [s.end for s in self.steps()]
+
+    def bounds(self) -> Tuple[float, float, float, float]:
+        xs, ys = zip(*self.path())
+        return min(xs), max(xs), min(ys), max(ys)
+
+    def axis_ranges(self, x_range=(-4, 4), y_range=(-4, 7)) -> Tuple[List[int], List[int]]:
+        """Default plane ranges, widened (never shrunk) to keep the whole path on screen."""
+        xmin, xmax, ymin, ymax = self.bounds()
+        return ([min(x_range[0], math.floor(xmin) - 1), max(x_range[1], math.ceil(xmax) + 1), 1],
+                [min(y_range[0], math.floor(ymin) - 1), max(y_range[1], math.ceil(ymax) + 1), 1])
+
+    # ---- g(x) tokens for the right column ----
+    def g_tokens(self) -> Tuple[List[str], Dict[str, Optional[int]]]:
+        """MathTex substrings for g(x) and the index of each highlightable term."""
+        tokens, roles = ["g(x)", "="], {"a": None, "inner": None, "c": None}
+        if self.a != 1:
+            roles["a"] = len(tokens)
+            tokens.append("-" if self.a == -1 else tex_num(self.a))
+        tokens.append("f(")
+        roles["inner"] = len(tokens)
+        tokens.append(self._inner_tex())
+        tokens.append(")")
+        if self.c != 0:
+            tokens.append("+" if self.c > 0 else "-")
+            roles["c"] = len(tokens)
+            tokens.append(tex_num(abs(self.c)))
+        return tokens, roles
+
+    def _inner_tex(self) -> str:
+        k, const = self.k, -self.k * self.d      # k(x - d) = kx - kd
+        lead = "x" if k == 1 else "-x" if k == -1 else f"{tex_num(k)}x"
+        if const == 0:
+            return lead
+        return lead + ("+" if const > 0 else "-") + tex_num(abs(const))
+
+    def problem_tex(self) -> str:
+        return point_tex(self.point) + r"\ \text{ on }f"
+
+    # ---- steps ----
+    def steps(self) -> List[TransformStep]:
+        raw = []
+        x, y = self.point
+        xp = 0  # primes already used on x / y
+        yp = 0
+        if self.k != 1:
+            nx = x / self.k
+            xp += 1
+            xq = "'" * xp
+            if self.k == -1:
+                raw.append(("y_reflect", "x", "x/k", "inner", True, (x, y), (nx, y),
+                            rf"x{xq} = \frac{{{tex_num(x)}}}{{{tex_num(self.k)}}} = {tex_num(nx)}",
+                            "Reflect across the $y$-axis",
+                            "reflect across the y axis. The x coordinate changes sign; y is unchanged."))
+            else:
+                raw.append(("h_scale", "x", "x/k", "inner", True, (x, y), (nx, y),
+                            rf"x{xq} = \frac{{{tex_num(x)}}}{{{tex_num(self.k)}}} = {tex_num(nx)}",
+                            rf"Scale $x$ by $\frac{{1}}{{{tex_num(self.k)}}}$",
+                            f"scale horizontally by one over {say_num(self.k)}. "
+                            f"The x coordinate is divided by {say_num(self.k)}; y is unchanged."))
+            x = nx
+        if self.d != 0:
+            nx = x + self.d
+            xp += 1
+            xq = "'" * xp
+            left = self.d < 0
+            raw.append(("left_shift" if left else "right_shift", "x", "d", "inner", False, (x, y), (nx, y),
+                        rf"x{xq} = {tex_num(x)} + {tex_paren(self.d)} = {tex_num(nx)}",
+                        f"Translate {'left' if left else 'right'} by ${tex_num(abs(self.d))}$",
+                        f"translate {_units(abs(self.d))} to the {'left' if left else 'right'}. "
+                        f"Only the x coordinate {'decreases' if left else 'increases'} by {say_num(abs(self.d))}."))
+            x = nx
+        if self.a != 1:
+            ny = self.a * y
+            yp += 1
+            yq = "'" * yp
+            if self.a == -1:
+                raw.append(("x_reflect", "y", "ay", "a", True, (x, y), (x, ny),
+                            rf"y{yq} = {tex_paren(self.a)} \cdot {tex_paren(y)} = {tex_num(ny)}",
+                            "Reflect across the $x$-axis",
+                            "reflect across the x axis. The y coordinate changes sign; x is unchanged."))
+            else:
+                raw.append(("v_scale", "y", "ay", "a", True, (x, y), (x, ny),
+                            rf"y{yq} = {tex_paren(self.a)} \cdot {tex_paren(y)} = {tex_num(ny)}",
+                            f"Scale $y$ by ${tex_num(self.a)}$",
+                            f"scale vertically by {say_num(self.a)}. "
+                            f"The y coordinate is multiplied by {say_num(self.a)}; x is unchanged."))
+            y = ny
+        if self.c != 0:
+            ny = y + self.c
+            yp += 1
+            yq = "'" * yp
+            up = self.c > 0
+            raw.append(("up_shift" if up else "down_shift", "y", "c", "c", False, (x, y), (x, ny),
+                        rf"y{yq} = {tex_num(y)} + {tex_paren(self.c)} = {tex_num(ny)}",
+                        f"Translate {'up' if up else 'down'} by ${tex_num(abs(self.c))}$",
+                        f"translate {'upward' if up else 'downward'} by {_units(abs(self.c))}. "
+                        f"Only the y coordinate {'increases' if up else 'decreases'} by {say_num(abs(self.c))}."))
+
+        steps = []
+        for i, (key, axis, map_term, g_term, mult, start, end, tex, caption, text) in enumerate(raw):
+            ordinal = _ordinal(i, len(raw))
+            if mult:
+                scale, offset = (1 / self.k if axis == "x" else self.a), 0.0
+            else:
+                scale, offset = 1.0, (self.d if axis == "x" else self.c)
+            steps.append(TransformStep(key, axis, map_term, g_term, mult, start, end, tex, caption,
+                                       f"{ordinal}, {text}", is_last=(i == len(raw) - 1),
+                                       scale=scale, offset=offset))
+        return steps
+
+    # ---- narration / TeX inventory ----
+    def _say_g(self) -> str:
+        """'negative f of minus x minus one, plus three' for g(x) = -f(-x-1)+3."""
+        k, const = self.k, -self.k * self.d
+        inner = "x" if k == 1 else "minus x" if k == -1 else f"{say_num(k)} x"
+        if const != 0:
+            inner += f" {'plus' if const > 0 else 'minus'} {say_num(abs(const))}"
+        outer = "f" if self.a == 1 else "negative f" if self.a == -1 else f"{say_num(self.a)} times f"
+        text = f"{outer} of {inner}"
+        if self.c != 0:
+            text += f", {'plus' if self.c > 0 else 'minus'} {say_num(abs(self.c))}"
+        return text
+
+    def narrations(self) -> Dict[str, str]:
+        """Beat key -> VO text for every problem-specific beat (announce, start, steps, wrap)."""
+        px, py = self.point
+        out = {
+            "announce_problem": (
+                f"Now, the problem. We are given g of x equals {self._say_g()}, "
+                f"and the point {say_num(px)}, {say_num(py)} lies on the graph of f. "
+                "We will find its image under g."
+            ),
+            "start": f"We begin at the point {say_num(px)}, {say_num(py)} on f.",
+        }
+        out.update((s.key, s.narration) for s in self.steps())
+        fx, fy = self.final_point()
+        out["wrap"] = f"Collecting all steps, the resulting point is {say_num(fx)}, {say_num(fy)}."
+        return out
+
+    def tex_items(self) -> List[Tuple[str, str]]:
+        """(expression, environment) pairs the scene will typeset, for the TeX pre-pass."""
+        tokens, _ = self.g_tokens()
+        items = [(" ".join(tokens), "align*")] + [(t, "align*") for t in tokens]
+        items += [(self.problem_tex(), "align*"), (point_tex(self.point), "align*")]
+        for s in self.steps():
+            items += [(s.math, "align*"), (s.label, "align*"), (s.caption, "center")]
+        return items
+
+
+def _ordinal(i: int, n: int) -> str:
+    if i == 0:
+        return "First"
+    if i == n - 1:
+        return "Finally"
+    return ("Next", "Now", "Then")[(i - 1) % 3]
@@ -0,0 +1,9 @@
+# [CHECKPOINT-1..5 Active; Mirrors CHECKPOINTS.md]
+# WHY: the helpers import as `helpers.*` / `config` from the repo root (as `python -m` runs them).
+# These tests cover the manim-free modules; anything needing manim/ffmpeg skips without it.
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
@@ -0,0 +1,99 @@
+# Content-addressed TTS cache (helpers/audio_cache.py): keys, LRU eviction, batched hit stamps.
+import json
+import os
+
+import pytest
+
+from helpers.audio_cache import AudioCache
+
+
+@pytest.fixture
+def model(tmp_path):
+    path = tmp_path / "voice.onnx"
+    path.write_bytes(b"model-a")
+    return str(path)
+
+
+def add_clip(cache: AudioCache, key: str, size: int = 100) -> dict:
+    name = f"{key}.mp3"
+    with open(os.path.join(cache.cache_dir, name), "wb") as f:
+        f.write(b"\0" * size)
+    return cache.store(key, name, f"text {key}", duration=1.0, sample_rate=22050)
+
+
+def stamps(cache: AudioCache) -> dict:
+    with open(cache.manifest_path, "r", encoding="utf-8") as f:
+        return {k: e["last_used"] for k, e in json.load(f)["entries"].items()}
+
+
+def test_key_covers_text_model_speaker_and_tempo(tmp_path, model):
+    cache = AudioCache(tmp_path / "cache")
+    key = cache.key("hello", model, None, 1.0)
+    assert key == AudioCache(tmp_path / "cache").key("hello", model, None, 1.0)  # stable across instances
+    assert key == cache.key("hello", model, None, 1.00001)  # tempo rounded to 4 places
+    assert len({key, cache.key("hello!", model, None, 1.0), cache.key("hello", model, 1, 1.0),
+                cache.key("hello", model, None, 1.1)}) == 4
+    other = tmp_path / "other.onnx"
+    other.write_bytes(b"model-b")
+    assert cache.key("hello", str(other), None, 1.0) != key
+    same = tmp_path / "copy.onnx"
+    same.write_bytes(b"model-a")  # keyed on the model's content, not its path
+    assert cache.key("hello", str(same), None, 1.0) == key
+
+
+def test_model_digest_is_recorded(tmp_path, model):
+    cache = AudioCache(tmp_path / "cache")
+    digest = cache.model_digest(model)
+    assert cache.load()["models"][os.path.abspath(model)]["sha256"] == digest
+
+
+def test_lookup_hit_miss_and_missing_file(tmp_path):
+    cache = AudioCache(tmp_path / "cache")
+    add_clip(cache, "a")
+    assert cache.lookup("a")["file"] == "a.mp3"
+    assert cache.lookup("nope") is None
+    os.remove(os.path.join(cache.cache_dir, "a.mp3"))
+    assert cache.lookup("a") is None
+    assert "a" not in cache.load()["entries"]
+
+
+def test_lru_eviction(tmp_path, monkeypatch):
+    clock = iter(range(100, 200))
+    monkeypatch.setattr("helpers.audio_cache.time.time", lambda: next(clock))
+    cache = AudioCache(tmp_path / "cache", max_bytes=250)
+    add_clip(cache, "a")
+    add_clip(cache, "b")
+    cache.lookup("a")  # a is now more recent than b
+    add_clip(cache, "c")  # 300 bytes > 250: the least recently used goes
+    assert sorted(cache.load()["entries"]) == ["a", "c"]
+    assert not os.path.exists(os.path.join(cache.cache_dir, "b.mp3"))
+    assert cache.total_bytes() == 200
+
+
+def test_new_entry_is_never_evicted(tmp_path):
+    cache = AudioCache(tmp_path / "cache", max_bytes=50)
+    add_clip(cache, "a")
+    assert sorted(cache.load()["entries"]) == ["a"]
+
+
+def test_hits_are_batched_until_flush(tmp_path):
+    cache = AudioCache(tmp_path / "cache")
+    add_clip(cache, "a")
+    before = stamps(cache)
+    mtime = os.stat(cache.manifest_path).st_mtime_ns
+    for _ in range(5):
+        hit = cache.lookup("a")
+    assert os.stat(cache.manifest_path).st_mtime_ns == mtime  # no rewrite per hit
+    assert stamps(cache) == before
+    cache.flush()
+    assert stamps(cache)["a"] == hit["last_used"] >= before["a"]
+    cache.flush()  # nothing pending: no rewrite
+    assert stamps(cache)["a"] == hit["last_used"]
+
+
+def test_evict_writes_pending_stamps(tmp_path):
+    cache = AudioCache(tmp_path / "cache")
+    add_clip(cache, "a")
+    hit = cache.lookup("a")
+    assert cache.evict() == []  # no cap: nothing removed, the stamp still lands
+    assert stamps(cache)["a"] == hit["last_used"]
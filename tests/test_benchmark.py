@@ -0,0 +1,92 @@
+# Benchmark regression check (helpers/benchmark.py) and the phase timer behind it.
+import threading
+import types
+
+import pytest
+
+from helpers import phase_timer
+from helpers.benchmark import compare
+from helpers.phase_timer import PHASES, PhaseTimer
+
+
+def run(wall=10.0, frames=300, rss=500.0, **phases):
+    return {"wall_seconds": wall, "scene_seconds": wall, "frames": frames, "peak_rss_mb": rss,
+            "phases": {p: phases.get(p, 1.0) for p in (*PHASES, "other")}}
+
+
+def suite(**results):
+    return {"results": {key.replace("__", "/"): r for key, r in results.items()}}
+
+
+def test_within_tolerance_passes():
+    baseline = suite(full__low=run(wall=10.0, render=4.0))
+    assert compare(suite(full__low=run(wall=11.4, render=4.5)), baseline, tolerance=0.15) == []
+
+
+def test_over_tolerance_is_reported():
+    baseline = suite(full__low=run(wall=10.0, render=4.0))
+    problems = compare(suite(full__low=run(wall=12.0, render=4.0)), baseline, tolerance=0.15)
+    assert problems == ["full/low: wall_seconds 10.00 -> 12.00 (+20%)"]
+    assert compare(suite(full__low=run(wall=12.0, render=4.0)), baseline, tolerance=0.25) == []
+
+
+def test_noise_floor():
+    # +50% but only 0.05 s: under the seconds floor. RSS +10 MB stays under its 16 MB floor.
+    baseline = suite(full__low=run(tex=0.1, rss=50.0))
+    assert compare(suite(full__low=run(tex=0.15, rss=60.0)), baseline, tolerance=0.15) == []
+    problems = compare(suite(full__low=run(tex=0.5, rss=100.0)), baseline, tolerance=0.15)
+    assert [p.split(" ")[1] for p in problems] == ["peak_rss_mb", "phases.tex"]
+
+
+def test_frames_always_reported_and_new_keys_skipped():
+    baseline = suite(full__low=run(frames=300))
+    current = suite(full__low=run(frames=301), outro__low=run(wall=99.0))
+    assert compare(current, baseline, tolerance=10.0) == ["full/low: frames 300 -> 301"]
+
+
+def test_missing_rss_is_ignored():
+    assert compare(suite(a=run(rss=None)), suite(a=run(rss=10.0))) == []
+
+
+def test_timer_is_exclusive():
+    timer = PhaseTimer()
+    timer.enter("render")
+    timer.enter("tex")
+    timer.exit()
+    timer.exit()
+    assert timer.seconds["render"] >= 0 and timer.seconds["tex"] >= 0
+    assert set(timer.report()["phases"]) == {*PHASES, "other"}
+
+
+def test_shared_wrappers_install_once_and_follow_the_active_timer(monkeypatch):
+    owner = types.SimpleNamespace(work=lambda x: x * 2)
+    original = owner.work
+    first = PhaseTimer()
+    monkeypatch.setattr(phase_timer, "_active", first)
+    phase_timer._wrap_shared(owner, "work", "tts")
+    wrapped = owner.work
+    phase_timer._wrap_shared(owner, "work", "tts")  # a second render in the same process
+    assert owner.work is wrapped and wrapped.__wrapped__ is original
+
+    calls = []
+    monkeypatch.setattr(PhaseTimer, "enter", lambda self, phase: calls.append((self, phase)))
+    monkeypatch.setattr(PhaseTimer, "exit", lambda self: None)
+    assert owner.work(3) == 6
+    second = PhaseTimer()
+    monkeypatch.setattr(phase_timer, "_active", second)
+    owner.work(1)
+    monkeypatch.setattr(phase_timer, "_active", None)
+    owner.work(1)
+    assert calls == [(first, "tts"), (second, "tts")]
+
+    thread = threading.Thread(target=owner.work, args=(1,))  # worker threads are not timed
+    monkeypatch.setattr(phase_timer, "_active", second)
+    thread.start()
+    thread.join()
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("tolerance", [0.0, 0.15])
+def test_identical_runs_pass(tolerance):
+    data = suite(full__low=run(), intro__low=run(wall=3.0))
+    assert compare(data, data, tolerance=tolerance) == []
@@ -0,0 +1,64 @@
+# Words-per-minute fit of the estimated speech backend (helpers/estimated_speech.py).
+import pytest
+
+pytest.importorskip("manim_voiceover")  # the module also defines the SpeechService subclass
+
+from helpers.audio_cache import AudioCache  # noqa: E402
+from helpers.estimated_speech import (  # noqa: E402
+    DEFAULT_LEAD, DEFAULT_WPM, MIN_SECONDS, Calibration, calibrate, count_words, fit_calibration,
+)
+
+
+def line(wpm, lead):
+    return lambda words: words * 60.0 / wpm + lead
+
+
+def test_least_squares_recovers_rate_and_lead():
+    seconds = line(150.0, 0.3)
+    cal = fit_calibration((w, seconds(w)) for w in (5, 12, 20, 31))
+    assert cal.wpm == pytest.approx(150.0, abs=0.01)
+    assert cal.lead == pytest.approx(0.3, abs=1e-4)
+    assert cal.samples == 4
+    assert cal.seconds("one two three four five six") == pytest.approx(seconds(6), abs=1e-3)
+
+
+def test_no_usable_pairs_gives_defaults():
+    assert fit_calibration([]) == Calibration()
+    assert fit_calibration([(0, 1.0), (3, 0.0)]) == Calibration(DEFAULT_WPM, DEFAULT_LEAD, 0)
+
+
+@pytest.mark.parametrize("pairs", [
+    [(10, 4.0), (20, 8.0)],                 # fewer than three clips
+    [(10, 4.0), (10, 4.4), (10, 3.6)],      # no spread in word counts
+    [(10, 6.0), (20, 5.0), (30, 4.0)],      # negative slope
+    [(10, 6.0), (20, 7.0), (30, 8.0)],      # lead over one second
+])
+def test_degenerate_fits_fall_back_to_a_ratio(pairs):
+    cal = fit_calibration(pairs)
+    ratio = sum(s for _, s in pairs) / sum(w for w, _ in pairs)
+    assert cal.lead == 0.0
+    assert cal.wpm == pytest.approx(60.0 / ratio, abs=0.01)
+    assert cal.samples == len(pairs)
+
+
+def test_seconds_tempo_and_floor():
+    cal = Calibration(wpm=120.0, lead=0.0)
+    assert cal.seconds("a b c d", tempo=2.0) == pytest.approx(1.0)
+    assert cal.seconds("") == MIN_SECONDS
+    assert count_words("x prime, equals x/k -- plus d's") == 7
+
+
+def test_calibrate_from_manifest_prefers_the_voice(tmp_path):
+    cache = AudioCache(tmp_path)
+    seconds = {"v1": line(150.0, 0.2), "v2": line(100.0, 0.2)}
+    for voice, fit in seconds.items():
+        for n, words in enumerate((4, 9, 15)):
+            name = f"{voice}_{n}.mp3"
+            (tmp_path / name).write_bytes(b"\0")
+            text = " ".join(["word"] * words)
+            # Clips rendered at tempo 1.25 are 1/1.25 as long; calibrate() undoes that.
+            cache.store(f"{voice}{n}", name, text, fit(words) / 1.25, 22050, voice=voice, tempo=1.25)
+    assert calibrate(str(tmp_path), "v2").wpm == pytest.approx(100.0, abs=0.01)
+    assert calibrate(str(tmp_path), "v1").wpm == pytest.approx(150.0, abs=0.01)
+    assert calibrate(str(tmp_path), "unknown").samples == 6
+    assert calibrate(str(tmp_path / "empty")) == Calibration()
@@ -0,0 +1,89 @@
+# Frame-hash manifest comparison (helpers/frame_hash.py); manifests are built by hand here.
+from helpers.frame_hash import FrameHashRecorder, compare, differing_beats, first_divergence
+
+
+def seg(key, start, runs, cached=False):
+    s = {"key": key, "start": start, "frames": [list(r) for r in runs]}
+    if cached:
+        s["cached"] = True
+    return s
+
+
+def manifest(*segments, frame_rate=30):
+    frames = sum(count for s in segments for _, count in s["frames"])
+    return {"version": 1, "renderer": "opengl", "pixel_size": [1920, 1080], "frame_rate": frame_rate,
+            "frames": frames, "segments": list(segments)}
+
+
+BASE = manifest(
+    seg(None, 0, [("aa", 10)]),
+    seg("start", 10, [("bb", 5), ("cc", 20)]),
+    seg("y_reflect", 35, [("dd", 30)]),
+)
+
+
+def test_identical_manifests():
+    assert first_divergence(BASE, BASE) is None
+    assert compare(BASE, BASE) == []
+
+
+def test_same_frames_split_into_different_runs():
+    # Run boundaries are not frames: 20 frames of "cc" == 12 + 8 (e.g. a replayed cached beat).
+    other = manifest(seg(None, 0, [("aa", 4), ("aa", 6)]), seg("start", 10, [("bb", 5), ("cc", 12), ("cc", 8)]),
+                     seg("y_reflect", 35, [("dd", 30)]))
+    assert first_divergence(BASE, other) is None
+
+
+def test_first_diverging_frame_inside_a_run():
+    other = manifest(seg(None, 0, [("aa", 10)]), seg("start", 10, [("bb", 5), ("cc", 7), ("XX", 13)]),
+                     seg("y_reflect", 35, [("dd", 30)]))
+    div = first_divergence(BASE, other)
+    assert div["frame"] == 22
+    assert div["time"] == round(22 / 30, 3)
+    assert div["a"] == {"beat": "start", "frame_in_beat": 12, "cached": False, "ended": False}
+    assert div["b"]["beat"] == "start"
+    assert differing_beats(BASE, other) == ["start"]
+    assert compare(BASE, other)[0] == "first diverging frame 22 (t=0.733s): beat start frame 12"
+
+
+def test_divergence_between_beats_and_cached_note():
+    other = manifest(seg(None, 0, [("aa", 3), ("ZZ", 7)]), seg("start", 10, [("bb", 5), ("cc", 20)], cached=True),
+                     seg("y_reflect", 35, [("dd", 30)]))
+    div = first_divergence(BASE, other)
+    assert div["frame"] == 3 and div["a"]["beat"] == "(between beats #0)"
+    assert differing_beats(BASE, other) == []  # only the stretch before the first beat changed
+
+    other = manifest(seg(None, 0, [("aa", 10)]), seg("start", 10, [("bb", 5), ("cc", 20)]),
+                     seg("y_reflect", 35, [("dd", 29), ("EE", 1)], cached=True))
+    notes = compare(BASE, other)
+    assert notes[0].startswith("first diverging frame 64 ")
+    assert any("beat cache" in n for n in notes)
+
+
+def test_one_run_ends_early():
+    shorter = manifest(seg(None, 0, [("aa", 10)]), seg("start", 10, [("bb", 5), ("cc", 20)]),
+                       seg("y_reflect", 35, [("dd", 20)]))
+    div = first_divergence(BASE, shorter)
+    assert div["frame"] == 55
+    assert div["a"]["ended"] is False and div["b"]["ended"] is True
+    assert compare(BASE, shorter)[0] == "frame counts differ: 65 vs 55 (first extra frame 55)"
+    missing_beat = manifest(seg(None, 0, [("aa", 10)]), seg("start", 10, [("bb", 5), ("cc", 20)]))
+    assert differing_beats(BASE, missing_beat) == ["y_reflect"]
+
+
+def test_incomparable_settings():
+    notes = compare(BASE, dict(BASE, frame_rate=60))
+    assert notes == ["frame_rate: 30 vs 60 (hashes are not comparable)"]
+
+
+def test_recorder_run_length_segments():
+    rec = FrameHashRecorder(scene=None, out_path="unused.json")
+    rec.replay([("aa", 2)])          # before any beat: a keyless segment
+    rec.begin_beat("start")
+    rec.replay([("aa", 1), ("bb", 3)])
+    rec.end_beat()
+    rec.replay([("bb", 1)])
+    assert rec.frames == 7
+    assert [(s["key"], s["start"], s["frames"]) for s in rec.segments] == [
+        (None, 0, [["aa", 2]]), ("start", 2, [["aa", 1], ["bb", 3]]), (None, 6, [["bb", 1]])]
+    assert rec.segments[1]["cached"] is True and rec.last["key"] == "start"
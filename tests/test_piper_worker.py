@@ -0,0 +1,149 @@
+# Resident Piper pool (helpers/piper_worker.py) against helpers/piper_stub.py: no voice model needed.
+import os
+import shutil
+import subprocess
+import textwrap
+import wave
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from conftest import ROOT
+from helpers import piper_stub
+from helpers.piper_worker import PiperWorkerError, PiperWorkerPool, piper_command
+
+STUB = os.path.join(ROOT, "helpers", "piper_stub.py")
+
+
+@pytest.fixture
+def model(tmp_path):
+    path = tmp_path / "voice.onnx"  # the stub only checks that it exists
+    path.write_bytes(b"")
+    return str(path)
+
+
+@pytest.fixture
+def pools():
+    opened = []
+
+    def make(*args, **kwargs):
+        pool = PiperWorkerPool(*args, **kwargs)
+        opened.append(pool)
+        return pool
+    yield make
+    for pool in opened:
+        pool.close()
+
+
+def fake_piper(tmp_path, behaviour: str) -> str:
+    """piper_stub with a misbehaving --json-input mode; one-shot calls still work.
+    crash_once: the first request kills the process. silent: never replies. exit: dies at start."""
+    script = tmp_path / f"piper_{behaviour}.py"
+    marker = tmp_path / f"{behaviour}.crashed"
+    script.write_text(textwrap.dedent(f"""
+        import os, sys
+        sys.path.insert(0, {ROOT!r})
+        from helpers import piper_stub
+        if "--json-input" in sys.argv:
+            if {behaviour!r} == "exit":
+                sys.exit(3)
+            if {behaviour!r} == "silent":
+                for _ in sys.stdin:
+                    pass
+                sys.exit(0)
+            if {behaviour!r} == "crash_once" and not os.path.exists({str(marker)!r}):
+                sys.stdin.readline()
+                open({str(marker)!r}, "w").close()
+                os._exit(1)
+        sys.exit(piper_stub.main())
+    """))
+    return str(script)
+
+
+def frames(path: str) -> int:
+    with wave.open(path, "rb") as w:
+        return w.getnframes()
+
+
+def expected_frames(text: str) -> int:
+    return int(piper_stub.SAMPLE_RATE * piper_stub.SECONDS_PER_CHAR * max(1, len(text)))
+
+
+def test_health_check_restarts_dead_workers(tmp_path, model, pools):
+    pool = pools(STUB, model, str(tmp_path / "out"), size=2)
+    assert pool.health_check() == 2
+    victim = pool.workers[0]
+    victim.proc.kill()
+    victim.proc.wait()
+    assert not victim.alive()
+    assert pool.health_check() == 2
+    assert victim.restarts == 1 and pool.workers[1].restarts == 0
+
+
+def test_concurrent_synthesize(tmp_path, model, pools):
+    out = tmp_path / "out"
+    pool = pools(STUB, model, str(out), size=2)
+    texts = [f"line number {n} " + "x" * n for n in range(12)]
+    paths = [str(out / f"{n}.wav") for n in range(len(texts))]
+    with ThreadPoolExecutor(max_workers=6) as ex:
+        results = list(ex.map(pool.synthesize, texts, paths))
+    assert results == paths
+    for text, path in zip(texts, paths):
+        assert frames(path) == expected_frames(text)
+    assert all(w.alive() and w.restarts == 0 for w in pool.workers)
+
+
+def test_restart_after_killed_worker(tmp_path, model, pools):
+    out = tmp_path / "out"
+    pool = pools(STUB, model, str(out), size=1)
+    pool.synthesize("before", str(out / "a.wav"))
+    pool.workers[0].proc.kill()  # dies between requests
+    pool.workers[0].proc.wait()
+    assert pool.synthesize("after", str(out / "b.wav")) == str(out / "b.wav")
+    assert frames(str(out / "b.wav")) == expected_frames("after")
+    assert pool.workers[0].restarts == 1
+
+
+def test_retry_after_crash_mid_request(tmp_path, model, pools):
+    out = tmp_path / "out"
+    pool = pools(fake_piper(tmp_path, "crash_once"), model, str(out), size=1)
+    assert pool.synthesize("hello", str(out / "a.wav")) == str(out / "a.wav")
+    assert frames(str(out / "a.wav")) == expected_frames("hello")
+    assert pool.workers[0].restarts == 1
+
+
+def test_timeout_restarts_once_then_raises(tmp_path, model, pools):
+    pool = pools(fake_piper(tmp_path, "silent"), model, str(tmp_path / "out"), size=1, timeout=0.3)
+    with pytest.raises(PiperWorkerError, match="timed out"):
+        pool.synthesize("hello", str(tmp_path / "out" / "a.wav"))
+    assert pool.workers[0].restarts == 1
+    # The worker goes back to the pool: the next request gets a fresh attempt, not a hang.
+    with pytest.raises(PiperWorkerError, match="timed out"):
+        pool.synthesize("again", str(tmp_path / "out" / "b.wav"))
+
+
+def test_failing_pool_leaves_one_shot_path(tmp_path, model, pools):
+    piper = fake_piper(tmp_path, "exit")
+    pool = pools(piper, model, str(tmp_path / "out"), size=1)
+    with pytest.raises(PiperWorkerError):  # what PiperService catches before its one-shot call
+        pool.synthesize("hello", str(tmp_path / "out" / "a.wav"))
+    wav = tmp_path / "one_shot.wav"
+    proc = subprocess.run(piper_command(piper) + ["--model", model, "--output_file", str(wav)],
+                          input=b"hello", capture_output=True)
+    assert proc.returncode == 0
+    assert frames(str(wav)) == expected_frames("hello")
+
+
+def test_piper_service_falls_back_to_one_shot(tmp_path, model):
+    pytest.importorskip("manim_voiceover")
+    if shutil.which("ffmpeg") is None:
+        pytest.skip("ffmpeg not on PATH")
+    from helpers.piper_service import PiperService
+    service = PiperService(fake_piper(tmp_path, "exit"), model, workers=1, cache_dir=str(tmp_path / "cache"))
+    try:
+        result = service.generate_from_text("fallback line")
+        assert os.path.exists(result["path"])
+        assert service.is_cached("fallback line")
+        assert not any(w.alive() for w in service._pool.workers)
+    finally:
+        service._pool.close()
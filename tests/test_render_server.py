@@ -0,0 +1,125 @@
+# Change analysis of the warm render server (helpers/render_server.py), on small stand-in sources.
+import textwrap
+
+import pytest
+
+from helpers.render_server import (
+    SourceSnapshot, affected_sections, definitions, helper_import_time_config,
+)
+
+SCENE = '''
+from utils import narr_time
+
+LABEL_SCALE = 0.9
+
+
+def pulse(mob):
+    return mob.scale(PULSE_SCALE)
+
+
+class FinalAnimation(Scene):
+    def setup(self):
+        self.vo = {}
+
+    def construct(self):
+        for name in SECTIONS:
+            self.render_section(name)
+
+    def render_section(self, name):
+        getattr(self, name)()
+
+    def tear_down(self):
+        pass
+
+    def whiteboard_intro(self):
+        self.play(Write(title(INTRO_FONT)))
+
+    def point_transformation_sequence(self):
+        self.play(pulse(self.point))
+        self.point_label = label(LABEL_SCALE)
+
+    def outro_scene(self):
+        self.play(FadeOut(self.point_label))
+'''
+UTILS = '''
+def narr_time(tracker):
+    return tracker.duration
+'''
+CONFIG = {"INTRO_FONT": "48", "PULSE_SCALE": "1.05", "ENCODER": "'chunked'", "UNUSED": "1"}
+
+
+def snapshot(scene=SCENE, config=None, utils=UTILS):
+    return SourceSnapshot({"FinalAnimation": definitions(textwrap.dedent(scene), "FinalAnimation"),
+                           "utils": definitions(utils)}, dict(CONFIG, **(config or {})))
+
+
+ALL = ["whiteboard_intro", "point_transformation_sequence", "outro_scene"]
+
+
+@pytest.mark.parametrize("edit, expected", [
+    (("self.play(Write(title(INTRO_FONT)))", "self.play(Write(title(INTRO_FONT), run_time=2))"),
+     ["whiteboard_intro"]),
+    # outro_scene replays point_transformation_sequence (SECTION_DEPENDENCIES).
+    (("self.point_label = label(LABEL_SCALE)", "self.point_label = label(LABEL_SCALE * 2)"),
+     ["point_transformation_sequence", "outro_scene"]),
+    (("FadeOut(self.point_label)", "FadeOut(self.point_label, shift=UP)"), ["outro_scene"]),
+    (("return mob.scale(PULSE_SCALE)", "return mob.scale(PULSE_SCALE).set_color(RED)"),
+     ["point_transformation_sequence", "outro_scene"]),
+    (("LABEL_SCALE = 0.9", "LABEL_SCALE = 0.8"), ["point_transformation_sequence", "outro_scene"]),
+    (("self.vo = {}", "self.vo = {'a': 1}"), ALL),                  # setup runs for every section
+    (("from utils import narr_time", "from utils import narr_time, whiteboard"), ALL),
+    (("    def tear_down(self):\n        pass", "    def tear_down(self):\n        pass  # done"), []),
+    (("LABEL_SCALE = 0.9", "LABEL_SCALE = 0.90"), []),                # same AST
+])
+def test_scene_edits(edit, expected):
+    old, new = snapshot(), snapshot(SCENE.replace(*edit))
+    assert affected_sections(old, new) == expected
+
+
+def test_config_edits():
+    old = snapshot()
+    assert affected_sections(old, snapshot(config={"INTRO_FONT": "40"})) == ["whiteboard_intro"]
+    assert affected_sections(old, snapshot(config={"PULSE_SCALE": "1.1"})) == [
+        "point_transformation_sequence", "outro_scene"]
+    # Read by a helper (outside the watched files), or by nothing the graph can see: everything.
+    assert affected_sections(old, snapshot(config={"ENCODER": "'manim'"}), external={"ENCODER"}) == ALL
+    assert affected_sections(old, snapshot(config={"UNUSED": "2"})) == ALL
+    assert affected_sections(old, snapshot()) == []
+
+
+def test_utils_edit_follows_references():
+    new_utils = UTILS.replace("tracker.duration", "tracker.duration + 0.1")
+    # Nothing calls narr_time yet: no section is affected.
+    assert affected_sections(snapshot(), snapshot(utils=new_utils)) == []
+    scene = SCENE.replace("self.play(FadeOut(self.point_label))",
+                          "self.play(FadeOut(self.point_label), run_time=narr_time(self.tr))")
+    assert affected_sections(snapshot(scene), snapshot(scene, utils=new_utils)) == ["outro_scene"]
+
+
+def test_helper_import_time_config(tmp_path):
+    (tmp_path / "a.py").write_text(textwrap.dedent('''
+        import importlib
+        from config import FPS, PALETTE
+        _project_config = importlib.import_module("config")
+        BEAT_CACHE = getattr(_project_config, "BEAT_CACHE", True)
+
+        class Pool:
+            size = getattr(_project_config, "POOL_SIZE", 8)
+
+            def grow(self):
+                return getattr(_project_config, "POOL_MAX", 16)  # read at call time
+
+        def rate():
+            import config as project_config
+            return project_config.NARRATION_RATE
+    '''))
+    (tmp_path / "b.py").write_text("import config as project_config\nGOP = project_config.ENCODER_GOP\n")
+    (tmp_path / "notes.txt").write_text("BEAT = getattr(_project_config, 'IGNORED')\n")
+    assert helper_import_time_config(str(tmp_path)) == {"FPS", "PALETTE", "BEAT_CACHE", "POOL_SIZE", "ENCODER_GOP"}
+
+
+def test_helpers_copying_config_at_import():
+    names = helper_import_time_config()
+    assert {"BEAT_CACHE", "TEX_POOL_SIZE", "ENCODER", "NARRATION_PREMIX"} <= names
+    # scene_setup and the speech factory read config when called; a reload reaches them.
+    assert not names & {"VO", "PROBLEM", "PACING", "SPEECH_BACKEND"}
@@ -0,0 +1,52 @@
+# Re-voicing plan (helpers/revoice.py): which beats still fit the frames already rendered.
+import pytest
+
+from helpers.revoice import plan
+
+
+def beat(key, start, end, duration, narr_time=((1.0, 10.0, 0.5),), section="whiteboard_intro"):
+    return {"key": key, "section": section, "start": start, "end": end, "duration": duration,
+            "narr_time": [list(use) for use in narr_time]}
+
+
+def timeline(*beats, frame_rate=30):
+    return {"frame_rate": frame_rate, "beats": list(beats)}
+
+
+@pytest.mark.parametrize("new, status", [
+    (3.0, "ok"),            # same clip length
+    (3.3, "retimed"),       # narr_time waits 3.8 s instead of 3.5 s, still inside the 4 s window
+    (4.02, "retimed"),      # over the window by less than one frame
+    (4.1, "overrun"),
+])
+def test_status(new, status):
+    (row,) = plan(timeline(beat("start", 10.0, 14.0, 3.0)), [new])
+    assert row["status"] == status
+    assert row == {"key": "start", "section": "whiteboard_intro", "start": 10.0, "window": 4.0,
+                   "old": 3.0, "new": new, "status": status}
+
+
+def test_waits_that_do_not_change_are_ok():
+    capped = beat("cap", 0.0, 3.0, 2.5, narr_time=[(1.0, 2.0, 0.0)])   # 2.5 s and 2.8 s both cap at 2 s
+    floored = beat("min", 3.0, 5.0, 0.4, narr_time=[(1.0, 5.0, 0.0)])  # 0.4 s and 0.6 s both wait 1 s
+    unused = beat("bare", 5.0, 8.0, 2.0, narr_time=[])                  # no narr_time wait on this beat
+    rows = plan(timeline(capped, floored, unused), [2.8, 0.6, 2.5])
+    assert [r["status"] for r in rows] == ["ok", "ok", "ok"]
+
+
+def test_any_changed_use_retimes_the_beat():
+    b = beat("start", 0.0, 6.0, 2.0, narr_time=[(1.0, 2.0, 0.0), (1.0, 10.0, 0.0)])
+    assert plan(timeline(b), [2.5])[0]["status"] == "retimed"
+
+
+def test_frame_slack_follows_the_frame_rate():
+    b = beat("start", 0.0, 4.0, 3.0)
+    assert plan(timeline(b, frame_rate=60), [4.02])[0]["status"] == "overrun"
+    assert plan({"beats": [b]}, [4.02])[0]["status"] == "retimed"  # 30 fps when unrecorded
+
+
+def test_rounding_and_missing_section():
+    b = beat("start", 1.0, 2.33333333, 1.0, narr_time=[])
+    del b["section"]
+    (row,) = plan(timeline(b), [1.123456])
+    assert row["window"] == 1.3333 and row["new"] == 1.1235 and row["section"] is None
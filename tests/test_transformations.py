@@ -0,0 +1,92 @@
+# TransformationSpec (helpers/transformations.py): the default PROBLEM must reproduce the
+# hand-written scene it replaced; other specs get the same treatment generated.
+import pytest
+
+import config
+from helpers.transformations import TransformationSpec, point_tex, say_num, tex_num
+
+# The step blocks, right column and VO lines of the hand-written scene for PROBLEM.
+BASELINE_STEPS = [
+    ("y_reflect", (1, -2), (-1, -2), r"x' = \frac{1}{-1} = -1", "Reflect across the $y$-axis", "(-1,-2)",
+     "First, reflect across the y axis. The x coordinate changes sign; y is unchanged."),
+    ("left_shift", (-1, -2), (-2, -2), r"x'' = -1 + (-1) = -2", "Translate left by $1$", "(-2,-2)",
+     "Next, translate one unit to the left. Only the x coordinate decreases by one."),
+    ("x_reflect", (-2, -2), (-2, 2), r"y' = (-1) \cdot (-2) = 2", "Reflect across the $x$-axis", "(-2,2)",
+     "Now, reflect across the x axis. The y coordinate changes sign; x is unchanged."),
+    ("up_shift", (-2, 2), (-2, 5), r"y'' = 2 + 3 = 5", "Translate up by $3$", "(-2,5)",
+     "Finally, translate upward by three units. Only the y coordinate increases by three."),
+]
+BASELINE_G_TOKENS = ["g(x)", "=", "-", "f(", "-x-1", ")", "+", "3"]
+BASELINE_VO = {
+    "announce_problem": (
+        "Now, the problem. We are given g of x equals negative f of minus x minus one, plus three, "
+        "and the point one, negative two lies on the graph of f. We will find its image under g."
+    ),
+    "start": "We begin at the point one, negative two on f.",
+    "wrap": "Collecting all steps, the resulting point is negative two, five.",
+    **{key: narration for key, *_, narration in BASELINE_STEPS},
+}
+
+
+@pytest.fixture
+def default_spec():
+    return TransformationSpec.from_dict(config.PROBLEM)
+
+
+def test_default_spec_reproduces_the_scene_steps(default_spec):
+    steps = default_spec.steps()
+    assert [(s.key, s.start, s.end, s.math, s.caption, s.label, s.narration) for s in steps] == BASELINE_STEPS
+    assert [s.is_last for s in steps] == [False, False, False, True]
+    assert default_spec.final_point() == (-2, 5)
+
+
+def test_default_spec_reproduces_tokens_and_narration(default_spec):
+    tokens, roles = default_spec.g_tokens()
+    assert tokens == BASELINE_G_TOKENS
+    assert roles == {"a": 2, "inner": 4, "c": 7}
+    assert default_spec.problem_tex() == r"(1,-2)\ \text{ on }f"
+    assert default_spec.narrations() == BASELINE_VO
+    assert {k: config.VO[k] for k in BASELINE_VO} == BASELINE_VO  # config.VO documents the same text
+
+
+def test_non_default_spec():
+    spec = TransformationSpec(a=2, k=0.5, d=3, c=-1, point=(1, 2))
+    steps = spec.steps()
+    assert [s.key for s in steps] == ["h_scale", "right_shift", "v_scale", "down_shift"]
+    assert [s.end for s in steps] == [(2, 2), (5, 2), (5, 4), (5, 3)]
+    assert spec.final_point() == (5, 3)
+    assert steps[0].math == r"x' = \frac{1}{\frac{1}{2}} = 2"
+    assert steps[0].caption == r"Scale $x$ by $\frac{1}{\frac{1}{2}}$"
+    assert steps[3].caption == "Translate down by $1$"
+    assert steps[1].narration == ("Next, translate three units to the right. "
+                                  "Only the x coordinate increases by three.")
+    assert steps[3].narration.startswith("Finally, translate downward by one unit.")
+    tokens, roles = spec.g_tokens()
+    assert tokens == ["g(x)", "=", "2", "f(", r"\frac{1}{2}x-\frac{3}{2}", ")", "-", "1"]
+    assert roles == {"a": 2, "inner": 4, "c": 7}
+    assert spec.narrations()["wrap"] == "Collecting all steps, the resulting point is five, three."
+    # Each stage's map agrees with its endpoints.
+    for s in steps:
+        assert s.apply(*s.start) == pytest.approx(s.end)
+
+
+def test_identity_terms_are_omitted():
+    spec = TransformationSpec(a=1, k=1, d=0, c=2, point=(0, 0))
+    assert [s.key for s in spec.steps()] == ["up_shift"]
+    assert spec.steps()[0].narration.startswith("First, ")
+    assert spec.g_tokens()[0] == ["g(x)", "=", "f(", "x", ")", "+", "2"]
+
+
+def test_round_trip_and_validation():
+    spec = TransformationSpec(a=-1, k=2, d=0, c=0, point=(4, 1), name="p 2")
+    assert TransformationSpec.from_dict(spec.to_dict()) == spec
+    assert spec.slug == "p_2"
+    with pytest.raises(ValueError):
+        TransformationSpec(a=1, k=0, d=0, c=0, point=(0, 0))
+
+
+def test_number_formatting():
+    assert tex_num(-0.5) == r"-\frac{1}{2}"
+    assert say_num(-2) == "negative two"
+    assert say_num(0.5) == "one half"
+    assert point_tex((1.0, -2.0)) == "(1,-2)"